@@ -0,0 +1,87 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+
+# Lines containing this marker (e.g. `# secrettrack:ignore`) are never reported
+IGNORE_MARKER = "secrettrack:ignore"
+
+
+def fingerprint(result: Dict[str, Any], root: Optional[Path] = None) -> str:
+    """Line-independent identity of a finding: type, pattern, file and secret.
+    
+    Unlike the result "hash", this survives edits that move the secret to
+    another line. Paths are made relative to root so a baseline can be
+    shared between checkouts.
+    """
+    path = result.get("file") or "unknown"
+    if root is not None:
+        try:
+            path = Path(path).relative_to(root).as_posix()
+        except ValueError:
+            pass
+    
+    hash_input = f"{result.get('type')}:{result.get('subtype')}:{path}:{result.get('secret')}"
+    return hashlib.sha256(hash_input.encode("utf-8", "surrogatepass")).hexdigest()[:16]
+
+
+class Baseline:
+    """Set of already-triaged finding fingerprints, loaded from a previous JSON report."""
+    
+    def __init__(self, fingerprints: Optional[set] = None):
+        self.fingerprints = set(fingerprints or ())
+        # Suppressed findings, kept so an updated baseline still contains them
+        self.suppressed: List[Dict[str, Any]] = []
+    
+    @classmethod
+    def load(cls, path: Path) -> "Baseline":
+        """Load fingerprints from a JSON report written with --json or --update-baseline."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                report = json.load(f)
+        except OSError as e:
+            raise ValueError(f"Cannot read baseline '{path}': {e.strerror}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Baseline '{path}' is not a JSON report: {e}")
+        
+        if not isinstance(report, dict) or not isinstance(report.get("findings"), list):
+            raise ValueError(f"Baseline '{path}' has no 'findings' list")
+        
+        fingerprints = set()
+        for finding in report["findings"]:
+            # Reports written before fingerprints existed only carry the line-based hash
+            key = finding.get("fingerprint") or finding.get("hash")
+            if key:
+                fingerprints.add(key)
+        return cls(fingerprints)
+    
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+    
+    def filter(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop results already in the baseline."""
+        new_results = []
+        for result in results:
+            if result["fingerprint"] in self.fingerprints or result["hash"] in self.fingerprints:
+                self.suppressed.append(result)
+            else:
+                new_results.append(result)
+        return new_results
+    
+    def write(self, path: Path, results: List[Dict[str, Any]]):
+        """Write a new baseline holding the given results and every suppressed one still present."""
+        from secrettrack.report.json import JSONReport
+        
+        findings = {}
+        for result in self.suppressed + results:
+            findings.setdefault(result["fingerprint"], result)
+        
+        # Sorted so that regenerating a baseline gives a readable diff
+        ordered = sorted(findings.values(), key=lambda r: (r["file"], r["line"], r["fingerprint"]))
+        report = JSONReport(ordered, metadata={"baseline": True}).generate()
+        tmp_path = Path(f"{path}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(report)
+        os.replace(tmp_path, path)
\ No newline at end of file
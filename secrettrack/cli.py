@@ -4,9 +4,8 @@ import os
 from pathlib import Path
 from typing import List, Optional
 
-from secrettrack.scanner.filesystem import FileSystemScanner
-from secrettrack.report.human import HumanReport
-from secrettrack.report.json import JSONReport
+# Scanner, detector and reporter modules are imported inside the commands
+# that need them to keep start-up fast (e.g. `--help`, `--json` runs).
 
 
 def main():
@@ -19,6 +18,13 @@ Examples:
   %(prog)s scan /path/to/project
   %(prog)s scan . --exclude "node_modules,*.log"
   %(prog)s scan . --json --severity critical,high
+  %(prog)s scan . --detectors aws,stripe
+  %(prog)s scan . --fail-fast-severity critical
+  %(prog)s watch . --exclude "node_modules,dist"
+  %(prog)s history /srv/mirrors/project.git --unreachable
+  %(prog)s scan . --json --shard 2/4 -o shard-2.json
+  %(prog)s merge shard-*.json -o report.json
+  %(prog)s scan-many repos.txt --output-dir results/ --history
         """,
     )
 
@@ -51,21 +57,553 @@ Examples:
         help="Comma-separated list of patterns to exclude",
     )
     scan_parser.add_argument(
+        "--detectors",
+        type=str,
+        help="Comma-separated list of detectors to run (default: all available)",
+    )
+    scan_parser.add_argument(
+        "--rules",
+        action="append",
+        metavar="PATH",
+        help="Load a YAML rule pack (or a directory of them) as extra detectors; repeatable",
+    )
+    scan_parser.add_argument(
+        "--regex-engine",
+        choices=["re", "re2", "auto"],
+        default="re",
+        help="Regex engine for detector patterns: re, re2 (linear time, needs google-re2) "
+        "or auto (re2 when installed)",
+    )
+    scan_parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first finding",
+    )
+    scan_parser.add_argument(
+        "--fail-fast-severity",
+        metavar="SEVERITY",
+        help="Stop at the first finding at or above SEVERITY (implies --fail-fast)",
+    )
+    scan_parser.add_argument(
+        "--max-findings",
+        type=int,
+        metavar="N",
+        help="Stop after N findings",
+    )
+    scan_parser.add_argument(
+        "--time-budget",
+        type=float,
+        metavar="SECONDS",
+        help="Scan the riskiest files first and stop cleanly after SECONDS",
+    )
+    scan_parser.add_argument(
+        "--readers",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Prefetch file contents with N reader threads (useful on slow or network filesystems)",
+    )
+    scan_parser.add_argument(
+        "--queue-depth",
+        type=int,
+        default=64,
+        metavar="N",
+        help="Maximum files queued between pipeline stages (with --readers)",
+    )
+    scan_parser.add_argument(
+        "--max-buffer-mb",
+        type=int,
+        default=64,
+        metavar="MB",
+        help="Maximum file content held in memory by the readers (with --readers)",
+    )
+    scan_parser.add_argument(
+        "--pipeline-stats",
+        action="store_true",
+        help="Print per-stage utilization of the --readers pipeline",
+    )
+    scan_parser.add_argument(
+        "--line-cache",
+        type=int,
+        default=65536,
+        metavar="N",
+        help="Remember pattern matches for up to N distinct lines (0 disables)",
+    )
+    scan_parser.add_argument(
+        "--content-cache",
+        type=int,
+        default=65536,
+        metavar="N",
+        help="Match byte-identical files once, remembering up to N distinct contents (0 disables)",
+    )
+    scan_parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="Print line cache hit-rate and eviction counters",
+    )
+    scan_parser.add_argument(
+        "--shard",
+        type=str,
+        metavar="I/N",
+        help="Only scan shard I of N (1-based), for splitting a scan across machines",
+    )
+    scan_parser.add_argument(
+        "--tracked-only",
+        action="store_true",
+        help="List files from the git index instead of walking the directory",
+    )
+    scan_parser.add_argument(
+        "--include-untracked",
+        action="store_true",
+        help="With --tracked-only, also scan untracked files that are not ignored",
+    )
+    scan_parser.add_argument(
+        "--state-file",
+        type=str,
+        metavar="PATH",
+        help="With --tracked-only, skip files unchanged since the scan that wrote PATH, then update it",
+    )
+    scan_parser.add_argument(
+        "--baseline",
+        type=str,
+        metavar="PATH",
+        help="Only report findings not in this baseline (a previous JSON report)",
+    )
+    scan_parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the current findings, including suppressed ones, back to --baseline",
+    )
+    scan_parser.add_argument(
+        "--metrics-file",
+        type=str,
+        metavar="PATH",
+        help="Write scan statistics to PATH in the Prometheus text format",
+    )
+    scan_parser.add_argument(
+        "--output",
+        "-o",
+        type=str,
+        help="Output file (default: stdout)",
+    )
+
+    # Watch command
+    watch_parser = subparsers.add_parser(
+        "watch", help="Scan a directory, then re-scan files as they change"
+    )
+    watch_parser.add_argument(
+        "path",
+        type=str,
+        help="Directory to watch",
+    )
+    watch_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output events as JSON lines",
+    )
+    watch_parser.add_argument(
+        "--severity",
+        type=str,
+        default="low,medium,high,critical",
+        help="Comma-separated list of severities to include (low,medium,high,critical)",
+    )
+    watch_parser.add_argument(
+        "--exclude",
+        type=str,
+        default="node_modules,.git,__pycache__,*.pyc,*.pyo,*.pyd,.DS_Store",
+        help="Comma-separated list of patterns to exclude",
+    )
+    watch_parser.add_argument(
+        "--detectors",
+        type=str,
+        help="Comma-separated list of detectors to run (default: all available)",
+    )
+    watch_parser.add_argument(
+        "--rules",
+        action="append",
+        metavar="PATH",
+        help="Load a YAML rule pack (or a directory of them) as extra detectors; repeatable",
+    )
+    watch_parser.add_argument(
+        "--regex-engine",
+        choices=["re", "re2", "auto"],
+        default="re",
+        help="Regex engine for detector patterns: re, re2 (linear time, needs google-re2) "
+        "or auto (re2 when installed)",
+    )
+    watch_parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.5,
+        help="Seconds without events before a burst of changes is re-scanned",
+    )
+    watch_parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="Use mtime polling instead of inotify",
+    )
+
+    # History command
+    history_parser = subparsers.add_parser(
+        "history", help="Scan the git history of a repository (work tree or bare)"
+    )
+    history_parser.add_argument(
+        "path",
+        type=str,
+        help="Repository to scan",
+    )
+    history_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output results in JSON format",
+    )
+    history_parser.add_argument(
+        "--severity",
+        type=str,
+        default="low,medium,high,critical",
+        help="Comma-separated list of severities to include (low,medium,high,critical)",
+    )
+    history_parser.add_argument(
+        "--detectors",
+        type=str,
+        help="Comma-separated list of detectors to run (default: all available)",
+    )
+    history_parser.add_argument(
+        "--rules",
+        action="append",
+        metavar="PATH",
+        help="Load a YAML rule pack (or a directory of them) as extra detectors; repeatable",
+    )
+    history_parser.add_argument(
+        "--regex-engine",
+        choices=["re", "re2", "auto"],
+        default="re",
+        help="Regex engine for detector patterns: re, re2 (linear time, needs google-re2) "
+        "or auto (re2 when installed)",
+    )
+    history_parser.add_argument(
+        "--backend",
+        choices=["objects", "git"],
+        default="objects",
+        help="'objects' reads every ref from the object database directly, "
+             "'git' walks `git log` from HEAD (default: objects)",
+    )
+    history_parser.add_argument(
+        "--unreachable",
+        action="store_true",
+        help="Also scan dangling objects not referenced by any ref (objects backend)",
+    )
+    history_parser.add_argument(
+        "--shard",
+        type=str,
+        metavar="I/N",
+        help="Only scan shard I of N (1-based), for splitting a scan across machines",
+    )
+    history_parser.add_argument(
+        "--baseline",
+        type=str,
+        metavar="PATH",
+        help="Only report findings not in this baseline (a previous JSON report)",
+    )
+    history_parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the current findings, including suppressed ones, back to --baseline",
+    )
+    history_parser.add_argument(
+        "--metrics-file",
+        type=str,
+        metavar="PATH",
+        help="Write scan statistics to PATH in the Prometheus text format",
+    )
+    history_parser.add_argument(
         "--output",
         "-o",
         type=str,
         help="Output file (default: stdout)",
     )
 
+    # Merge command
+    merge_parser = subparsers.add_parser(
+        "merge", help="Merge JSON reports (e.g. from --shard runs) into one"
+    )
+    merge_parser.add_argument(
+        "reports",
+        nargs="+",
+        type=str,
+        help="JSON report files to merge",
+    )
+    merge_parser.add_argument(
+        "--output",
+        "-o",
+        type=str,
+        help="Output file (default: stdout)",
+    )
+
+    # Scan-many command
+    many_parser = subparsers.add_parser(
+        "scan-many", help="Scan the repositories listed in a manifest on a shared worker pool"
+    )
+    many_parser.add_argument(
+        "manifest",
+        type=str,
+        help="File with one local repository path per line",
+    )
+    many_parser.add_argument(
+        "--output-dir",
+        "-o",
+        type=str,
+        required=True,
+        help="Directory for per-repository reports, summary.json and progress",
+    )
+    many_parser.add_argument(
+        "--history",
+        action="store_true",
+        help="Also scan the git history of each repository, every ref as with `history`; "
+             "required for bare repositories",
+    )
+    many_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Number of worker processes (default: CPU count)",
+    )
+    many_parser.add_argument(
+        "--severity",
+        type=str,
+        default="low,medium,high,critical",
+        help="Comma-separated list of severities to include (low,medium,high,critical)",
+    )
+    many_parser.add_argument(
+        "--exclude",
+        type=str,
+        default="node_modules,.git,__pycache__,*.pyc,*.pyo,*.pyd,.DS_Store",
+        help="Comma-separated list of patterns to exclude",
+    )
+    many_parser.add_argument(
+        "--detectors",
+        type=str,
+        help="Comma-separated list of detectors to run (default: all available)",
+    )
+    many_parser.add_argument(
+        "--rules",
+        action="append",
+        metavar="PATH",
+        help="Load a YAML rule pack (or a directory of them) as extra detectors; repeatable",
+    )
+    many_parser.add_argument(
+        "--regex-engine",
+        choices=["re", "re2", "auto"],
+        default="re",
+        help="Regex engine for detector patterns: re, re2 (linear time, needs google-re2) "
+        "or auto (re2 when installed)",
+    )
+
+    # Detectors command
+    detectors_parser = subparsers.add_parser(
+        "detectors", help="List available detectors"
+    )
+    detectors_parser.add_argument(
+        "--rules",
+        action="append",
+        metavar="PATH",
+        help="Also list the rule packs at PATH",
+    )
+
     args = parser.parse_args()
+    
+    if getattr(args, "regex_engine", "re") != "re":
+        select_regex_engine(args.regex_engine)
+    if getattr(args, "rules", None):
+        load_rules(args.rules)
 
     if args.command == "scan":
         run_scan(args)
+    elif args.command == "watch":
+        run_watch(args)
+    elif args.command == "history":
+        run_history(args)
+    elif args.command == "merge":
+        run_merge(args)
+    elif args.command == "scan-many":
+        run_scan_many(args)
+    elif args.command == "detectors":
+        run_list_detectors(args)
     else:
         parser.print_help()
         sys.exit(1)
 
 
+def parse_detector_names(value: Optional[str]) -> Optional[List[str]]:
+    """Parse the --detectors option into a list of names."""
+    if not value:
+        return None
+    names = [name.strip().lower() for name in value.split(",") if name.strip()]
+    return names or None
+
+
+def parse_fail_fast(args) -> Optional[str]:
+    """Lowest severity that stops the scan, from --fail-fast and --fail-fast-severity."""
+    if args.fail_fast_severity:
+        return args.fail_fast_severity.strip().lower()
+    return "low" if args.fail_fast else None
+
+
+def parse_shard(value: Optional[str]):
+    """Parse the --shard option, exiting on an invalid value."""
+    if not value:
+        return None
+    from secrettrack.scanner.shard import Shard
+
+    try:
+        return Shard.parse(value)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+def create_filesystem_scanner(args, exclude_patterns: List[str], limits=None):
+    """Create a FileSystemScanner, exiting on an unknown detector name."""
+    from secrettrack.scanner.filesystem import FileSystemScanner
+
+    try:
+        return FileSystemScanner(
+            exclude_patterns=exclude_patterns,
+            detector_names=parse_detector_names(args.detectors),
+            limits=limits,
+            readers=getattr(args, "readers", 0),
+            queue_depth=getattr(args, "queue_depth", 64),
+            max_buffered_bytes=getattr(args, "max_buffer_mb", 64) * 1024 * 1024,
+            line_cache_size=getattr(args, "line_cache", 65536),
+            content_cache_size=getattr(args, "content_cache", 65536),
+            shard=parse_shard(getattr(args, "shard", None)),
+            baseline=load_baseline(args),
+            tracked_only=getattr(args, "tracked_only", False),
+            include_untracked=getattr(args, "include_untracked", False),
+            scan_state=load_scan_state(args),
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+def load_scan_state(args):
+    """Load the --state-file used to skip unchanged tracked files."""
+    state_path = getattr(args, "state_file", None)
+    if not state_path:
+        return None
+    if not getattr(args, "tracked_only", False):
+        print("Error: --state-file requires --tracked-only")
+        sys.exit(1)
+    from secrettrack.scanner.git_index import ScanState
+
+    try:
+        return ScanState.load(Path(state_path), scan_state_settings(args))
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+def scan_state_settings(args) -> str:
+    """Digest of the options that decide whether an unchanged file has findings."""
+    from secrettrack.detectors.registry import available_detectors
+    from secrettrack.scanner.settings import file_digest, rule_pack_digests, settings_digest
+
+    baseline_path = getattr(args, "baseline", None)
+    return settings_digest({
+        "detectors": sorted(parse_detector_names(args.detectors) or available_detectors()),
+        "rules": rule_pack_digests(args.rules or []),
+        "severities": sorted(s.strip().lower() for s in args.severity.split(",")),
+        "regex_engine": args.regex_engine,
+        "baseline": file_digest(Path(baseline_path)) if baseline_path else None,
+    })
+
+
+def load_baseline(args):
+    """Load the --baseline file, exiting if it is unreadable."""
+    baseline_path = getattr(args, "baseline", None)
+    update = getattr(args, "update_baseline", False)
+    if update and not baseline_path:
+        print("Error: --update-baseline requires --baseline PATH")
+        sys.exit(1)
+    if update and getattr(args, "shard", None):
+        print("Error: --update-baseline cannot be combined with --shard")
+        sys.exit(1)
+    if update:
+        # Findings outside a partial selection are never evaluated, so they would drop out
+        from secrettrack.detectors.base import SEVERITY_LEVELS
+
+        severities = {s.strip().lower() for s in args.severity.split(",")}
+        if args.detectors or not severities >= set(SEVERITY_LEVELS):
+            print("Error: --update-baseline needs every detector and severity "
+                  "(drop --detectors and --severity)")
+            sys.exit(1)
+        if getattr(args, "state_file", None):
+            print("Error: --update-baseline cannot be combined with --state-file")
+            sys.exit(1)
+    if not baseline_path:
+        return None
+    from secrettrack.analyzer.baseline import Baseline
+
+    # A missing baseline is created by --update-baseline
+    if update and not os.path.exists(baseline_path):
+        return Baseline()
+    try:
+        return Baseline.load(Path(baseline_path))
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+def update_baseline(args, scanner, results, complete: bool):
+    """Write the --update-baseline file after a scan."""
+    if not complete:
+        print("⚠️  Scan stopped early, baseline not updated")
+        return
+    scanner.baseline.write(Path(args.baseline), results)
+    print(f"📌 Baseline updated: {args.baseline}")
+
+
+def write_metrics(stats, path: str):
+    """Write scan statistics as a Prometheus text-format file."""
+    # Write then rename, so a node_exporter textfile collector never reads a partial file
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(stats.to_prometheus())
+    os.replace(tmp_path, path)
+    print(f"📈 Metrics written to {path}")
+
+
+def load_rules(paths: List[str]):
+    """Register YAML rule packs as detectors, exiting on an invalid pack."""
+    from secrettrack.detectors.registry import load_rule_packs
+
+    try:
+        load_rule_packs([Path(p) for p in paths])
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+def select_regex_engine(engine: str):
+    """Select the regex engine detectors compile with, exiting if it is unavailable."""
+    from secrettrack.detectors.engine import set_regex_engine
+
+    try:
+        set_regex_engine(engine)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+def run_list_detectors(args):
+    """Run the detectors command."""
+    from secrettrack.detectors.registry import available_detectors
+
+    for name in available_detectors():
+        print(name)
+
+
 def run_scan(args):
     """Run the scan command."""
     # Convert path to absolute
@@ -81,22 +619,102 @@ def run_scan(args):
     # Parse exclude patterns
     exclude_patterns = [p.strip() for p in args.exclude.split(",")]
     
+    # Severity filter and stop conditions are applied inside the scan loop
+    from secrettrack.scanner.limits import ScanLimits
+    
+    try:
+        limits = ScanLimits(
+            severities=severity_filter,
+            fail_fast=parse_fail_fast(args),
+            max_findings=args.max_findings,
+            time_budget=args.time_budget,
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    if args.include_untracked and not args.tracked_only:
+        print("Error: --include-untracked requires --tracked-only")
+        sys.exit(1)
+    if args.tracked_only and scan_path.is_dir():
+        from secrettrack.scanner.git_index import find_work_tree
+        
+        if find_work_tree(scan_path) is None:
+            print(f"Error: '{args.path}' is not inside a git work tree (needed for --tracked-only)")
+            sys.exit(1)
+    
     # Initialize scanner
-    scanner = FileSystemScanner(exclude_patterns=exclude_patterns)
+    scanner = create_filesystem_scanner(args, exclude_patterns, limits)
     
     print(f"🔍 Scanning {scan_path}...")
-    results = scanner.scan(scan_path)
+    filtered_results = scanner.scan(scan_path)
+    
+    scan_info = {"scan_complete": not limits.exhausted}
+    if scanner.shard:
+        scan_info["shard"] = str(scanner.shard)
+    if limits.exhausted:
+        scan_info["stop_reason"] = limits.stop_reason
+        print(f"⏹️  Scan stopped early ({limits.stop_reason}), report is partial")
+    
+    if scanner.coverage:
+        coverage = scanner.coverage
+        scan_info["coverage"] = coverage
+        print(f"🧭 Covered {coverage['files_scanned']}/{coverage['files_total']} files "
+              f"({coverage['ratio']:.0%} of bytes), highest risk first")
+        if not coverage["enumeration_complete"]:
+            print("   Listing the tree used half the time budget, files not yet listed were skipped")
+        if coverage["unscanned"]:
+            print("   Not scanned: " + ", ".join(
+                f"{name} ({count})" for name, count in list(coverage["unscanned"].items())[:10]
+            ))
+    
+    cache_stats = scanner.line_cache.stats()
+    scan_info["line_cache"] = cache_stats
+    if args.cache_stats:
+        print(f"🧠 Line cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+              f"({cache_stats['hit_rate']:.1%} hit rate), {cache_stats['evictions']} evictions, "
+              f"{cache_stats['entries']}/{cache_stats['max_entries']} entries")
+        content_stats = scanner.content_cache.stats()
+        print(f"🧠 Content cache: {content_stats['hits']} duplicate file(s) not re-matched, "
+              f"{content_stats['misses']} distinct, {content_stats['evictions']} evictions")
+    
+    if scanner.pipeline:
+        pipeline_stats = scanner.pipeline.stats_dict()
+        scan_info["pipeline"] = pipeline_stats
+        if args.pipeline_stats:
+            print(f"⏱️  Pipeline ({pipeline_stats['wall_seconds']}s):")
+            for name, stage in pipeline_stats["stages"].items():
+                print(f"  {name:<6} utilization {stage['utilization']:.0%} "
+                      f"({stage['threads']} thread(s), {stage['items']} files, "
+                      f"waiting on input {stage['waiting_input_seconds']}s, "
+                      f"on output {stage['waiting_output_seconds']}s)")
+    
+    if scanner.baseline is not None:
+        scan_info["baseline_suppressed"] = len(scanner.baseline.suppressed)
+        print(f"📌 {len(scanner.baseline.suppressed)} known finding(s) suppressed by the baseline")
+        if args.update_baseline:
+            update_baseline(args, scanner, filtered_results, not limits.exhausted)
     
-    # Filter by severity
-    filtered_results = [
-        r for r in results 
-        if r.get("severity", "low").lower() in severity_filter
-    ]
+    if scanner.scan_state is not None:
+        # Only fully scanned files are recorded, so a partial scan can still save its state
+        scanner.scan_state.save(Path(args.state_file))
+        unchanged = scanner.stats.files_skipped.get("unchanged", 0)
+        scan_info["unchanged_skipped"] = unchanged
+        print(f"🗂️  {unchanged} unchanged file(s) skipped, state saved to {args.state_file}")
+    
+    scan_info["stats"] = scanner.stats.to_dict()
+    if args.regex_engine != "re":
+        from secrettrack.detectors.engine import get_pattern_compiler
+        scan_info["regex_engine"] = get_pattern_compiler().info()
+    if args.metrics_file:
+        write_metrics(scanner.stats, args.metrics_file)
     
     # Generate report
     if args.json:
-        report = JSONReport(filtered_results).generate()
+        from secrettrack.report.json import JSONReport
+        report = JSONReport(filtered_results, metadata=scan_info).generate()
     else:
+        from secrettrack.report.human import HumanReport
         report = HumanReport(filtered_results).generate()
     
     # Output results
@@ -118,5 +736,209 @@ def run_scan(args):
         sys.exit(0)
 
 
+def run_history(args):
+    """Run the history command."""
+    from secrettrack.scanner.git_history import GitHistoryScanner
+    from secrettrack.scanner.limits import ScanLimits
+    
+    repo_path = Path(args.path).absolute()
+    
+    try:
+        scanner = GitHistoryScanner(
+            detector_names=parse_detector_names(args.detectors),
+            limits=ScanLimits(severities=[s.strip().lower() for s in args.severity.split(",")]),
+            backend=args.backend,
+            include_unreachable=args.unreachable,
+            shard=parse_shard(args.shard),
+            baseline=load_baseline(args),
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    if not scanner._is_git_repo(repo_path):
+        print(f"Error: '{args.path}' is not a git repository")
+        sys.exit(1)
+    
+    print(f"🔍 Scanning history of {repo_path}...")
+    results = scanner.scan(repo_path)
+    
+    if scanner.baseline is not None:
+        print(f"📌 {len(scanner.baseline.suppressed)} known finding(s) suppressed by the baseline")
+        if args.update_baseline:
+            update_baseline(args, scanner, results, True)
+    
+    if args.metrics_file:
+        write_metrics(scanner.stats, args.metrics_file)
+    
+    if args.json:
+        from secrettrack.report.json import JSONReport
+        scan_info = {"shard": str(scanner.shard)} if scanner.shard else {}
+        scan_info["stats"] = scanner.stats.to_dict()
+        if args.regex_engine != "re":
+            from secrettrack.detectors.engine import get_pattern_compiler
+            scan_info["regex_engine"] = get_pattern_compiler().info()
+        report = JSONReport(results, metadata=scan_info).generate()
+    else:
+        from secrettrack.report.human import HumanReport
+        report = HumanReport(results).generate()
+    
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+        print(f"📄 Report saved to {args.output}")
+    else:
+        print(report)
+    
+    if any(r.get("severity") == "critical" for r in results):
+        sys.exit(2)
+    elif results:
+        sys.exit(1)
+    sys.exit(0)
+
+
+def run_merge(args):
+    """Run the merge command."""
+    import json
+    from secrettrack.report.json import JSONReport
+    
+    reports = []
+    for report_path in args.reports:
+        try:
+            with open(report_path, "r", encoding="utf-8") as f:
+                reports.append(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot read report '{report_path}': {e}")
+            sys.exit(1)
+    
+    try:
+        report = JSONReport.merge(reports, names=list(args.reports))
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+        print(f"📄 Merged report saved to {args.output}")
+    else:
+        print(report)
+    
+    summary = json.loads(report)["summary"]
+    if summary["critical"]:
+        sys.exit(2)
+    elif summary["total_findings"]:
+        sys.exit(1)
+    sys.exit(0)
+
+
+def run_scan_many(args):
+    """Run the scan-many command."""
+    from secrettrack.scanner.batch import BatchScanner, read_manifest
+    
+    manifest_path = Path(args.manifest)
+    if not manifest_path.is_file():
+        print(f"Error: Manifest '{args.manifest}' does not exist")
+        sys.exit(1)
+    
+    repos = read_manifest(manifest_path)
+    output_dir = Path(args.output_dir).absolute()
+    
+    try:
+        scanner = BatchScanner(
+            exclude_patterns=[p.strip() for p in args.exclude.split(",")],
+            detector_names=parse_detector_names(args.detectors),
+            severities=[s.strip().lower() for s in args.severity.split(",")],
+            workers=args.jobs,
+            include_history=args.history,
+            rule_paths=args.rules,
+            regex_engine=args.regex_engine,
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    done = len(scanner.load_progress(output_dir)) if output_dir.exists() else 0
+    print(f"🔍 Scanning {len(repos)} repositories ({done} already done)...")
+    
+    def report_progress(record):
+        status = "❌" if record["status"] != "done" else ("⚠️" if record["total_findings"] else "✅")
+        print(f"{status} {record['repository']}: {record['total_findings']} findings"
+              + (f" ({record['error']})" if record.get("error") else ""), flush=True)
+    
+    try:
+        summary = scanner.scan(repos, output_dir, callback=report_progress)
+    except KeyboardInterrupt:
+        print("\n⏹️  Interrupted, re-run the same command to resume")
+        sys.exit(3)
+    
+    print(f"📄 Summary saved to {output_dir / scanner.SUMMARY_FILE}")
+    print(f"  Repositories: {summary['repositories']} ({summary['failed']} failed)")
+    print(f"  Total findings: {summary['total_findings']} "
+          f"(critical: {summary['critical']}, high: {summary['high']}, "
+          f"medium: {summary['medium']}, low: {summary['low']})")
+    
+    if summary["failed"]:
+        sys.exit(3)
+    elif summary["critical"]:
+        sys.exit(2)
+    elif summary["total_findings"]:
+        sys.exit(1)
+    sys.exit(0)
+
+
+def run_watch(args):
+    """Run the watch command."""
+    import json
+    from secrettrack.scanner.watch import WatchScanner
+    from secrettrack.report.json import JSONReport
+
+    watch_path = Path(args.path).absolute()
+
+    if not watch_path.is_dir():
+        print(f"Error: Path '{args.path}' is not a directory")
+        sys.exit(1)
+
+    severity_filter = [s.strip().lower() for s in args.severity.split(",")]
+    exclude_patterns = [p.strip() for p in args.exclude.split(",")]
+
+    scanner = create_filesystem_scanner(args, exclude_patterns)
+    watcher = WatchScanner(
+        scanner,
+        debounce=args.debounce,
+        use_inotify=False if args.poll else None,
+    )
+
+    def selected(results):
+        return [r for r in results if r.get("severity", "low").lower() in severity_filter]
+
+    def emit(new_findings, resolved_findings):
+        new_findings = selected(new_findings)
+        resolved_findings = selected(resolved_findings)
+        if args.json:
+            for event, results in (("new", new_findings), ("resolved", resolved_findings)):
+                for finding in JSONReport(results).safe_findings():
+                    print(json.dumps({"event": event, "finding": finding}), flush=True)
+            return
+        for result in new_findings:
+            print(f"➕ NEW {result['severity'].upper()} {result['type']}:"
+                  f"{result.get('subtype', 'unknown')} at {result['file']}:{result['line']}",
+                  flush=True)
+        for result in resolved_findings:
+            print(f"✔️  RESOLVED {result['type']}:{result.get('subtype', 'unknown')} "
+                  f"at {result['file']}:{result['line']}", flush=True)
+
+    if not args.json:
+        print(f"🔍 Scanning {watch_path}...")
+    emit(watcher.initial_scan(watch_path), [])
+    if not args.json:
+        print(f"👀 Watching {watch_path} for changes (Ctrl+C to stop)...")
+
+    try:
+        watcher.watch(watch_path, emit)
+    except KeyboardInterrupt:
+        sys.exit(0)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,19 +1,28 @@
 """
 Detectors module for identifying specific types of secrets.
+
+Detector classes are imported on first access so that selecting a subset
+of detectors does not pay for importing and compiling the others.
 """
 
-from .base import BaseDetector
-from .aws import AWSDetector
-from .github import GitHubDetector
-from .stripe import StripeDetector
-from .firebase import FirebaseDetector
-from .generic import GenericDetector
+import importlib
+
+_EXPORTS = {
+    "BaseDetector": ".base",
+    "AWSDetector": ".aws",
+    "GitHubDetector": ".github",
+    "StripeDetector": ".stripe",
+    "FirebaseDetector": ".firebase",
+    "GenericDetector": ".generic",
+    "DetectorRegistry": ".registry",
+    "load_detectors": ".registry",
+    "available_detectors": ".registry",
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    "BaseDetector",
-    "AWSDetector",
-    "GitHubDetector",
-    "StripeDetector",
-    "FirebaseDetector",
-    "GenericDetector",
-]
\ No newline at end of file
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
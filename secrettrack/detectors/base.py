@@ -1,11 +1,16 @@
 import re
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Pattern
+from typing import List, Dict, Any, Optional, Pattern, Tuple
 import hashlib
 
 from secrettrack.analyzer.context import ContextAnalyzer
 from secrettrack.analyzer.confidence import ConfidenceAnalyzer
+from secrettrack.detectors.engine import get_pattern_compiler
+
+
+# Severity levels, from least to most severe
+SEVERITY_LEVELS = ["low", "medium", "high", "critical"]
 
 
 class BaseDetector(ABC):
@@ -14,62 +19,130 @@ class BaseDetector(ABC):
     def __init__(self):
         self.context_analyzer = ContextAnalyzer()
         self.confidence_analyzer = ConfidenceAnalyzer()
-        self.patterns = self._get_patterns()
+        # Patterns are declared with `re` and recompiled if another engine is selected
+        self.patterns = get_pattern_compiler().adopt_patterns(self._get_patterns())
+        self.block_patterns = self._get_block_patterns()
+        self.severities = set(SEVERITY_LEVELS)
     
     @abstractmethod
     def _get_patterns(self) -> List[Dict[str, Any]]:
         """Return list of patterns to search for."""
         pass
     
+    def _get_block_patterns(self) -> List[Dict[str, Any]]:
+        """Return the multi-line blocks to report: {"name", "labels"} with a set of PEM labels.
+        
+        An optional "context" only claims blocks whose BEGIN line contains it.
+        Blocks are matched across lines by the scanners (see detectors.blocks),
+        not by find_matches.
+        """
+        return []
+    
     @abstractmethod
     def get_secret_type(self) -> str:
         """Return the type of secret this detector finds."""
         pass
     
+    def restrict_severities(self, severities) -> None:
+        """Only report the given severities and drop patterns that can't produce them.
+        
+        A pattern may declare a "max_severity" when its matches can never
+        reach the confidence needed for higher severities.
+        """
+        self.severities = set(severities)
+        lowest = min(SEVERITY_LEVELS.index(s) for s in self.severities)
+        self.patterns = [
+            p for p in self.patterns
+            if SEVERITY_LEVELS.index(p.get("max_severity", "critical")) >= lowest
+        ]
+        self.block_patterns = [
+            p for p in self.block_patterns
+            if SEVERITY_LEVELS.index(p.get("max_severity", "critical")) >= lowest
+        ]
+    
+    def _cap_severity(self, severity: str, pattern_info: Dict[str, Any]) -> str:
+        """Clamp a severity to the pattern's declared minimum and maximum."""
+        max_severity = pattern_info.get("max_severity")
+        if max_severity and SEVERITY_LEVELS.index(severity) > SEVERITY_LEVELS.index(max_severity):
+            return max_severity
+        min_severity = pattern_info.get("min_severity")
+        if min_severity and SEVERITY_LEVELS.index(severity) < SEVERITY_LEVELS.index(min_severity):
+            return min_severity
+        return severity
+    
     def scan_line(self, line: str, line_num: int, filepath: Optional[Path], 
                   commit_hash: Optional[str] = None) -> List[Dict[str, Any]]:
         """Scan a line of text for secrets."""
-        results = []
+        matches = self.find_matches(line)
+        if not matches:
+            return []
+        return self.build_results(matches, line, line_num, filepath, commit_hash)
+    
+    def find_matches(self, line: str) -> List[Tuple[Dict[str, Any], str]]:
+        """Return the raw (pattern_info, matched text) pairs for a line.
         
+        This only depends on the line text, so callers may cache it.
+        """
+        matches = []
         for pattern_info in self.patterns:
-            pattern = pattern_info["pattern"]
-            matches = pattern.finditer(line)
+            for match in pattern_info["pattern"].finditer(line):
+                matches.append((pattern_info, match.group()))
+        return matches
+    
+    def build_results(self, matches: List[Tuple[Dict[str, Any], str]], line: str,
+                      line_num: int, filepath: Optional[Path],
+                      commit_hash: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Score raw matches for a location and turn them into results."""
+        results = []
+        
+        for pattern_info, secret in matches:
+            # Calculate confidence
+            confidence = self.confidence_analyzer.calculate_confidence(
+                secret, 
+                line, 
+                filepath
+            )
+            
+            if confidence < 0.3:  # Too low confidence, likely false positive
+                continue
+            
+            # Skip the context analysis when no environment could yield a selected severity
+            if len(self.severities) < len(SEVERITY_LEVELS) and not any(
+                self._cap_severity(self._calculate_severity(confidence, {"environment": env}),
+                                   pattern_info) in self.severities
+                for env in ("production", "staging")
+            ):
+                continue
+            
+            # Analyze context
+            context = self.context_analyzer.analyze(line, filepath)
+            severity = self._cap_severity(
+                self._calculate_severity(confidence, context), pattern_info
+            )
+            if severity not in self.severities:
+                continue
+            
+            # Create result
+            result = {
+                "type": self.get_secret_type(),
+                "subtype": pattern_info.get("name", "unknown"),
+                "secret": secret,
+                "line": line_num,
+                "file": str(filepath) if filepath else "unknown",
+                "context": line.strip(),
+                "severity": severity,
+                "confidence": confidence,
+                "environment": context["environment"],
+                "risk": pattern_info.get("risk") or self._get_risk_description(),
+                "recommendation": pattern_info.get("recommendation") or self._get_recommendation(),
+                "commit_hash": commit_hash,
+                "pattern_name": pattern_info.get("name", "unknown"),
+            }
+            
+            # Add hash for deduplication
+            result["hash"] = self._calculate_result_hash(result)
             
-            for match in matches:
-                # Calculate confidence
-                confidence = self.confidence_analyzer.calculate_confidence(
-                    match.group(), 
-                    line, 
-                    filepath
-                )
-                
-                if confidence < 0.3:  # Too low confidence, likely false positive
-                    continue
-                
-                # Analyze context
-                context = self.context_analyzer.analyze(line, filepath)
-                
-                # Create result
-                result = {
-                    "type": self.get_secret_type(),
-                    "subtype": pattern_info.get("name", "unknown"),
-                    "secret": match.group(),
-                    "line": line_num,
-                    "file": str(filepath) if filepath else "unknown",
-                    "context": line.strip(),
-                    "severity": self._calculate_severity(confidence, context),
-                    "confidence": confidence,
-                    "environment": context["environment"],
-                    "risk": self._get_risk_description(),
-                    "recommendation": self._get_recommendation(),
-                    "commit_hash": commit_hash,
-                    "pattern_name": pattern_info.get("name", "unknown"),
-                }
-                
-                # Add hash for deduplication
-                result["hash"] = self._calculate_result_hash(result)
-                
-                results.append(result)
+            results.append(result)
         
         return results
     
@@ -0,0 +1,144 @@
+import hashlib
+import re
+from typing import List, Dict, Any, Optional, Tuple, NamedTuple
+
+from .base import BaseDetector
+
+
+# PEM armor lines; the label is bounded so a stray run of dashes stays cheap
+BEGIN_RE = re.compile(r"-----BEGIN ([A-Z0-9 ]{1,64})-----")
+END_RE = re.compile(r"-----END ([A-Z0-9 ]{1,64})-----")
+
+# Keys embedded in JSON or code strings carry escaped line breaks
+ESCAPED_NEWLINE_RE = re.compile(r"\\r\\n|\\n|\\r")
+
+# What a piece of block body may be: base64 data, or an RFC 1421 header
+# such as "Proc-Type: 4,ENCRYPTED" in legacy encrypted keys
+BASE64_RE = re.compile(r"[A-Za-z0-9+/=]*")
+HEADER_RE = re.compile(r"[A-Za-z][A-Za-z-]*: *\S.*")
+
+# Quotes and operators around the lines of a key split across string literals
+WRAPPER_CHARS = "\"'`,;+()\\"
+
+
+class BlockMatch(NamedTuple):
+    """A complete block found in a line stream."""
+    start_line: int
+    end_line: int
+    line: str
+    detector: BaseDetector
+    pattern_info: Dict[str, Any]
+    secret: str
+
+
+class BlockStream:
+    """Tracks the open BEGIN marker of one file while its lines are fed in order.
+    
+    Only the label, start line and a running hash of the body are kept,
+    so memory stays constant however long the block is.
+    """
+    
+    def __init__(self, labels: Dict[str, List[Tuple[BaseDetector, Dict[str, Any]]]]):
+        self.labels = labels
+        self.label: Optional[str] = None
+        self._start_line = 0
+        self._line = ""
+        self._body = None
+        self._body_chars = 0
+    
+    @property
+    def in_block(self) -> bool:
+        return self.label is not None
+    
+    def feed(self, line: str, line_num: int) -> List[BlockMatch]:
+        """Consume the next line and return the blocks it completes."""
+        blocks = []
+        pos = 0
+        while True:
+            if self.label is None:
+                begin = BEGIN_RE.search(line, pos)
+                if begin is None:
+                    break
+                pos = begin.end()
+                if begin.group(1) in self.labels:
+                    self._open(begin.group(1), line, line_num)
+                continue
+            
+            end = END_RE.search(line, pos)
+            body_end = end.start() if end else len(line)
+            if not self._consume(line[pos:body_end]):
+                # Not key material (e.g. "..." in documentation): drop the block
+                self.label = None
+                continue
+            if end is None:
+                break
+            
+            pos = end.end()
+            owner = self._owner() if end.group(1) == self.label and self._body_chars else None
+            if owner:
+                blocks.append(BlockMatch(
+                    self._start_line, line_num, self._line, owner[0], owner[1], self._secret(),
+                ))
+            self.label = None
+        
+        return blocks
+    
+    def _open(self, label: str, line: str, line_num: int):
+        self.label = label
+        self._start_line = line_num
+        self._line = line
+        self._body = hashlib.sha256()
+        self._body_chars = 0
+    
+    def _owner(self) -> Optional[Tuple[BaseDetector, Dict[str, Any]]]:
+        # Patterns with a context marker are listed first, so they win over the plain ones
+        for detector, pattern_info in self.labels[self.label]:
+            if pattern_info.get("context", "") in self._line:
+                return detector, pattern_info
+        return None
+    
+    def _consume(self, text: str) -> bool:
+        """Hash a stretch of block body; False if it cannot be part of a key."""
+        for piece in ESCAPED_NEWLINE_RE.split(text):
+            piece = piece.strip().strip(WRAPPER_CHARS).strip()
+            if not piece:
+                continue
+            if HEADER_RE.fullmatch(piece):
+                self._body.update(piece.encode("utf-8", "surrogatepass") + b"\n")
+                continue
+            data = "".join(piece.split())
+            if not BASE64_RE.fullmatch(data):
+                return False
+            self._body.update(data.encode("ascii"))
+            self._body_chars += len(data)
+        return True
+    
+    def _secret(self) -> str:
+        # The armor plus a digest of the body identifies the key without keeping it
+        return (f"-----BEGIN {self.label}-----{self._body.hexdigest()[:32]}"
+                f"-----END {self.label}-----")
+
+
+class BlockMatcher:
+    """Finds multi-line blocks (PEM private keys) declared by the selected detectors.
+    
+    Detectors list the PEM labels they report in `_get_block_patterns()`.
+    Each block is reported once: by a pattern whose "context" marker is
+    on the BEGIN line if there is one, otherwise by the first detector
+    declaring the label without a context. A "fallback" pattern only
+    claims a block when no other selected detector declares its label.
+    """
+    
+    def __init__(self, detectors: List[BaseDetector]):
+        self.labels: Dict[str, List[Tuple[BaseDetector, Dict[str, Any]]]] = {}
+        for detector in detectors:
+            for pattern_info in detector.block_patterns:
+                for label in pattern_info["labels"]:
+                    self.labels.setdefault(label, []).append((detector, pattern_info))
+        for candidates in self.labels.values():
+            candidates.sort(key=lambda candidate: ("context" not in candidate[1],
+                                                   bool(candidate[1].get("fallback"))))
+    
+    def stream(self) -> Optional[BlockStream]:
+        """Start matching a new file, or None if no detector declares blocks."""
+        return BlockStream(self.labels) if self.labels else None
\ No newline at end of file
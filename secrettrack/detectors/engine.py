@@ -0,0 +1,192 @@
+import re
+from typing import List, Dict, Any, Optional, Tuple
+
+
+class StdlibEngine:
+    """Python's backtracking `re` module (the default)."""
+    
+    name = "re"
+    
+    def available(self) -> bool:
+        return True
+    
+    def compile(self, pattern: str, flags: int = 0):
+        return re.compile(pattern, flags)
+
+
+# Members of Python's Unicode-aware \d, \s and \w classes in RE2 syntax;
+# \s covers str.isspace(): ASCII whitespace with \v, \x1c-\x1f, NEL and the Z categories
+_UNICODE_CLASSES = {
+    "d": r"\p{Nd}",
+    "s": r"\s\x0b\x1c-\x1f\x85\p{Z}",
+    "w": r"\p{L}\p{N}_",
+}
+
+
+def _unicode_classes(pattern: str) -> str:
+    """Rewrite \\d, \\s and \\w so RE2 matches the same characters as `re`.
+    
+    Raises ValueError for what cannot be rewritten (a negated class inside
+    a set, \\b and \\B), so the pattern falls back to `re`.
+    """
+    out = []
+    in_set = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            escape = pattern[i + 1]
+            i += 2
+            members = _UNICODE_CLASSES.get(escape.lower())
+            if escape in "bB" and not in_set:
+                raise ValueError(f"RE2's \\{escape} only knows ASCII word characters")
+            if members is None:
+                out.append(char + escape)
+            elif escape.islower():
+                out.append(members if in_set else f"[{members}]")
+            elif in_set:
+                raise ValueError(f"\\{escape} inside a character set")
+            else:
+                out.append(f"[^{members}]")
+            continue
+        
+        out.append(char)
+        i += 1
+        if not in_set and char == "[":
+            in_set = True
+            if pattern.startswith("^", i):
+                out.append("^")
+                i += 1
+            if pattern.startswith("]", i):
+                # A leading "]" is a literal member
+                out.append("\\]")
+                i += 1
+        elif in_set and char == "]":
+            in_set = False
+    return "".join(out)
+
+
+class RE2Engine:
+    """Linear-time matching with RE2, from the optional google-re2 package.
+    
+    RE2 has no backreferences or lookaround, and its \\d, \\s and \\w only
+    match ASCII, so they are rewritten to the Unicode classes `re` uses.
+    Patterns it rejects are compiled with `re` instead.
+    """
+    
+    name = "re2"
+    
+    # Flags that map onto RE2 options; re.UNICODE is implied for str patterns
+    SUPPORTED_FLAGS = re.IGNORECASE | re.DOTALL | re.MULTILINE | re.UNICODE
+    
+    def __init__(self):
+        self._re2 = None
+    
+    def available(self) -> bool:
+        if self._re2 is None:
+            try:
+                import re2
+            except ImportError:
+                return False
+            self._re2 = re2
+        return True
+    
+    def compile(self, pattern: str, flags: int = 0):
+        if not self.available():
+            raise ValueError("the re2 engine needs the google-re2 package")
+        if flags & ~self.SUPPORTED_FLAGS:
+            raise ValueError(f"unsupported flags {re.RegexFlag(flags & ~self.SUPPORTED_FLAGS)!r}")
+        
+        options = self._re2.Options()
+        options.log_errors = False
+        options.case_sensitive = not flags & re.IGNORECASE
+        options.dot_nl = bool(flags & re.DOTALL)
+        pattern = _unicode_classes(pattern)
+        if flags & re.MULTILINE:
+            pattern = "(?m)" + pattern
+        try:
+            return self._re2.compile(pattern, options)
+        except self._re2.error as e:
+            message = e.args[0] if e.args else e
+            if isinstance(message, bytes):
+                message = message.decode("utf-8", "replace")
+            raise ValueError(str(message))
+
+
+ENGINES = {
+    "re": StdlibEngine,
+    "re2": RE2Engine,
+}
+
+
+class PatternCompiler:
+    """Compiles detector patterns through the selected engine.
+    
+    Patterns the engine cannot handle fall back to `re` one by one, so a
+    single lookaround in a rule pack does not disable the engine.
+    """
+    
+    def __init__(self, engine: str = "re"):
+        if engine == "auto":
+            engine = "re2" if RE2Engine().available() else "re"
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown regex engine '{engine}'. Expected one of: auto, {', '.join(ENGINES)}")
+        
+        self.engine = ENGINES[engine]()
+        if not self.engine.available():
+            raise ValueError(f"Regex engine '{engine}' is not installed (pip install google-re2)")
+        self.fallback = StdlibEngine()
+        # (pattern name, reason) for every pattern compiled with `re` instead
+        self.fallbacks: List[Tuple[str, str]] = []
+    
+    @property
+    def name(self) -> str:
+        return self.engine.name
+    
+    def compile(self, pattern: str, flags: int = 0, name: Optional[str] = None):
+        """Compile with the selected engine, or with `re` if it rejects the pattern."""
+        try:
+            return self.engine.compile(pattern, flags)
+        except ValueError as e:
+            if isinstance(self.engine, StdlibEngine):
+                raise
+            self.fallbacks.append((name or pattern, str(e)))
+            return self.fallback.compile(pattern, flags)
+    
+    def adopt_patterns(self, patterns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Recompile the stdlib patterns a detector declared with the selected engine."""
+        if isinstance(self.engine, StdlibEngine):
+            return patterns
+        
+        adopted = []
+        for pattern_info in patterns:
+            compiled = pattern_info.get("pattern")
+            if isinstance(compiled, re.Pattern) and isinstance(compiled.pattern, str):
+                pattern_info = dict(pattern_info, pattern=self.compile(
+                    compiled.pattern, compiled.flags & ~re.UNICODE, pattern_info.get("name"),
+                ))
+            adopted.append(pattern_info)
+        return adopted
+    
+    def info(self) -> Dict[str, Any]:
+        """Engine name and the patterns that fell back to `re`, for report metadata."""
+        return {
+            "engine": self.name,
+            "fallbacks": [{"pattern": name, "reason": reason}
+                          for name, reason in dict(self.fallbacks).items()],
+        }
+
+
+_compiler = PatternCompiler()
+
+
+def set_regex_engine(engine: str) -> PatternCompiler:
+    """Select the engine detectors created from now on compile their patterns with."""
+    global _compiler
+    _compiler = PatternCompiler(engine)
+    return _compiler
+
+
+def get_pattern_compiler() -> PatternCompiler:
+    """Return the compiler for the selected regex engine."""
+    return _compiler
\ No newline at end of file
@@ -24,10 +24,6 @@ class GenericDetector(BaseDetector):
                 "name": "bearer_token",
                 "pattern": re.compile(r'(?i)bearer[\s]+([0-9a-zA-Z\-_=]{20,})'),
             },
-            {
-                "name": "private_key",
-                "pattern": re.compile(r'-----BEGIN (?:RSA|DSA|EC|OPENSSH) PRIVATE KEY-----[A-Za-z0-9+/=\s\n]+-----END (?:RSA|DSA|EC|OPENSSH) PRIVATE KEY-----'),
-            },
             {
                 "name": "connection_string",
                 "pattern": re.compile(r'(?i)(?:postgresql|mysql|mongodb|redis)://[^\s"\']+'),
@@ -38,6 +34,15 @@ class GenericDetector(BaseDetector):
             },
         ]
     
+    def _get_block_patterns(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": "private_key",
+                "labels": {"RSA PRIVATE KEY", "DSA PRIVATE KEY", "EC PRIVATE KEY", "OPENSSH PRIVATE KEY",
+                           "PRIVATE KEY", "ENCRYPTED PRIVATE KEY"},
+            },
+        ]
+    
     def get_secret_type(self) -> str:
         return "generic"
     
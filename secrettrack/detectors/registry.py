@@ -0,0 +1,138 @@
+import importlib
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+
+from .base import BaseDetector
+
+
+# Entry point group third-party packages register detectors under
+ENTRY_POINT_GROUP = "secrettrack.detectors"
+
+# Built-in detectors, importable even when the package metadata is missing
+BUILTIN_DETECTORS = {
+    "aws": "secrettrack.detectors.aws:AWSDetector",
+    "github": "secrettrack.detectors.github:GitHubDetector",
+    "stripe": "secrettrack.detectors.stripe:StripeDetector",
+    "firebase": "secrettrack.detectors.firebase:FirebaseDetector",
+    "generic": "secrettrack.detectors.generic:GenericDetector",
+}
+
+
+def _iter_entry_points(group: str) -> Iterator[Tuple[str, str]]:
+    """Yield (name, "module:attr") pairs registered under an entry point group.
+    
+    importlib.metadata is imported here rather than at module level: it
+    costs more than the whole scan of a small project, and is only needed
+    when a detector outside the built-ins is asked for.
+    """
+    from importlib.metadata import entry_points
+    
+    try:
+        selected = entry_points(group=group)
+    except TypeError:
+        # Python 3.9 returns a dict of groups and takes no arguments
+        selected = entry_points().get(group, [])
+    for entry_point in selected:
+        # Drop "[extras]" markers, they don't affect loading
+        yield entry_point.name, entry_point.value.split("[")[0].strip()
+
+
+class DetectorRegistry:
+    """Discovers detector classes and imports them only when selected."""
+    
+    def __init__(self):
+        self._specs: Dict[str, str] = dict(BUILTIN_DETECTORS)
+        self._rule_packs: Dict[str, Dict[str, Any]] = {}
+        self._discovered = False
+    
+    def _discover(self):
+        """Add detectors registered through package entry points."""
+        if self._discovered:
+            return
+        self._discovered = True
+        
+        for name, spec in _iter_entry_points(ENTRY_POINT_GROUP):
+            # Built-ins keep their in-tree spec so they load without metadata
+            self._specs.setdefault(name, spec)
+    
+    def add_rule_pack(self, pack: Dict[str, Any]):
+        """Make a loaded YAML rule pack available as a detector named after the pack."""
+        name = pack["name"]
+        if name in self._specs:
+            raise ValueError(f"Rule pack '{name}' ({pack['source']}) clashes with a detector of the same name")
+        if name in self._rule_packs and self._rule_packs[name]["source"] != pack["source"]:
+            raise ValueError(
+                f"Rule packs '{self._rule_packs[name]['source']}' and '{pack['source']}' "
+                f"are both named '{name}'"
+            )
+        self._rule_packs[name] = pack
+    
+    def names(self) -> List[str]:
+        """Return the names of all available detectors."""
+        self._discover()
+        return sorted(set(self._specs) | set(self._rule_packs))
+    
+    def _load_class(self, name: str) -> type:
+        module_name, _, attr_path = self._specs[name].partition(":")
+        obj = importlib.import_module(module_name.strip())
+        for attr in attr_path.strip().split("."):
+            obj = getattr(obj, attr)
+        return obj
+    
+    def load(self, names: Optional[List[str]] = None) -> List[BaseDetector]:
+        """Import and instantiate the selected detectors (all if names is None)."""
+        def known(name: str) -> bool:
+            return name in self._specs or name in self._rule_packs
+        
+        if names is None or not all(known(name) for name in names):
+            self._discover()
+        
+        if names is None:
+            names = list(self._specs) + list(self._rule_packs)
+        
+        unknown = [name for name in names if not known(name)]
+        if unknown:
+            raise ValueError(
+                f"Unknown detector(s): {', '.join(unknown)}. "
+                f"Available: {', '.join(self.names())}"
+            )
+        
+        detectors = []
+        for name in dict.fromkeys(names):
+            if name in self._rule_packs:
+                from .rules import RulePackDetector
+                detectors.append(RulePackDetector(self._rule_packs[name]))
+                continue
+            
+            detector_class = self._load_class(name)
+            if not (isinstance(detector_class, type) and issubclass(detector_class, BaseDetector)):
+                raise ValueError(f"Detector '{name}' is not a BaseDetector subclass")
+            detectors.append(detector_class())
+        
+        return detectors
+
+
+_registry = DetectorRegistry()
+
+
+def load_detectors(names: Optional[List[str]] = None) -> List[BaseDetector]:
+    """Load detectors from the default registry."""
+    return _registry.load(names)
+
+
+def load_rule_packs(paths: List[Path]) -> List[str]:
+    """Load YAML rule packs (files or directories) into the default registry."""
+    from .rules import find_rule_files, load_rule_pack
+    
+    names = []
+    for path in paths:
+        for rule_file in find_rule_files(Path(path)):
+            pack = load_rule_pack(rule_file)
+            _registry.add_rule_pack(pack)
+            names.append(pack["name"])
+    return names
+
+
+def available_detectors() -> List[str]:
+    """List detector names known to the default registry."""
+    return _registry.names()
\ No newline at end of file
@@ -0,0 +1,251 @@
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import List, Dict, Any, Tuple
+
+from .base import BaseDetector, SEVERITY_LEVELS
+from .engine import get_pattern_compiler
+
+
+# Bump when the normalized rule format changes, to invalidate cached packs
+RULE_FORMAT_VERSION = 1
+
+RULE_FIELDS = {"name", "regex", "keywords", "group", "ignore_case", "min_severity",
+               "max_severity", "risk", "recommendation"}
+PACK_FIELDS = {"name", "type", "risk", "recommendation", "rules"}
+
+DEFAULT_RISK = "Exposure of a credential defined by a custom rule pack"
+DEFAULT_RECOMMENDATION = """1. Rotate the credential immediately
+2. Remove it from the code and git history
+3. Load it from a secrets manager or environment variable instead"""
+
+
+def rule_cache_dir() -> Path:
+    """Directory holding compiled rule packs ($SECRETTRACK_CACHE_DIR or the user cache)."""
+    if os.environ.get("SECRETTRACK_CACHE_DIR"):
+        return Path(os.environ["SECRETTRACK_CACHE_DIR"])
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "secrettrack" / "rules"
+
+
+def _validate_pack(raw: Any, source: Path) -> Dict[str, Any]:
+    """Check a parsed YAML document and return the normalized pack."""
+    if not isinstance(raw, dict):
+        raise ValueError(f"{source}: a rule pack must be a mapping with a 'rules' list")
+    unknown = set(raw) - PACK_FIELDS
+    if unknown:
+        raise ValueError(f"{source}: unknown field(s) {', '.join(sorted(unknown))}")
+    
+    name = str(raw.get("name") or source.stem).strip().lower()
+    if not re.fullmatch(r"[a-z0-9][a-z0-9_.-]*", name):
+        raise ValueError(f"{source}: invalid pack name '{name}'")
+    
+    rules = raw.get("rules")
+    if not isinstance(rules, list) or not rules:
+        raise ValueError(f"{source}: 'rules' must be a non-empty list")
+    
+    normalized = []
+    seen = set()
+    for index, rule in enumerate(rules, 1):
+        where = f"{source}: rule #{index}"
+        if not isinstance(rule, dict):
+            raise ValueError(f"{where} must be a mapping")
+        if rule.get("name"):
+            where += f" ({rule['name']})"
+        unknown = set(rule) - RULE_FIELDS
+        if unknown:
+            raise ValueError(f"{where}: unknown field(s) {', '.join(sorted(unknown))}")
+        
+        rule_name = rule.get("name")
+        if not isinstance(rule_name, str) or not rule_name.strip():
+            raise ValueError(f"{where}: 'name' is required")
+        if rule_name in seen:
+            raise ValueError(f"{where}: duplicate rule name")
+        seen.add(rule_name)
+        
+        regex = rule.get("regex")
+        if not isinstance(regex, str) or not regex:
+            raise ValueError(f"{where}: 'regex' is required")
+        flags = re.IGNORECASE if rule.get("ignore_case") else 0
+        try:
+            compiled = re.compile(regex, flags)
+        except re.error as e:
+            raise ValueError(f"{where}: invalid regex: {e}")
+        
+        group = rule.get("group", 0)
+        if isinstance(group, int):
+            if not 0 <= group <= compiled.groups:
+                raise ValueError(f"{where}: regex has no group {group}")
+        elif isinstance(group, str):
+            if group not in compiled.groupindex:
+                raise ValueError(f"{where}: regex has no group named '{group}'")
+        else:
+            raise ValueError(f"{where}: 'group' must be a number or a group name")
+        
+        keywords = rule.get("keywords", [])
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        if not isinstance(keywords, list) or not all(isinstance(k, str) and k for k in keywords):
+            raise ValueError(f"{where}: 'keywords' must be a list of non-empty strings")
+        
+        severities = {}
+        for field in ("min_severity", "max_severity"):
+            value = rule.get(field)
+            if value is None:
+                continue
+            value = str(value).lower()
+            if value not in SEVERITY_LEVELS:
+                raise ValueError(f"{where}: {field} must be one of {', '.join(SEVERITY_LEVELS)}")
+            severities[field] = value
+        if (len(severities) == 2 and SEVERITY_LEVELS.index(severities["min_severity"])
+                > SEVERITY_LEVELS.index(severities["max_severity"])):
+            raise ValueError(f"{where}: min_severity is above max_severity")
+        
+        normalized.append({
+            "name": rule_name.strip(),
+            "regex": regex,
+            "flags": flags,
+            "group": group,
+            # Keywords are matched against the lower-cased line
+            "keywords": sorted({k.lower() for k in keywords}),
+            **severities,
+            "risk": str(rule.get("risk") or raw.get("risk") or DEFAULT_RISK),
+            "recommendation": str(
+                rule.get("recommendation") or raw.get("recommendation") or DEFAULT_RECOMMENDATION
+            ),
+        })
+    
+    return {
+        "version": RULE_FORMAT_VERSION,
+        "name": name,
+        "type": str(raw.get("type") or name),
+        "source": str(source),
+        "rules": normalized,
+    }
+
+
+def load_rule_pack(path: Path, use_cache: bool = True) -> Dict[str, Any]:
+    """Load and validate a YAML rule pack, reusing the cached compiled form if unchanged."""
+    try:
+        content = path.read_bytes()
+    except OSError as e:
+        raise ValueError(f"Cannot read rule pack '{path}': {e.strerror}")
+    
+    # A pack without a "name" is named after its file, so the stem is part of the key
+    key = content + f"\0{path.stem}\0{RULE_FORMAT_VERSION}".encode()
+    digest = hashlib.sha256(key).hexdigest()
+    cache_path = rule_cache_dir() / f"{digest}.json"
+    if use_cache:
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                pack = json.load(f)
+            if pack.get("version") == RULE_FORMAT_VERSION:
+                pack["source"] = str(path)
+                return pack
+        except (OSError, ValueError):
+            pass
+    
+    # Only a cache miss pays for importing the YAML parser
+    import yaml
+    
+    try:
+        raw = yaml.safe_load(content)
+    except yaml.YAMLError as e:
+        raise ValueError(f"{path}: invalid YAML: {e}")
+    pack = _validate_pack(raw, path)
+    
+    if use_cache:
+        # Best effort: a read-only cache directory only costs the next run some time
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(pack, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    
+    return pack
+
+
+def find_rule_files(path: Path) -> List[Path]:
+    """Return the rule pack files at path (a YAML file or a directory of them)."""
+    if path.is_dir():
+        return sorted(p for p in path.iterdir() if p.suffix.lower() in (".yml", ".yaml") and p.is_file())
+    if path.is_file():
+        return [path]
+    raise ValueError(f"Rule pack path '{path}' does not exist")
+
+
+class RulePackDetector(BaseDetector):
+    """Detector built from a declarative YAML rule pack.
+    
+    Rules with anchor keywords only run their regex on lines containing
+    one of the keywords, found with a single combined scan of the line.
+    Regexes are compiled the first time a line needs them.
+    """
+    
+    def __init__(self, pack: Dict[str, Any]):
+        self.pack = pack
+        super().__init__()
+        self._build_prefilter()
+    
+    def _get_patterns(self) -> List[Dict[str, Any]]:
+        return [dict(rule, pattern=None) for rule in self.pack["rules"]]
+    
+    def restrict_severities(self, severities) -> None:
+        super().restrict_severities(severities)
+        self._build_prefilter()
+    
+    def _build_prefilter(self):
+        # Rules per keyword, and the rules without keywords that run on every line
+        self._unanchored = [p for p in self.patterns if not p["keywords"]]
+        self._by_keyword: Dict[str, List[Dict[str, Any]]] = {}
+        for pattern_info in self.patterns:
+            for keyword in pattern_info["keywords"]:
+                self._by_keyword.setdefault(keyword, []).append(pattern_info)
+        
+        # A lookahead finds keywords at every position, including overlapping ones;
+        # a keyword found also implies every keyword it contains
+        keywords = sorted(self._by_keyword, key=len, reverse=True)
+        self._implied = {k: [o for o in keywords if o in k] for k in keywords}
+        self._keyword_re = (
+            re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))") if keywords else None
+        )
+    
+    def _candidate_rules(self, line: str) -> List[Dict[str, Any]]:
+        if self._keyword_re is None:
+            return self._unanchored
+        found = set(self._keyword_re.findall(line.lower()))
+        if not found:
+            return self._unanchored
+        
+        keywords = {implied for keyword in found for implied in self._implied[keyword]}
+        selected = {id(p): p for k in keywords for p in self._by_keyword[k]}
+        # Keep the pack's rule order so results are deterministic
+        return [p for p in self.patterns if id(p) in selected or not p["keywords"]]
+    
+    def find_matches(self, line: str) -> List[Tuple[Dict[str, Any], str]]:
+        matches = []
+        for pattern_info in self._candidate_rules(line):
+            pattern = pattern_info["pattern"]
+            if pattern is None:
+                pattern = pattern_info["pattern"] = get_pattern_compiler().compile(
+                    pattern_info["regex"], pattern_info["flags"], pattern_info["name"]
+                )
+            for match in pattern.finditer(line):
+                secret = match.group(pattern_info["group"])
+                if secret:
+                    matches.append((pattern_info, secret))
+        return matches
+    
+    def get_secret_type(self) -> str:
+        return self.pack["type"]
+    
+    def _get_risk_description(self) -> str:
+        return DEFAULT_RISK
+    
+    def _get_recommendation(self) -> str:
+        return DEFAULT_RECOMMENDATION
\ No newline at end of file
@@ -1,8 +1,20 @@
 """
 Report generation modules.
+
+Reporters are imported on first access, so JSON runs never load colorama.
 """
 
-from .human import HumanReport
-from .json import JSONReport
+import importlib
+
+_EXPORTS = {
+    "HumanReport": ".human",
+    "JSONReport": ".json",
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = ["HumanReport", "JSONReport"]
\ No newline at end of file
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
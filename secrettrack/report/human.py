@@ -2,8 +2,7 @@ import sys
 from typing import List, Dict, Any
 from colorama import init, Fore, Style
 
-# Initialize colorama for Windows support
-init(autoreset=True)
+_colorama_initialized = False
 
 
 class HumanReport:
@@ -24,6 +23,12 @@ class HumanReport:
     }
     
     def __init__(self, results: List[Dict[str, Any]]):
+        global _colorama_initialized
+        if not _colorama_initialized:
+            # Initialize colorama for Windows support
+            init(autoreset=True)
+            _colorama_initialized = True
+        
         self.results = results
         self._group_results()
     
@@ -104,7 +109,7 @@ class HumanReport:
         
         lines = [
             f"{color}{icon} {result['type'].upper()}: {result.get('subtype', 'unknown')}",
-            f"  File: {result['file']}:{result['line']}",
+            f"  File: {result['file']}:{self._format_lines(result)}",
             f"  Secret: {self._mask_secret(result['secret'])}",
             f"  Environment: {result.get('environment', 'unknown')}",
             f"  Risk: {result.get('risk', 'Unknown risk')}",
@@ -113,6 +118,13 @@ class HumanReport:
         
         return "\n".join(lines)
     
+    def _format_lines(self, result: Dict[str, Any]) -> str:
+        """Line number, or the line range of a multi-line finding."""
+        end_line = result.get("end_line")
+        if end_line and end_line != result["line"]:
+            return f"{result['line']}-{end_line}"
+        return str(result["line"])
+    
     def _mask_secret(self, secret: str) -> str:
         """Mask a secret for safe display."""
         if len(secret) <= 8:
@@ -1,16 +1,17 @@
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 
 class JSONReport:
     """Generates JSON reports for CI/CD integration."""
     
-    def __init__(self, results: List[Dict[str, Any]]):
+    def __init__(self, results: List[Dict[str, Any]],
+                 metadata: Optional[Dict[str, Any]] = None):
         self.results = results
+        self.metadata = metadata or {}
     
-    def generate(self) -> str:
-        """Generate JSON report."""
-        # Remove sensitive data and add metadata
+    def safe_findings(self) -> List[Dict[str, Any]]:
+        """Return findings with sensitive data removed."""
         safe_results = []
         for result in self.results:
             safe_result = {
@@ -19,34 +20,106 @@ class JSONReport:
                 "severity": result.get("severity"),
                 "file": result.get("file"),
                 "line": result.get("line"),
+                # Multi-line findings (PEM keys) span line..end_line
+                "end_line": result.get("end_line", result.get("line")),
                 "environment": result.get("environment"),
                 "confidence": result.get("confidence"),
                 "risk": result.get("risk"),
                 "recommendation": result.get("recommendation"),
                 "hash": result.get("hash"),
+                "fingerprint": result.get("fingerprint"),
                 "context_preview": result.get("context", "")[:100],
                 "secret_preview": self._mask_secret(result.get("secret", "")),
             }
             safe_results.append(safe_result)
         
+        return safe_results
+    
+    def generate(self) -> str:
+        """Generate JSON report."""
+        # Remove sensitive data and add metadata
+        return self._render(self.safe_findings())
+    
+    def _render(self, safe_results: List[Dict[str, Any]]) -> str:
+        """Serialize already-safe findings with metadata and summary."""
         report = {
             "metadata": {
                 "tool": "secretshunter",
                 "version": "1.0.0",
                 "scan_timestamp": self._get_timestamp(),
+                **self.metadata,
             },
-            "summary": {
-                "total_findings": len(safe_results),
-                "critical": len([r for r in safe_results if r.get("severity") == "critical"]),
-                "high": len([r for r in safe_results if r.get("severity") == "high"]),
-                "medium": len([r for r in safe_results if r.get("severity") == "medium"]),
-                "low": len([r for r in safe_results if r.get("severity") == "low"]),
-            },
+            "summary": self._summarize(safe_results),
             "findings": safe_results,
         }
         
         return json.dumps(report, indent=2)
     
+    @staticmethod
+    def _summarize(safe_results: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Count findings per severity."""
+        return {
+            "total_findings": len(safe_results),
+            "critical": len([r for r in safe_results if r.get("severity") == "critical"]),
+            "high": len([r for r in safe_results if r.get("severity") == "high"]),
+            "medium": len([r for r in safe_results if r.get("severity") == "medium"]),
+            "low": len([r for r in safe_results if r.get("severity") == "low"]),
+        }
+    
+    @classmethod
+    def merge(cls, reports: List[Dict[str, Any]], names: Optional[List[str]] = None) -> str:
+        """Combine JSON reports (e.g. from shards) into one, deduplicating by hash.
+        
+        Raises ValueError for reports that cannot be combined: a malformed
+        shard, shards of different counts, or sharded and unsharded reports
+        mixed together. names label the reports in error messages.
+        """
+        from secrettrack.scanner.shard import Shard
+        
+        names = names or [f"report {number}" for number in range(1, len(reports) + 1)]
+        findings = []
+        seen = set()
+        shards = set()
+        shard_count = None
+        unsharded = None
+        complete = True
+        
+        for name, report in zip(names, reports):
+            if not isinstance(report, dict) or not isinstance(report.get("metadata", {}), dict):
+                raise ValueError(f"{name} is not a secrettrack JSON report")
+            metadata = report.get("metadata", {})
+            complete = complete and metadata.get("scan_complete", True)
+            if metadata.get("shard"):
+                try:
+                    shard = Shard.parse(str(metadata["shard"]))
+                except ValueError as e:
+                    raise ValueError(f"{name}: {e}")
+                if shard_count is not None and shard.count != shard_count:
+                    raise ValueError(f"{name} is shard {shard} but other reports have "
+                                     f"{shard_count} shards")
+                shards.add(shard.index)
+                shard_count = shard.count
+            else:
+                unsharded = name
+            if shard_count is not None and unsharded is not None:
+                raise ValueError(f"{unsharded} has no shard but other reports are sharded")
+            
+            for finding in report.get("findings", []):
+                key = finding.get("hash")
+                if key is not None:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                findings.append(finding)
+        
+        metadata = {"merged_reports": len(reports), "scan_complete": complete}
+        if shard_count:
+            metadata["shards"] = sorted(shards)
+            metadata["missing_shards"] = sorted(set(range(1, shard_count + 1)) - shards)
+            metadata["scan_complete"] = complete and not metadata["missing_shards"]
+        
+        return cls([], metadata=metadata)._render(findings)
+    
     def _mask_secret(self, secret: str) -> str:
         """Mask secret for safe JSON output."""
         if not secret:
@@ -2,7 +2,18 @@
 Scanner module for finding files and extracting content.
 """
 
-from .filesystem import FileSystemScanner
-from .git_history import GitHistoryScanner
+import importlib
 
-__all__ = ["FileSystemScanner", "GitHistoryScanner"]
\ No newline at end of file
+_EXPORTS = {
+    "FileSystemScanner": ".filesystem",
+    "GitHistoryScanner": ".git_history",
+    "WatchScanner": ".watch",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,318 @@
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+
+from secrettrack.scanner.filesystem import FileSystemScanner
+from secrettrack.scanner.git_history import GitHistoryScanner
+from secrettrack.scanner.git_objects import find_git_dir
+from secrettrack.scanner.limits import ScanLimits
+from secrettrack.scanner.settings import settings_digest, rule_pack_digests
+
+
+# Per-process scanners, created once by the pool initializer
+_worker_fs_scanner: Optional[FileSystemScanner] = None
+_worker_git_scanner: Optional[GitHistoryScanner] = None
+
+
+def _init_worker(exclude_patterns: List[str], detector_names: Optional[List[str]],
+                 severities: List[str], rule_paths: List[str], regex_engine: str):
+    global _worker_fs_scanner, _worker_git_scanner
+    if regex_engine != "re":
+        from secrettrack.detectors.engine import set_regex_engine
+        set_regex_engine(regex_engine)
+    if rule_paths:
+        # Workers may not share the parent's registry (spawn/forkserver start methods)
+        from secrettrack.detectors.registry import load_rule_packs
+        load_rule_packs([Path(p) for p in rule_paths])
+    _worker_fs_scanner = FileSystemScanner(
+        exclude_patterns=exclude_patterns,
+        detector_names=detector_names,
+        limits=ScanLimits(severities=severities),
+    )
+    # The same backend as the history command: every ref, read from the object database
+    _worker_git_scanner = GitHistoryScanner(
+        detector_names=detector_names,
+        limits=ScanLimits(severities=severities),
+        backend="objects",
+    )
+
+
+def _scan_file_batch(paths: List[str]) -> List[Dict[str, Any]]:
+    results = []
+    for path in paths:
+        results.extend(_worker_fs_scanner._scan_file(Path(path)))
+    return results
+
+
+def _scan_history(repo_path: str) -> List[Dict[str, Any]]:
+    return _worker_git_scanner.scan(Path(repo_path))
+
+
+def read_manifest(manifest_path: Path) -> List[Path]:
+    """Read repository paths from a manifest, one per line.
+    
+    '#' starts a comment at the beginning of a line or after whitespace,
+    so paths such as "/srv/repos/c#-tools" are kept whole.
+    """
+    repos = []
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = re.split(r"(?:^|\s)#", line, 1)[0].strip()
+            if line:
+                repos.append(Path(line).expanduser().absolute())
+    return list(dict.fromkeys(repos))
+
+
+class BatchScanner:
+    """Scans many repositories on one shared process pool with resumable progress."""
+    
+    PROGRESS_FILE = "progress.jsonl"
+    SUMMARY_FILE = "summary.json"
+    REPORTS_DIR = "repos"
+    
+    # Files per task, and an upper bound on the bytes a single task reads
+    BATCH_FILES = 64
+    BATCH_BYTES = 8 * 1024 * 1024
+    
+    def __init__(self, exclude_patterns: Optional[List[str]] = None,
+                 detector_names: Optional[List[str]] = None,
+                 severities: Optional[List[str]] = None,
+                 workers: Optional[int] = None,
+                 include_history: bool = False,
+                 rule_paths: Optional[List[str]] = None,
+                 regex_engine: str = "re"):
+        self.exclude_patterns = exclude_patterns or []
+        self.detector_names = detector_names
+        self.severities = list(ScanLimits(severities=severities).severities)
+        self.workers = workers or os.cpu_count() or 1
+        self.include_history = include_history
+        self.rule_paths = list(rule_paths or [])
+        self.regex_engine = regex_engine
+        self.settings = self._settings_digest()
+        
+        # Only used for enumeration in the parent process, so no detectors
+        self._enumerator = FileSystemScanner(
+            exclude_patterns=self.exclude_patterns, detector_names=[]
+        )
+    
+    def _report_name(self, repo: Path) -> str:
+        """Stable, collision-free report file name for a repository."""
+        slug = re.sub(r"[^A-Za-z0-9._-]+", "_", repo.name) or "repo"
+        digest = hashlib.sha1(str(repo).encode()).hexdigest()[:8]
+        return f"{slug}-{digest}.json"
+    
+    def _settings_digest(self) -> str:
+        """Digest of every option that changes a repository's findings."""
+        from secrettrack.detectors.registry import available_detectors
+        
+        return settings_digest({
+            "detectors": sorted(self.detector_names or available_detectors()),
+            "rules": rule_pack_digests(self.rule_paths),
+            "severities": sorted(self.severities),
+            "exclude": self.exclude_patterns,
+            "history": "objects" if self.include_history else False,
+            "regex_engine": self.regex_engine,
+        })
+    
+    def load_progress(self, output_dir: Path) -> Dict[str, Dict[str, Any]]:
+        """Return progress records of repositories already completed with the same options."""
+        latest = {}
+        progress_file = output_dir / self.PROGRESS_FILE
+        if not progress_file.exists():
+            return latest
+        
+        with open(progress_file, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Truncated last line from an interrupted run
+                latest[record["repository"]] = record
+        
+        # Only the latest record matches the report on disk; one written with
+        # other options (or a failure) means the repository is scanned again
+        return {
+            repo: record for repo, record in latest.items()
+            if record.get("status") == "done" and record.get("settings") == self.settings
+        }
+    
+    def _iter_tasks(self, repo: Path) -> Iterator[Tuple[Any, tuple]]:
+        """Split a repository into file batches, plus one history task.
+        
+        A bare repository has no work tree, so only its history is scanned.
+        """
+        batch: List[str] = []
+        batch_bytes = 0
+        
+        if self._is_bare(repo):
+            files = []
+        else:
+            files = [repo] if repo.is_file() else self._enumerator._find_files(repo)
+        for filepath in files:
+            if not self._enumerator._should_scan_file(filepath):
+                continue
+            try:
+                size = filepath.stat().st_size
+            except OSError:
+                continue
+            
+            batch.append(str(filepath))
+            batch_bytes += size
+            if len(batch) >= self.BATCH_FILES or batch_bytes >= self.BATCH_BYTES:
+                yield _scan_file_batch, (batch,)
+                batch, batch_bytes = [], 0
+        
+        if batch:
+            yield _scan_file_batch, (batch,)
+        
+        if self.include_history and repo.is_dir() and find_git_dir(repo) is not None:
+            yield _scan_history, (str(repo),)
+    
+    def _iter_all_tasks(self, repos: List[Path]) -> Iterator[Tuple[Path, Any, tuple, bool, Optional[str]]]:
+        """Yield (repo, fn, args, is_last, error) across all repositories in order."""
+        for repo in repos:
+            if not repo.exists():
+                yield repo, None, (), True, "repository path does not exist"
+                continue
+            if not self.include_history and self._is_bare(repo):
+                yield repo, None, (), True, "bare repository has no work tree; use --history"
+                continue
+            
+            previous = None
+            for task in self._iter_tasks(repo):
+                if previous is not None:
+                    yield (repo,) + previous + (False, None)
+                previous = task
+            if previous is None:
+                yield repo, None, (), True, None
+            else:
+                yield (repo,) + previous + (True, None)
+    
+    def _is_bare(self, repo: Path) -> bool:
+        git_dir = find_git_dir(repo) if repo.is_dir() else None
+        return git_dir is not None and git_dir.resolve() == repo.resolve()
+    
+    def _finish_repo(self, repo: Path, results: List[Dict[str, Any]], output_dir: Path,
+                     progress_file, error: Optional[str] = None) -> Dict[str, Any]:
+        from secrettrack.report.json import JSONReport
+        
+        report_path = output_dir / self.REPORTS_DIR / self._report_name(repo)
+        record = {
+            "repository": str(repo),
+            "status": "error" if error else "done",
+            "report": None if error else str(report_path.relative_to(output_dir)),
+            "total_findings": len(results),
+            "settings": self.settings,
+        }
+        for severity in ("critical", "high", "medium", "low"):
+            record[severity] = sum(1 for r in results if r.get("severity") == severity)
+        
+        if error:
+            record["error"] = error
+        else:
+            report = JSONReport(results, metadata={"repository": str(repo)}).generate()
+            tmp_path = report_path.with_suffix(".json.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(report)
+            os.replace(tmp_path, report_path)
+        
+        # The progress line is written last so a crash never marks a repo done early
+        progress_file.write(json.dumps(record) + "\n")
+        progress_file.flush()
+        return record
+    
+    def scan(self, repos: List[Path], output_dir: Path,
+             callback=None) -> Dict[str, Any]:
+        """Scan repositories, writing per-repository reports and a summary."""
+        (output_dir / self.REPORTS_DIR).mkdir(parents=True, exist_ok=True)
+        
+        completed = self.load_progress(output_dir)
+        pending_repos = [r for r in repos if str(r) not in completed]
+        records = {r: completed[r] for r in map(str, repos) if r in completed}
+        
+        # Per-repo state: collected results, outstanding tasks, all tasks submitted
+        state: Dict[Path, Dict[str, Any]] = {}
+        max_in_flight = self.workers * 4
+        
+        with open(output_dir / self.PROGRESS_FILE, "a", encoding="utf-8") as progress_file, \
+                ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=_init_worker,
+                    initargs=(self.exclude_patterns, self.detector_names, self.severities,
+                              self.rule_paths, self.regex_engine),
+                ) as executor:
+            futures = {}
+            tasks = self._iter_all_tasks(pending_repos)
+            
+            def finish_if_done(repo: Path):
+                repo_state = state[repo]
+                if repo_state["submitted"] and repo_state["outstanding"] == 0:
+                    record = self._finish_repo(
+                        repo, repo_state["results"], output_dir, progress_file,
+                        repo_state["error"],
+                    )
+                    records[str(repo)] = record
+                    del state[repo]
+                    if callback:
+                        callback(record)
+            
+            try:
+                exhausted = False
+                while not exhausted or futures:
+                    # Keep the pool fed without materialising every task up front
+                    while not exhausted and len(futures) < max_in_flight:
+                        try:
+                            repo, fn, args, is_last, error = next(tasks)
+                        except StopIteration:
+                            exhausted = True
+                            break
+                        
+                        repo_state = state.setdefault(
+                            repo, {"results": [], "outstanding": 0, "submitted": False, "error": error}
+                        )
+                        if fn is not None:
+                            futures[executor.submit(fn, *args)] = repo
+                            repo_state["outstanding"] += 1
+                        if is_last:
+                            repo_state["submitted"] = True
+                            finish_if_done(repo)
+                    
+                    if not futures:
+                        continue
+                    
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        repo = futures.pop(future)
+                        repo_state = state[repo]
+                        repo_state["outstanding"] -= 1
+                        try:
+                            repo_state["results"].extend(future.result())
+                        except Exception as e:
+                            repo_state["error"] = f"{type(e).__name__}: {e}"
+                        finish_if_done(repo)
+            except BaseException:
+                # Drop queued work; completed repositories are already recorded
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+        
+        summary = self._write_summary(output_dir, [records[str(r)] for r in repos if str(r) in records])
+        return summary
+    
+    def _write_summary(self, output_dir: Path, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        summary = {
+            "repositories": len(records),
+            "failed": sum(1 for r in records if r["status"] != "done"),
+            "total_findings": sum(r["total_findings"] for r in records),
+        }
+        for severity in ("critical", "high", "medium", "low"):
+            summary[severity] = sum(r[severity] for r in records)
+        summary["results"] = records
+        
+        with open(output_dir / self.SUMMARY_FILE, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        
+        return summary
\ No newline at end of file
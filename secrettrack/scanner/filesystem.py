@@ -1,15 +1,21 @@
 import os
 import re
+import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Generator
+from typing import List, Dict, Any, Optional, Generator, Set, Tuple
 import fnmatch
 
+from secrettrack.analyzer.baseline import Baseline, IGNORE_MARKER, fingerprint
 from secrettrack.detectors.base import BaseDetector
-from secrettrack.detectors.aws import AWSDetector
-from secrettrack.detectors.github import GitHubDetector
-from secrettrack.detectors.stripe import StripeDetector
-from secrettrack.detectors.firebase import FirebaseDetector
-from secrettrack.detectors.generic import GenericDetector
+from secrettrack.detectors.blocks import BlockMatcher
+from secrettrack.detectors.registry import load_detectors
+from secrettrack.scanner.limits import ScanLimits
+from secrettrack.scanner.git_index import GitFileLister, ScanState, find_work_tree
+from secrettrack.scanner.line_cache import LineMatchCache, ContentMatchCache
+from secrettrack.scanner.priority import RiskScheduler
+from secrettrack.scanner.shard import Shard
+from secrettrack.scanner.stats import ScanStats
+from secrettrack.scanner.text import decode_lines
 
 
 class FileSystemScanner:
@@ -27,77 +33,176 @@ class FileSystemScanner:
     # Maximum file size to scan (10MB)
     MAX_FILE_SIZE = 10 * 1024 * 1024
     
-    def __init__(self, exclude_patterns: Optional[List[str]] = None):
+    def __init__(self, exclude_patterns: Optional[List[str]] = None,
+                 detector_names: Optional[List[str]] = None,
+                 limits: Optional[ScanLimits] = None,
+                 readers: int = 0, queue_depth: int = 64,
+                 max_buffered_bytes: int = 64 * 1024 * 1024,
+                 line_cache_size: int = 65536,
+                 content_cache_size: int = 65536,
+                 shard: Optional[Shard] = None,
+                 baseline: Optional[Baseline] = None,
+                 tracked_only: bool = False, include_untracked: bool = False,
+                 scan_state: Optional[ScanState] = None):
         self.exclude_patterns = exclude_patterns or []
-        self.detectors = self._initialize_detectors()
-    
-    def _initialize_detectors(self) -> List[BaseDetector]:
-        """Initialize all available detectors."""
-        return [
-            AWSDetector(),
-            GitHubDetector(),
-            StripeDetector(),
-            FirebaseDetector(),
-            GenericDetector(),
-        ]
+        self.limits = limits
+        self.shard = shard
+        self.baseline = baseline
+        # Fingerprints use paths relative to the scanned directory
+        self.root: Optional[Path] = None
+        # With a time budget, the riskiest files are scanned first
+        self.scheduler = RiskScheduler() if limits and limits.time_budget else None
+        self.scanned_files: Set[Path] = set()
+        self.coverage: Optional[Dict[str, Any]] = None
+        # List files from the git index rather than walking the tree
+        self.tracked_only = tracked_only
+        self.include_untracked = include_untracked
+        self.scan_state = scan_state
+        self._index_shas: Dict[Path, Tuple[str, str]] = {}
+        self.stats = ScanStats()
+        self.pipeline = None
+        if readers > 0:
+            from secrettrack.scanner.pipeline import PrefetchPipeline
+            self.pipeline = PrefetchPipeline(
+                self, readers=readers, queue_depth=queue_depth,
+                max_buffered_bytes=max_buffered_bytes,
+            )
+        self.detectors = self._initialize_detectors(detector_names)
+        
+        if limits:
+            for detector in self.detectors:
+                detector.restrict_severities(limits.severities)
+            self.detectors = [d for d in self.detectors if d.patterns or d.block_patterns]
+        
+        self.line_cache = LineMatchCache(self.detectors, line_cache_size)
+        self.block_matcher = BlockMatcher(self.detectors)
+        self.content_cache = ContentMatchCache(content_cache_size)
+    
+    def _initialize_detectors(self, detector_names: Optional[List[str]] = None) -> List[BaseDetector]:
+        """Initialize the selected detectors (all available by default)."""
+        return load_detectors(detector_names)
     
     def _should_scan_file(self, filepath: Path) -> bool:
         """Check if a file should be scanned."""
+        self.stats.add(files_walked=1)
+        reason = self._skip_reason(filepath)
+        if reason:
+            self.stats.skip(reason)
+            return False
+        return True
+    
+    def _skip_reason(self, filepath: Path) -> Optional[str]:
+        """Return why a file should be skipped, or None to scan it."""
         # Check file size
         try:
             if filepath.stat().st_size > self.MAX_FILE_SIZE:
-                return False
+                return "size"
         except OSError:
-            return False
+            return "unreadable"
         
         # Check extension
         if filepath.suffix.lower() in self.DEFAULT_SKIP_EXTENSIONS:
-            return False
+            return "extension"
         
         # Check exclude patterns
         file_str = str(filepath)
         for pattern in self.exclude_patterns:
             if fnmatch.fnmatch(file_str, pattern):
-                return False
+                return "exclude"
             if fnmatch.fnmatch(file_str, f"*/{pattern}"):
-                return False
+                return "exclude"
             if fnmatch.fnmatch(file_str, f"**/{pattern}"):
-                return False
+                return "exclude"
         
-        return True
+        return None
     
     def _read_file_lines(self, filepath: Path) -> List[str]:
         """Read file lines with proper encoding handling."""
+        return self._read_file_content(filepath)[0]
+    
+    def _read_file_content(self, filepath: Path) -> Tuple[List[str], Optional[Tuple[int, bytes]]]:
+        """Read file lines and the key identifying the file's content."""
         try:
-            # Try UTF-8 first
-            with open(filepath, "r", encoding="utf-8") as f:
-                return f.readlines()
-        except UnicodeDecodeError:
-            try:
-                # Try Latin-1 as fallback
-                with open(filepath, "r", encoding="latin-1") as f:
-                    return f.readlines()
-            except:
-                return []
+            with open(filepath, "rb") as f:
+                data = f.read()
         except Exception:
-            return []
+            self.stats.skip("unreadable")
+            return [], None
+        
+        lines, fell_back = decode_lines(data)
+        if fell_back:
+            self.stats.add(decode_fallbacks=1)
+        self.stats.add(bytes_scanned=len(data))
+        return lines, self.content_cache.key(data)
     
     def scan(self, path: Path) -> List[Dict[str, Any]]:
         """Scan a path for secrets."""
         results = []
+        self.stats.start()
+        if self.limits:
+            self.limits.start_clock()
+        self.root = path if path.is_dir() else path.parent
         
         if path.is_file():
             files_to_scan = [path]
+        elif self.tracked_only:
+            files_to_scan = self._find_index_files(path)
         else:
             files_to_scan = self._find_files(path)
         
-        for filepath in files_to_scan:
-            if not self._should_scan_file(filepath):
-                continue
+        files_to_scan = (f for f in files_to_scan if self._should_scan_file(f))
+        
+        if self.shard:
+            files_to_scan = self.shard.select_files(path, files_to_scan)
+        
+        if self.scheduler:
+            files_to_scan = self.scheduler.schedule(files_to_scan, self.root, self.limits)
+        
+        if self.pipeline:
+            # Overlap walking, reading and matching
+            results = self.pipeline.run(files_to_scan)
+            for stage, stage_stats in self.pipeline.stats.items():
+                self.stats.add_stage_time(stage, stage_stats.busy)
+        else:
+            read_time = match_time = 0.0
+            for filepath in files_to_scan:
+                # Checked before reading, so a spent budget does not pay for one more file
+                if self.limits and self.limits.check_deadline():
+                    break
+                
+                started = time.perf_counter()
+                lines, content_key = self._read_file_content(filepath)
+                read_done = time.perf_counter()
+                results.extend(self._scan_lines(filepath, lines, content_key))
+                read_time += read_done - started
+                match_time += time.perf_counter() - read_done
             
-            file_results = self._scan_file(filepath)
-            results.extend(file_results)
+            self.stats.add_stage_time("read", read_time)
+            self.stats.add_stage_time("match", match_time)
+            # Whatever was not reading or matching was spent walking and filtering
+            self.stats.add_stage_time(
+                "walk", max(0.0, time.perf_counter() - self.stats.started - read_time - match_time)
+            )
         
+        self.stats.stop()
+        self.stats.record_findings(results)
+        self.stats.line_cache = self.line_cache.stats()
+        self.stats.content_cache = self.content_cache.stats()
+        if self.scheduler:
+            self.coverage = self.scheduler.coverage(self.scanned_files)
+            if not self.scheduler.enumeration_complete:
+                # Even if every listed file was scanned, the rest of the tree was not
+                self.limits.stop(f"time-budget: {self.limits.time_budget:g}s spent, tree only partly listed")
+        return results
+    
+    def _triage(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fingerprint results and drop those already in the baseline."""
+        for result in results:
+            result["fingerprint"] = fingerprint(result, self.root)
+        if self.baseline is not None:
+            new_results = self.baseline.filter(results)
+            self.stats.suppress("baseline", len(results) - len(new_results))
+            return new_results
         return results
     
     def _find_files(self, directory: Path) -> Generator[Path, None, None]:
@@ -105,25 +210,138 @@ class FileSystemScanner:
         for root, dirs, files in os.walk(directory):
             # Skip excluded directories
             root_path = Path(root)
-            for pattern in self.exclude_patterns:
-                if any(fnmatch.fnmatch(str(root_path / d), f"*/{pattern}") for d in dirs):
-                    dirs[:] = [d for d in dirs if not fnmatch.fnmatch(str(root_path / d), f"*/{pattern}")]
+            dirs[:] = [d for d in dirs if not self._is_excluded_dir(root_path / d)]
             
             for file in files:
                 yield root_path / file
     
+    def _find_index_files(self, directory: Path) -> Generator[Path, None, None]:
+        """List the files under directory from the git index of its checkout."""
+        work_tree = find_work_tree(directory)
+        if work_tree is None:
+            raise ValueError(f"'{directory}' is not inside a git work tree")
+        
+        lister = GitFileLister(work_tree, self.include_untracked)
+        excluded: Dict[Path, bool] = {directory: False}
+        
+        def is_excluded(dirpath: Path) -> bool:
+            # Directory excludes apply to everything below, as os.walk pruning does
+            if dirpath not in excluded:
+                excluded[dirpath] = self._is_excluded_dir(dirpath) or is_excluded(dirpath.parent)
+            return excluded[dirpath]
+        
+        for filepath in lister.list_files():
+            parent = filepath.parent
+            if parent != directory and directory not in parent.parents:
+                continue
+            if is_excluded(parent):
+                continue
+            
+            if self.scan_state is not None:
+                key = filepath.relative_to(work_tree).as_posix()
+                sha = lister.blob_sha(filepath)
+                if self.scan_state.unchanged(key, sha):
+                    self.stats.add(files_walked=1)
+                    self.stats.skip("unchanged")
+                    self.scan_state.record(key, sha)
+                    continue
+                if sha is not None:
+                    self._index_shas[filepath] = (key, sha)
+            
+            yield filepath
+    
+    def _is_excluded_dir(self, dirpath: Path) -> bool:
+        """Check if a directory matches one of the exclude patterns."""
+        dir_str = str(dirpath)
+        return any(fnmatch.fnmatch(dir_str, f"*/{pattern}") for pattern in self.exclude_patterns)
+    
     def _scan_file(self, filepath: Path) -> List[Dict[str, Any]]:
         """Scan a single file for secrets."""
-        results = []
-        lines = self._read_file_lines(filepath)
+        lines, content_key = self._read_file_content(filepath)
         
         if not lines:
+            return []
+        
+        return self._scan_lines(filepath, lines, content_key)
+    
+    def _scan_lines(self, filepath: Path, lines: List[str],
+                    content_key: Optional[Tuple[int, bytes]] = None) -> List[Dict[str, Any]]:
+        """Scan the lines of a file that has already been read."""
+        results = []
+        if self.limits and self.limits.check_deadline():
+            return results
+        if self.scheduler:
+            self.scanned_files.add(filepath)
+        if not lines:
+            self._record_state(filepath)
             return results
         
+        self.stats.add(files_scanned=1, lines_scanned=len(lines))
+        
+        matched_lines = self.content_cache.get(content_key) if content_key else None
+        if matched_lines is not None:
+            # Identical content was matched before, only the path dependent scoring is redone
+            self.stats.add(duplicate_files=1)
+            for line_num, line, line_matches, end_line in matched_lines:
+                self._score_matches(filepath, line_num, line, line_matches, results, end_line)
+                if self.limits and self.limits.exhausted:
+                    break
+            else:
+                self._record_state(filepath)
+            return results
+        
+        matched_lines = []
+        blocks = self.block_matcher.stream()
         for line_num, line in enumerate(lines, 1):
-            for detector in self.detectors:
-                detector_results = detector.scan_line(line, line_num, filepath)
-                if detector_results:
-                    results.extend(detector_results)
+            line_matches = self.line_cache.match(line)
+            if line_matches:
+                matched_lines.append((line_num, line, line_matches, None))
+                self._score_matches(filepath, line_num, line, line_matches, results)
+            
+            # Multi-line blocks are reported from their BEGIN line once their END is seen
+            if blocks and (blocks.in_block or "-----BEGIN " in line):
+                for block in blocks.feed(line, line_num):
+                    block_matches = [(block.detector, [(block.pattern_info, block.secret)])]
+                    matched_lines.append((block.start_line, block.line, block_matches, block.end_line))
+                    self._score_matches(filepath, block.start_line, block.line, block_matches,
+                                        results, block.end_line)
+            
+            if self.limits and self.limits.exhausted:
+                break
+        else:
+            if content_key:
+                self.content_cache.put(content_key, tuple(matched_lines))
+            self._record_state(filepath)
+        
+        return results
+    
+    def _score_matches(self, filepath: Path, line_num: int, line: str,
+                       line_matches: list, results: List[Dict[str, Any]],
+                       end_line: Optional[int] = None):
+        """Turn one line's (or block's) raw matches into results for this path."""
+        if IGNORE_MARKER in line:
+            self.stats.suppress("inline")
+            return
+        
+        for detector, matches in line_matches:
+            detector_results = detector.build_results(matches, line, line_num, filepath)
+            if end_line is not None:
+                for result in detector_results:
+                    result["end_line"] = end_line
+            if detector_results:
+                # A file with findings is rescanned next time, even if the baseline hides them now
+                self._index_shas.pop(filepath, None)
+                detector_results = self._triage(detector_results)
+                if self.limits:
+                    detector_results = self.limits.admit(detector_results)
+                results.extend(detector_results)
+    
+    def _record_state(self, filepath: Path):
+        """Remember a fully scanned file's blob id so an unchanged copy is skipped next time.
         
-        return results
\ No newline at end of file
+        Files with findings, including ones suppressed by the baseline, were
+        already dropped in _score_matches, so they keep being scanned.
+        """
+        indexed = self._index_shas.pop(filepath, None)
+        if indexed:
+            self.scan_state.record(*indexed)
\ No newline at end of file
@@ -1,53 +1,232 @@
 import subprocess
 import tempfile
+import time
+import zlib
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import os
 
+from secrettrack.analyzer.baseline import Baseline, IGNORE_MARKER, fingerprint
 from secrettrack.detectors.base import BaseDetector
-from secrettrack.detectors.aws import AWSDetector
-from secrettrack.detectors.github import GitHubDetector
-from secrettrack.detectors.stripe import StripeDetector
-from secrettrack.detectors.firebase import FirebaseDetector
-from secrettrack.detectors.generic import GenericDetector
+from secrettrack.detectors.blocks import BlockMatcher
+from secrettrack.detectors.registry import load_detectors
+from secrettrack.scanner.limits import ScanLimits
+from secrettrack.scanner.line_cache import ContentMatchCache, LineMatchCache
+from secrettrack.scanner.shard import Shard
+from secrettrack.scanner.stats import ScanStats
+from secrettrack.scanner.text import decode_lines
+from secrettrack.scanner.git_objects import GitObjectStore, find_git_dir
 
 
 class GitHistoryScanner:
     """Scans Git history for secrets."""
     
-    def __init__(self):
-        self.detectors = self._initialize_detectors()
+    # Backends: "git" walks `git log`/`git show` output, "objects" reads the
+    # object database directly and covers every ref
+    BACKENDS = ("git", "objects")
     
-    def _initialize_detectors(self) -> List[BaseDetector]:
-        """Initialize all available detectors."""
-        return [
-            AWSDetector(),
-            GitHubDetector(),
-            StripeDetector(),
-            FirebaseDetector(),
-            GenericDetector(),
-        ]
+    # Blobs larger than this are skipped by the objects backend (10MB)
+    MAX_BLOB_SIZE = 10 * 1024 * 1024
+    
+    def __init__(self, detector_names: Optional[List[str]] = None,
+                 limits: Optional[ScanLimits] = None,
+                 backend: str = "objects", include_unreachable: bool = False,
+                 line_cache_size: int = 65536,
+                 content_cache_size: int = 65536,
+                 shard: Optional[Shard] = None,
+                 baseline: Optional[Baseline] = None):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown history backend '{backend}'. Expected one of: {', '.join(self.BACKENDS)}")
+        self.backend = backend
+        self.include_unreachable = include_unreachable
+        self.shard = shard
+        self.baseline = baseline
+        self.limits = limits
+        self.stats = ScanStats()
+        self.detectors = self._initialize_detectors(detector_names)
+        
+        if limits:
+            for detector in self.detectors:
+                detector.restrict_severities(limits.severities)
+            self.detectors = [d for d in self.detectors if d.patterns or d.block_patterns]
+        
+        self.line_cache = LineMatchCache(self.detectors, line_cache_size)
+        self.block_matcher = BlockMatcher(self.detectors)
+        # Matches of blobs already read by the objects backend, keyed by blob id
+        self.blob_cache = ContentMatchCache(content_cache_size)
+    
+    def _initialize_detectors(self, detector_names: Optional[List[str]] = None) -> List[BaseDetector]:
+        """Initialize the selected detectors (all available by default)."""
+        return load_detectors(detector_names)
     
     def scan(self, repo_path: Path) -> List[Dict[str, Any]]:
         """Scan Git repository history for secrets."""
         if not self._is_git_repo(repo_path):
             return []
         
+        self.stats.start()
+        if self.backend == "objects":
+            results = self._scan_objects(repo_path)
+        else:
+            results = self._scan_commits(repo_path)
+        self.stats.stop()
+        self.stats.record_findings(results)
+        self.stats.line_cache = self.line_cache.stats()
+        if self.backend == "objects":
+            self.stats.content_cache = self.blob_cache.stats()
+        return results
+    
+    def _scan_commits(self, repo_path: Path) -> List[Dict[str, Any]]:
+        """Scan the diff of every commit reported by `git log`."""
         results = []
         
         # Get all commits
         commits = self._get_commits(repo_path)
+        if self.shard:
+            commits = [c for c in commits if self.shard.owns(c)]
         
         for commit in commits:
+            if self.limits and self.limits.exhausted:
+                break
+            
             commit_results = self._scan_commit(repo_path, commit)
             results.extend(commit_results)
         
         return results
     
     def _is_git_repo(self, path: Path) -> bool:
-        """Check if path is a Git repository."""
-        git_dir = path / ".git"
-        return git_dir.exists() and git_dir.is_dir()
+        """Check if path is a Git repository (work tree or bare)."""
+        return find_git_dir(path) is not None
+    
+    def _scan_objects(self, repo_path: Path) -> List[Dict[str, Any]]:
+        """Scan every blob in the object database across all refs.
+        
+        Each blob is read and matched once, then scored at every path it
+        appears at, since environment and severity depend on the path.
+        """
+        results = []
+        store = GitObjectStore(find_git_dir(repo_path))
+        
+        try:
+            for blob_sha, path, commit_hash in store.iter_blobs(self.include_unreachable):
+                if self.limits and self.limits.exhausted:
+                    break
+                
+                if self.shard and not self.shard.owns(blob_sha):
+                    continue
+                
+                filepath = Path(path) if path else Path(f"<unreachable blob {blob_sha[:12]}>")
+                # A blob is matched once; every path it appears at is scored separately
+                matched_lines = self.blob_cache.get(blob_sha)
+                if matched_lines is None:
+                    matched_lines = self._match_object(store, blob_sha)
+                else:
+                    self.stats.add(duplicate_files=1)
+                
+                for line_num, line, line_matches, end_line in matched_lines:
+                    self._score_matches(line_matches, line, line_num, filepath, commit_hash,
+                                        results, end_line)
+        finally:
+            store.close()
+        
+        return results
+    
+    def _match_object(self, store: GitObjectStore, blob_sha: str) -> tuple:
+        """Read and match a blob, caching its matches under the blob id."""
+        started = time.perf_counter()
+        try:
+            # The size is in the object header; oversized blobs are never inflated
+            size = store.object_size(blob_sha)
+            if size is not None and size > self.MAX_BLOB_SIZE:
+                self.stats.skip("size")
+                matched_lines = ()
+            else:
+                _obj_type, data = store.read(blob_sha)
+                self.stats.add_stage_time("read", time.perf_counter() - started)
+                matched_lines = self._match_blob(data)
+        except (KeyError, ValueError, IndexError, zlib.error):
+            self.stats.skip("unreadable")
+            matched_lines = ()
+        
+        # Matching cut short by the limits is not cached, so it is never reused as complete
+        if not (self.limits and self.limits.exhausted):
+            self.blob_cache.put(blob_sha, matched_lines)
+        return matched_lines
+    
+    def _match_blob(self, data: bytes) -> tuple:
+        """Raw matches of a blob's lines: (line number, line, matches, end line) entries.
+        
+        Binaries and oversized blobs are skipped, as the filesystem scanner does.
+        """
+        if len(data) > self.MAX_BLOB_SIZE:
+            self.stats.skip("size")
+            return ()
+        if b"\0" in data[:8000]:
+            self.stats.skip("binary")
+            return ()
+        
+        started = time.perf_counter()
+        lines, fell_back = decode_lines(data)
+        if fell_back:
+            self.stats.add(decode_fallbacks=1)
+        self.stats.add(blobs_scanned=1, bytes_scanned=len(data), lines_scanned=len(lines))
+        
+        matched_lines = []
+        blocks = self.block_matcher.stream()
+        for line_num, line in enumerate(lines, 1):
+            line_matches = self.line_cache.match(line)
+            if line_matches:
+                matched_lines.append((line_num, line, line_matches, None))
+            if blocks and (blocks.in_block or "-----BEGIN " in line):
+                for block in blocks.feed(line, line_num):
+                    block_matches = [(block.detector, [(block.pattern_info, block.secret)])]
+                    matched_lines.append((block.start_line, block.line, block_matches, block.end_line))
+            
+            if self.limits and self.limits.exhausted:
+                break
+        
+        self.stats.add_stage_time("match", time.perf_counter() - started)
+        return tuple(matched_lines)
+    
+    def _score_matches(self, line_matches: list, line: str, line_num: int,
+                       filepath: Optional[Path], commit_hash: Optional[str],
+                       results: List[Dict[str, Any]], end_line: Optional[int] = None):
+        """Turn one line's (or block's) raw matches into results."""
+        if IGNORE_MARKER in line:
+            self.stats.suppress("inline")
+            return
+        
+        for detector, matches in line_matches:
+            detector_results = detector.build_results(
+                matches, line, line_num, filepath, commit_hash=commit_hash
+            )
+            if end_line is not None:
+                for result in detector_results:
+                    result["end_line"] = end_line
+            if detector_results:
+                detector_results = self._triage(detector_results)
+                if self.limits:
+                    detector_results = self.limits.admit(detector_results)
+                results.extend(detector_results)
+    
+    def _score_blocks(self, blocks: list, filepath: Optional[Path],
+                      commit_hash: Optional[str], results: List[Dict[str, Any]]):
+        """Turn the multi-line blocks completed by a line into results."""
+        for block in blocks:
+            self._score_matches(
+                [(block.detector, [(block.pattern_info, block.secret)])], block.line,
+                block.start_line, filepath, commit_hash, results, block.end_line,
+            )
+    
+    def _triage(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fingerprint results and drop those already in the baseline."""
+        for result in results:
+            result["fingerprint"] = fingerprint(result)
+        if self.baseline is not None:
+            new_results = self.baseline.filter(results)
+            self.stats.suppress("baseline", len(results) - len(new_results))
+            return new_results
+        return results
     
     def _get_commits(self, repo_path: Path) -> List[str]:
         """Get list of commit hashes."""
@@ -68,32 +247,47 @@ class GitHistoryScanner:
         results = []
         
         # Get diff for this commit
+        started = time.perf_counter()
         diff = self._get_commit_diff(repo_path, commit_hash)
+        read_done = time.perf_counter()
+        self.stats.add(commits_scanned=1, bytes_scanned=len(diff))
         
         # Parse diff and scan each line
         current_file = None
         line_num = 0
+        added_lines = 0
+        blocks = None
         
         for line in diff.split("\n"):
             # Check for file header
             if line.startswith("+++ b/"):
                 current_file = line[6:]  # Remove "+++ b/" prefix
                 line_num = 0
+                blocks = self.block_matcher.stream()
             elif line.startswith("+") and not line.startswith("++"):
                 # Added line
                 line_num += 1
                 line_content = line[1:]  # Remove "+" prefix
+                added_lines += 1
+                filepath = Path(current_file) if current_file else None
+                
+                line_matches = self.line_cache.match(line_content)
+                if line_matches:
+                    self._score_matches(line_matches, line_content, line_num, filepath,
+                                        commit_hash, results)
+                if blocks and (blocks.in_block or "-----BEGIN " in line_content):
+                    self._score_blocks(blocks.feed(line_content, line_num), filepath,
+                                       commit_hash, results)
                 
-                for detector in self.detectors:
-                    detector_results = detector.scan_line(
-                        line_content, 
-                        line_num, 
-                        Path(current_file) if current_file else None,
-                        commit_hash=commit_hash
-                    )
-                    if detector_results:
-                        results.extend(detector_results)
+                if self.limits and self.limits.exhausted:
+                    break
+            elif blocks and blocks.in_block:
+                # Only blocks added as a whole are reported
+                blocks = self.block_matcher.stream()
         
+        self.stats.add(lines_scanned=added_lines)
+        self.stats.add_stage_time("read", read_done - started)
+        self.stats.add_stage_time("match", time.perf_counter() - read_done)
         return results
     
     def _get_commit_diff(self, repo_path: Path, commit_hash: str) -> str:
@@ -0,0 +1,234 @@
+import json
+import os
+import struct
+import subprocess
+from pathlib import Path
+from typing import List, Dict, Optional, NamedTuple
+
+from secrettrack.scanner.git_objects import find_common_dir, find_git_dir, object_hash_len
+
+
+# Fixed-size part of an index entry: ctime, mtime, dev, ino, mode, uid, gid, size, object id, flags
+_ENTRIES = {hash_len: struct.Struct(f">10I{hash_len}sH") for hash_len in (20, 32)}
+
+# Entry flags
+_FLAG_EXTENDED = 0x4000
+_FLAG_STAGE_MASK = 0x3000
+_EXT_SKIP_WORKTREE = 0x4000
+
+_REGULAR_FILE = 0o100000
+
+# Index extensions that move entries elsewhere; those indexes are listed through git
+_UNSUPPORTED_EXTENSIONS = {b"link", b"sdir"}
+
+
+class IndexEntry(NamedTuple):
+    """A regular file tracked in the git index, with its cached stat data."""
+    path: str
+    sha: str
+    size: int
+    mtime_s: int
+    mtime_ns: int
+    ctime_s: int
+    ino: int
+
+
+def find_work_tree(path: Path) -> Optional[Path]:
+    """Return the work tree root containing path, if it is inside a git checkout."""
+    for candidate in [path] + list(path.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return None
+
+
+def read_index(index_path: Path, hash_len: int = 20) -> List[IndexEntry]:
+    """Parse a version 2, 3 or 4 index file in one sequential read.
+    
+    hash_len is the object id length of the repository (32 for sha256).
+    Raises ValueError for index files this parser does not handle (split or
+    sparse indexes), so the caller can fall back to `git ls-files`.
+    """
+    with open(index_path, "rb") as f:
+        data = f.read()
+    
+    if len(data) < 12 or data[:4] != b"DIRC":
+        raise ValueError(f"{index_path} is not a git index")
+    version, count = struct.unpack_from(">II", data, 4)
+    if version not in (2, 3, 4):
+        raise ValueError(f"Unsupported git index version {version}")
+    
+    entry_struct = _ENTRIES[hash_len]
+    entries = []
+    offset = 12
+    previous_path = b""
+    
+    for _ in range(count):
+        start = offset
+        (ctime_s, _ctime_ns, mtime_s, mtime_ns, _dev, ino, mode, _uid, _gid, size,
+         sha, flags) = entry_struct.unpack_from(data, offset)
+        offset += entry_struct.size
+        
+        extended = 0
+        if flags & _FLAG_EXTENDED:
+            extended, = struct.unpack_from(">H", data, offset)
+            offset += 2
+        
+        if version == 4:
+            # Path is stored as "drop N bytes from the previous path, then append"
+            byte = data[offset]
+            offset += 1
+            strip = byte & 0x7F
+            while byte & 0x80:
+                byte = data[offset]
+                offset += 1
+                strip = ((strip + 1) << 7) | (byte & 0x7F)
+            end = data.index(b"\0", offset)
+            path = previous_path[:len(previous_path) - strip] + data[offset:end]
+            offset = end + 1
+        else:
+            end = data.index(b"\0", offset)
+            path = data[offset:end]
+            # Entries are NUL-padded to a multiple of 8 bytes
+            offset = start + ((end - start + 8) & ~7)
+        previous_path = path
+        
+        if mode & 0o170000 != _REGULAR_FILE:
+            continue  # Symlinks, submodules and sparse directory entries
+        if flags & _FLAG_STAGE_MASK or extended & _EXT_SKIP_WORKTREE:
+            continue  # Unmerged stages and files outside a sparse checkout
+        
+        entries.append(IndexEntry(
+            path.decode("utf-8", "surrogateescape"), sha.hex(), size,
+            mtime_s, mtime_ns, ctime_s, ino,
+        ))
+    
+    # Extensions follow the entries; the index ends with a checksum of hash_len bytes
+    while offset + 8 <= len(data) - hash_len:
+        signature = data[offset:offset + 4]
+        length, = struct.unpack_from(">I", data, offset + 4)
+        if signature in _UNSUPPORTED_EXTENSIONS:
+            raise ValueError(f"Git index uses the unsupported '{signature.decode()}' extension")
+        offset += 8 + length
+    
+    return entries
+
+
+class GitFileLister:
+    """Lists the files of a checkout from its git index instead of walking the tree."""
+    
+    def __init__(self, work_tree: Path, include_untracked: bool = False):
+        self.work_tree = work_tree
+        self.git_dir = find_git_dir(work_tree)
+        self.include_untracked = include_untracked
+        self.entries: Dict[Path, IndexEntry] = {}
+        self.index_mtime_ns = 0
+    
+    def list_files(self) -> List[Path]:
+        """Tracked files (plus untracked, non-ignored ones if requested)."""
+        index_path = self.git_dir / "index" if self.git_dir else None
+        try:
+            if index_path is None:
+                raise ValueError("No git directory")
+            entries = read_index(index_path, object_hash_len(find_common_dir(self.git_dir)))
+            self.index_mtime_ns = os.stat(index_path).st_mtime_ns
+            self.entries = {self.work_tree / e.path: e for e in entries}
+            files = list(self.entries)
+        except (OSError, ValueError):
+            # No index yet, or a format only git itself understands
+            self.entries = {}
+            files = self._ls_files("--cached")
+        
+        if self.include_untracked:
+            files.extend(self._ls_files("--others", "--exclude-standard"))
+        return files
+    
+    def _ls_files(self, *options: str) -> List[Path]:
+        try:
+            result = subprocess.run(
+                ["git", "ls-files", "-z", *options],
+                cwd=self.work_tree,
+                capture_output=True,
+                timeout=60,
+            )
+        except (subprocess.SubprocessError, FileNotFoundError):
+            return []
+        names = result.stdout.decode("utf-8", "surrogateescape").split("\0")
+        return list(dict.fromkeys(self.work_tree / name for name in names if name))
+    
+    def blob_sha(self, filepath: Path) -> Optional[str]:
+        """Return the indexed blob id if the file on disk still matches the index.
+        
+        Like git, this trusts the cached stat data: a file whose size,
+        mtime, ctime and inode are unchanged has the indexed content. Files
+        modified in the same instant the index was written ("racily clean")
+        are treated as changed.
+        """
+        entry = self.entries.get(filepath)
+        if entry is None:
+            return None
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return None
+        
+        if (st.st_size & 0xFFFFFFFF != entry.size
+                or int(st.st_mtime) & 0xFFFFFFFF != entry.mtime_s
+                or (entry.mtime_ns and st.st_mtime_ns % 1_000_000_000 != entry.mtime_ns)
+                or int(st.st_ctime) & 0xFFFFFFFF != entry.ctime_s
+                or (entry.ino and st.st_ino & 0xFFFFFFFF != entry.ino)):
+            return None
+        if st.st_mtime_ns >= self.index_mtime_ns:
+            return None
+        return entry.sha
+
+
+class ScanState:
+    """Blob ids of the files scanned by a previous --tracked-only run.
+    
+    The state is tied to a digest of the scan settings (detectors, rule
+    packs, severities, engine, baseline); a state saved with other
+    settings is ignored, since unchanged files may now have findings.
+    """
+    
+    VERSION = 2
+    
+    def __init__(self, files: Optional[Dict[str, str]] = None, settings: str = ""):
+        self.files = files or {}
+        self.settings = settings
+        self.scanned: Dict[str, str] = {}
+    
+    @classmethod
+    def load(cls, path: Path, settings: str = "") -> "ScanState":
+        """Load a state file; a missing file or one saved with other settings gives an empty state."""
+        if not path.exists():
+            return cls(settings=settings)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Cannot read scan state '{path}': {e}")
+        if state.get("version") not in (1, cls.VERSION) or not isinstance(state.get("files"), dict):
+            raise ValueError(f"Scan state '{path}' has an unsupported format")
+        if state.get("settings") != settings:
+            return cls(settings=settings)
+        return cls(state["files"], settings)
+    
+    def unchanged(self, key: str, sha: Optional[str]) -> bool:
+        """True if the file had the same blob id when it was last scanned."""
+        return sha is not None and self.files.get(key) == sha
+    
+    def record(self, key: str, sha: Optional[str]):
+        """Remember a file's blob id for the next run."""
+        if sha is not None:
+            self.scanned[key] = sha
+    
+    def save(self, path: Path):
+        """Write the state: files scanned now plus files skipped as unchanged."""
+        tmp_path = Path(f"{path}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": self.VERSION,
+                "settings": self.settings,
+                "files": dict(sorted(self.scanned.items())),
+            }, f)
+        os.replace(tmp_path, path)
@@ -0,0 +1,651 @@
+import mmap
+import os
+import struct
+import zlib
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple, Iterator, Set
+
+
+# Object type numbers used in packfiles
+OBJ_COMMIT = 1
+OBJ_TREE = 2
+OBJ_BLOB = 3
+OBJ_TAG = 4
+OBJ_OFS_DELTA = 6
+OBJ_REF_DELTA = 7
+
+TYPE_NAMES = {OBJ_COMMIT: "commit", OBJ_TREE: "tree", OBJ_BLOB: "blob", OBJ_TAG: "tag"}
+TYPE_NUMBERS = {name: num for num, name in TYPE_NAMES.items()}
+
+
+def find_git_dir(path: Path) -> Optional[Path]:
+    """Locate the git directory of a work tree, gitfile checkout or bare repository."""
+    dot_git = path / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    if dot_git.is_file():
+        # Worktrees and submodules use a "gitdir: <path>" file
+        try:
+            content = dot_git.read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        if content.startswith("gitdir:"):
+            git_dir = Path(content[7:].strip())
+            if not git_dir.is_absolute():
+                git_dir = path / git_dir
+            return git_dir if git_dir.is_dir() else None
+        return None
+    if (path / "HEAD").is_file() and (path / "objects").is_dir() and (path / "refs").is_dir():
+        return path
+    return None
+
+
+def find_common_dir(git_dir: Path) -> Path:
+    """The directory holding objects, refs and config; differs from git_dir in linked worktrees."""
+    try:
+        common = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+    except OSError:
+        return git_dir
+    common_dir = Path(common)
+    if not common_dir.is_absolute():
+        common_dir = (git_dir / common_dir).resolve()
+    return common_dir if common_dir.is_dir() else git_dir
+
+
+def object_hash_len(common_dir: Path) -> int:
+    """Length in bytes of object ids: 32 in sha256 repositories, otherwise 20."""
+    try:
+        config = (common_dir / "config").read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return 20
+    for line in config.splitlines():
+        key, _, value = line.strip().partition("=")
+        if key.strip().lower() == "objectformat":
+            return 32 if value.strip().lower() == "sha256" else 20
+    return 20
+
+
+class PackFile:
+    """Read access to one packfile through its .idx, both memory-mapped."""
+    
+    def __init__(self, pack_path: Path, hash_len: int = 20):
+        self.pack_path = pack_path
+        self.hash_len = hash_len
+        self._pack_fd = open(pack_path, "rb")
+        self._idx_fd = open(pack_path.with_suffix(".idx"), "rb")
+        self.pack = mmap.mmap(self._pack_fd.fileno(), 0, access=mmap.ACCESS_READ)
+        self.idx = mmap.mmap(self._idx_fd.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        if self.pack[:4] != b"PACK":
+            raise ValueError(f"{pack_path} is not a packfile")
+        self._parse_index()
+    
+    def _parse_index(self):
+        idx = self.idx
+        if idx[:4] == b"\377tOc":
+            version = struct.unpack(">I", idx[4:8])[0]
+            if version != 2:
+                raise ValueError(f"Unsupported pack index version {version}")
+            fanout_start = 8
+            self.count = struct.unpack(">I", idx[fanout_start + 255 * 4:fanout_start + 256 * 4])[0]
+            self._names_start = fanout_start + 256 * 4
+            self._name_stride = self.hash_len
+            crc_start = self._names_start + self.count * self.hash_len
+            self._offsets_start = crc_start + self.count * 4
+            self._large_offsets_start = self._offsets_start + self.count * 4
+            self._version = 2
+        else:
+            # Version 1: fanout, then (4-byte offset, name) entries
+            self.count = struct.unpack(">I", idx[255 * 4:256 * 4])[0]
+            self._names_start = 256 * 4 + 4
+            self._name_stride = 4 + self.hash_len
+            self._version = 1
+        self._fanout_start = 8 if self._version == 2 else 0
+    
+    def _name_at(self, i: int) -> bytes:
+        start = self._names_start + i * self._name_stride
+        return self.idx[start:start + self.hash_len]
+    
+    def _offset_at(self, i: int) -> int:
+        if self._version == 1:
+            start = 256 * 4 + i * self._name_stride
+            return struct.unpack(">I", self.idx[start:start + 4])[0]
+        
+        start = self._offsets_start + i * 4
+        offset = struct.unpack(">I", self.idx[start:start + 4])[0]
+        if offset & 0x80000000:
+            large = self._large_offsets_start + (offset & 0x7FFFFFFF) * 8
+            offset = struct.unpack(">Q", self.idx[large:large + 8])[0]
+        return offset
+    
+    def find(self, sha: bytes) -> Optional[int]:
+        """Return the pack offset of an object, or None if it is not in this pack."""
+        first = sha[0]
+        fanout = self._fanout_start
+        lo = struct.unpack(">I", self.idx[fanout + (first - 1) * 4:fanout + first * 4])[0] if first else 0
+        hi = struct.unpack(">I", self.idx[fanout + first * 4:fanout + (first + 1) * 4])[0]
+        
+        while lo < hi:
+            mid = (lo + hi) // 2
+            name = self._name_at(mid)
+            if name < sha:
+                lo = mid + 1
+            elif name > sha:
+                hi = mid
+            else:
+                return self._offset_at(mid)
+        return None
+    
+    def iter_entries(self) -> Iterator[Tuple[bytes, int]]:
+        """Yield (sha, offset) for every object in the pack."""
+        for i in range(self.count):
+            yield self._name_at(i), self._offset_at(i)
+    
+    def read_header(self, offset: int) -> Tuple[int, int, int]:
+        """Return (type, size, data_offset) of the entry at offset."""
+        pack = self.pack
+        c = pack[offset]
+        obj_type = (c >> 4) & 0x7
+        size = c & 0x0F
+        shift = 4
+        pos = offset + 1
+        while c & 0x80:
+            c = pack[pos]
+            pos += 1
+            size |= (c & 0x7F) << shift
+            shift += 7
+        return obj_type, size, pos
+    
+    def ofs_delta_base(self, pos: int) -> Tuple[int, int]:
+        """Decode an OFS_DELTA base distance, returning (distance, data_offset)."""
+        pack = self.pack
+        c = pack[pos]
+        pos += 1
+        distance = c & 0x7F
+        while c & 0x80:
+            c = pack[pos]
+            pos += 1
+            distance = ((distance + 1) << 7) | (c & 0x7F)
+        return distance, pos
+    
+    def inflate_prefix(self, pos: int, size: int) -> bytes:
+        """Decompress only the first size bytes of the zlib stream at pos."""
+        decompressor = zlib.decompressobj()
+        return decompressor.decompress(self.pack[pos:pos + 256 + size], size)
+    
+    def inflate(self, pos: int, size: int) -> bytes:
+        """Decompress the zlib stream starting at pos, expected to yield size bytes."""
+        decompressor = zlib.decompressobj()
+        view = memoryview(self.pack)
+        chunk = max(size + 64, 4096)
+        out = []
+        try:
+            while not decompressor.eof and pos < len(self.pack):
+                out.append(decompressor.decompress(view[pos:pos + chunk]))
+                pos += chunk
+                chunk *= 2
+        finally:
+            view.release()
+        return b"".join(out)
+    
+    def close(self):
+        self.pack.close()
+        self.idx.close()
+        self._pack_fd.close()
+        self._idx_fd.close()
+
+
+def delta_target_size(delta: bytes) -> int:
+    """Read the size of the object a delta produces from the delta's header."""
+    pos = 0
+    sizes = []
+    for _ in range(2):  # Source size, then target size
+        value = shift = 0
+        while True:
+            c = delta[pos]
+            pos += 1
+            value |= (c & 0x7F) << shift
+            shift += 7
+            if not c & 0x80:
+                break
+        sizes.append(value)
+    return sizes[1]
+
+
+def apply_delta(base: bytes, delta: bytes) -> bytes:
+    """Apply a git delta to its base object."""
+    pos = 0
+    
+    def read_varint() -> int:
+        nonlocal pos
+        value = shift = 0
+        while True:
+            c = delta[pos]
+            pos += 1
+            value |= (c & 0x7F) << shift
+            shift += 7
+            if not c & 0x80:
+                return value
+    
+    read_varint()  # Source size
+    target_size = read_varint()
+    out = bytearray()
+    delta_len = len(delta)
+    
+    while pos < delta_len:
+        op = delta[pos]
+        pos += 1
+        if op & 0x80:
+            copy_offset = copy_size = 0
+            for i in range(4):
+                if op & (1 << i):
+                    copy_offset |= delta[pos] << (8 * i)
+                    pos += 1
+            for i in range(3):
+                if op & (1 << (4 + i)):
+                    copy_size |= delta[pos] << (8 * i)
+                    pos += 1
+            if copy_size == 0:
+                copy_size = 0x10000
+            out += base[copy_offset:copy_offset + copy_size]
+        elif op:
+            out += delta[pos:pos + op]
+            pos += op
+        else:
+            raise ValueError("Invalid delta opcode 0")
+    
+    if len(out) != target_size:
+        raise ValueError("Delta produced an object of the wrong size")
+    return bytes(out)
+
+
+class GitObjectStore:
+    """Reads objects straight from a repository's loose objects and packfiles."""
+    
+    # Bytes of resolved delta bases kept around for the next delta in a chain
+    BASE_CACHE_BYTES = 32 * 1024 * 1024
+    
+    def __init__(self, git_dir: Path):
+        self.git_dir = git_dir
+        # Linked worktrees keep HEAD in their own directory and share the rest
+        self.common_dir = find_common_dir(git_dir)
+        self.hash_len = object_hash_len(self.common_dir)
+        self.object_dirs = self._object_dirs()
+        self.packs: List[PackFile] = []
+        for objects_dir in self.object_dirs:
+            pack_dir = objects_dir / "pack"
+            if pack_dir.is_dir():
+                for pack_path in sorted(pack_dir.glob("*.pack")):
+                    if pack_path.with_suffix(".idx").exists():
+                        self.packs.append(PackFile(pack_path, self.hash_len))
+        self._base_cache: "OrderedDict[Tuple[int, int], Tuple[int, bytes]]" = OrderedDict()
+        self._base_cache_bytes = 0
+    
+    def _object_dirs(self) -> List[Path]:
+        """The repository's object directory plus any alternates."""
+        dirs = [self.common_dir / "objects"]
+        alternates = self.common_dir / "objects" / "info" / "alternates"
+        if alternates.is_file():
+            for line in alternates.read_text(encoding="utf-8").splitlines():
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    alt = Path(line)
+                    if not alt.is_absolute():
+                        alt = (self.common_dir / "objects" / alt).resolve()
+                    if alt.is_dir():
+                        dirs.append(alt)
+        return dirs
+    
+    def close(self):
+        for pack in self.packs:
+            pack.close()
+        self.packs = []
+        self._base_cache.clear()
+    
+    # References
+    
+    def refs(self) -> Dict[str, str]:
+        """Return every ref (branches, tags, remotes, stash, HEADs) mapped to its object id."""
+        refs: Dict[str, str] = {}
+        
+        packed_refs = self.common_dir / "packed-refs"
+        if packed_refs.is_file():
+            last_ref = None
+            for line in packed_refs.read_text(encoding="utf-8").splitlines():
+                if not line or line.startswith("#"):
+                    continue
+                if line.startswith("^") and last_ref:
+                    # Peeled tag target
+                    refs[last_ref + "^{}"] = line[1:].strip()
+                    continue
+                sha, _, name = line.partition(" ")
+                refs[name.strip()] = sha
+                last_ref = name.strip()
+        
+        refs_dir = self.common_dir / "refs"
+        for root, _dirs, files in os.walk(refs_dir):
+            for name in files:
+                ref_path = Path(root) / name
+                try:
+                    content = ref_path.read_text(encoding="utf-8").strip()
+                except (OSError, UnicodeDecodeError):
+                    continue
+                ref_name = ref_path.relative_to(self.common_dir).as_posix()
+                resolved = self._resolve_ref_content(content)
+                if resolved:
+                    refs[ref_name] = resolved
+        
+        # Every worktree's HEAD, which may be a detached commit no branch points to
+        heads = {"HEAD": self.git_dir / "HEAD"}
+        if self.common_dir != self.git_dir:
+            heads["main/HEAD"] = self.common_dir / "HEAD"
+        worktrees_dir = self.common_dir / "worktrees"
+        if worktrees_dir.is_dir():
+            for worktree in sorted(worktrees_dir.iterdir()):
+                heads[f"worktrees/{worktree.name}/HEAD"] = worktree / "HEAD"
+        for name, head_path in heads.items():
+            try:
+                head = head_path.read_text(encoding="utf-8").strip()
+            except OSError:
+                continue
+            resolved = self._resolve_ref_content(head, refs)
+            if resolved:
+                refs[name] = resolved
+        
+        # Older stash entries only live in the stash reflog
+        stash_log = self.common_dir / "logs" / "refs" / "stash"
+        if stash_log.is_file():
+            for i, line in enumerate(stash_log.read_text(encoding="utf-8", errors="replace").splitlines()):
+                parts = line.split(" ", 2)
+                if len(parts) >= 2 and self._is_object_id(parts[1]):
+                    refs[f"stash@{{{i}}}"] = parts[1]
+        
+        return refs
+    
+    def _is_object_id(self, value: str) -> bool:
+        return len(value) == self.hash_len * 2 and all(c in "0123456789abcdef" for c in value)
+    
+    def _resolve_ref_content(self, content: str, refs: Optional[Dict[str, str]] = None) -> Optional[str]:
+        seen = set()
+        while content.startswith("ref:"):
+            target = content[4:].strip()
+            if target in seen:
+                return None
+            seen.add(target)
+            if refs and target in refs:
+                return refs[target]
+            # Per-worktree refs (refs/bisect, refs/worktree) before the shared ones
+            for base_dir in (self.git_dir, self.common_dir):
+                try:
+                    content = (base_dir / target).read_text(encoding="utf-8").strip()
+                    break
+                except OSError:
+                    continue
+            else:
+                return None
+        return content if self._is_object_id(content) else None
+    
+    # Object access
+    
+    def _loose_path(self, hex_sha: str) -> Optional[Path]:
+        for objects_dir in self.object_dirs:
+            path = objects_dir / hex_sha[:2] / hex_sha[2:]
+            if path.is_file():
+                return path
+        return None
+    
+    def _read_loose(self, path: Path) -> Tuple[str, bytes]:
+        with open(path, "rb") as f:
+            raw = zlib.decompress(f.read())
+        header, _, data = raw.partition(b"\0")
+        obj_type, _, _size = header.decode("ascii").partition(" ")
+        return obj_type, data
+    
+    def _cache_base(self, key: Tuple[int, int], obj_type: int, data: bytes):
+        if len(data) > self.BASE_CACHE_BYTES // 4:
+            return
+        self._base_cache[key] = (obj_type, data)
+        self._base_cache_bytes += len(data)
+        while self._base_cache_bytes > self.BASE_CACHE_BYTES:
+            _key, (_t, evicted) = self._base_cache.popitem(last=False)
+            self._base_cache_bytes -= len(evicted)
+    
+    def _read_packed(self, pack_index: int, offset: int) -> Tuple[int, bytes]:
+        """Read and fully resolve the pack entry at offset."""
+        chain = []
+        pack = self.packs[pack_index]
+        key = (pack_index, offset)
+        
+        # Walk down the delta chain until a base object (or cached entry)
+        while True:
+            cached = self._base_cache.get(key)
+            if cached is not None:
+                self._base_cache.move_to_end(key)
+                obj_type, data = cached
+                break
+            
+            obj_type, size, pos = pack.read_header(offset)
+            if obj_type == OBJ_OFS_DELTA:
+                distance, pos = pack.ofs_delta_base(pos)
+                chain.append((key, pack, pos, size))
+                offset -= distance
+                key = (pack_index, offset)
+            elif obj_type == OBJ_REF_DELTA:
+                base_sha = bytes(pack.pack[pos:pos + self.hash_len])
+                chain.append((key, pack, pos + self.hash_len, size))
+                location = self._locate(base_sha)
+                if location is None:
+                    raise KeyError(f"Missing delta base {base_sha.hex()}")
+                if location[0] is None:
+                    type_name, data = self._read_loose(location[1])
+                    obj_type = TYPE_NUMBERS[type_name]
+                    break
+                pack_index, offset = location
+                pack = self.packs[pack_index]
+                key = (pack_index, offset)
+            else:
+                data = pack.inflate(pos, size)
+                break
+        
+        # Apply the deltas from the base upwards
+        for delta_key, delta_pack, pos, size in reversed(chain):
+            self._cache_base(key, obj_type, data)
+            data = apply_delta(data, delta_pack.inflate(pos, size))
+            key = delta_key
+        
+        return obj_type, data
+    
+    def _locate(self, sha: bytes):
+        """Return (pack_index, offset) or (None, loose_path) for an object."""
+        for i, pack in enumerate(self.packs):
+            offset = pack.find(sha)
+            if offset is not None:
+                return i, offset
+        path = self._loose_path(sha.hex())
+        if path:
+            return None, path
+        return None
+    
+    def read(self, hex_sha: str) -> Tuple[str, bytes]:
+        """Return (type, content) of an object."""
+        location = self._locate(bytes.fromhex(hex_sha))
+        if location is None:
+            raise KeyError(f"Object {hex_sha} not found")
+        if location[0] is None:
+            return self._read_loose(location[1])
+        obj_type, data = self._read_packed(*location)
+        return TYPE_NAMES[obj_type], data
+    
+    def object_type(self, hex_sha: str) -> Optional[str]:
+        """Return the type of an object, reading as little of it as possible."""
+        location = self._locate(bytes.fromhex(hex_sha))
+        if location is None:
+            return None
+        if location[0] is None:
+            with open(location[1], "rb") as f:
+                decompressor = zlib.decompressobj()
+                header = decompressor.decompress(f.read(256), 64)
+            return header.split(b" ", 1)[0].decode("ascii")
+        
+        pack_index, offset = location
+        pack = self.packs[pack_index]
+        while True:
+            obj_type, _size, pos = pack.read_header(offset)
+            if obj_type == OBJ_OFS_DELTA:
+                distance, _pos = pack.ofs_delta_base(pos)
+                offset -= distance
+            elif obj_type == OBJ_REF_DELTA:
+                return self.object_type(bytes(pack.pack[pos:pos + self.hash_len]).hex())
+            else:
+                return TYPE_NAMES.get(obj_type)
+    
+    def object_size(self, hex_sha: str) -> Optional[int]:
+        """Return the size of an object from its header, without inflating its content."""
+        location = self._locate(bytes.fromhex(hex_sha))
+        if location is None:
+            return None
+        if location[0] is None:
+            with open(location[1], "rb") as f:
+                decompressor = zlib.decompressobj()
+                header = decompressor.decompress(f.read(256), 64)
+            return int(header.split(b"\0", 1)[0].split(b" ", 1)[1])
+        
+        pack_index, offset = location
+        pack = self.packs[pack_index]
+        obj_type, size, pos = pack.read_header(offset)
+        if obj_type == OBJ_OFS_DELTA:
+            _distance, pos = pack.ofs_delta_base(pos)
+        elif obj_type == OBJ_REF_DELTA:
+            pos += self.hash_len
+        else:
+            return size
+        # A delta's header starts with the source and target sizes (at most 20 bytes)
+        return delta_target_size(pack.inflate_prefix(pos, 20))
+    
+    def iter_object_ids(self) -> Iterator[str]:
+        """Yield the id of every object in the store (loose and packed), once."""
+        seen: Set[str] = set()
+        for pack in self.packs:
+            for sha, _offset in pack.iter_entries():
+                hex_sha = sha.hex()
+                if hex_sha not in seen:
+                    seen.add(hex_sha)
+                    yield hex_sha
+        for objects_dir in self.object_dirs:
+            for prefix in sorted(objects_dir.glob("[0-9a-f][0-9a-f]")):
+                for path in prefix.iterdir():
+                    hex_sha = prefix.name + path.name
+                    if self._is_object_id(hex_sha) and hex_sha not in seen:
+                        seen.add(hex_sha)
+                        yield hex_sha
+    
+    # Graph walking
+    
+    def _parse_tree(self, data: bytes) -> Iterator[Tuple[str, str, str]]:
+        """Yield (mode, name, hex_sha) for each tree entry."""
+        pos = 0
+        end = len(data)
+        while pos < end:
+            space = data.index(b" ", pos)
+            nul = data.index(b"\0", space)
+            mode = data[pos:space].decode("ascii")
+            name = data[space + 1:nul].decode("utf-8", errors="replace")
+            sha = data[nul + 1:nul + 1 + self.hash_len].hex()
+            pos = nul + 1 + self.hash_len
+            yield mode, name, sha
+    
+    def iter_blobs(self, include_unreachable: bool = False) -> Iterator[Tuple[str, Optional[str], Optional[str]]]:
+        """Yield (blob_id, path, commit_id) for every distinct blob and path across all refs.
+        
+        A blob stored at several paths is yielded once per path, with the
+        commit it was first seen at there while walking history from the
+        newest ref tips. Trees already walked at the same path are skipped,
+        so unchanged subtrees cost nothing after the first commit. With
+        include_unreachable, dangling commits and blobs not referenced by
+        any ref are yielded as well.
+        """
+        seen_commits: Set[str] = set()
+        seen_trees: Set[str] = set()
+        seen_blobs: Set[str] = set()
+        # (object id, path) pairs: the same tree or blob is walked again at another path
+        seen_paths: Set[Tuple[str, str]] = set()
+        
+        def walk_commits(start: List[str]) -> Iterator[Tuple[str, Optional[str], Optional[str]]]:
+            queue = deque(start)
+            while queue:
+                sha = queue.popleft()
+                if sha in seen_commits:
+                    continue
+                seen_commits.add(sha)
+                try:
+                    obj_type, data = self.read(sha)
+                except (KeyError, ValueError, zlib.error):
+                    continue
+                
+                if obj_type == "tag":
+                    for line in data.split(b"\n"):
+                        if line.startswith(b"object "):
+                            queue.append(line[7:].decode("ascii").strip())
+                            break
+                    continue
+                if obj_type == "blob":
+                    if sha not in seen_blobs:
+                        seen_blobs.add(sha)
+                        yield sha, None, None
+                    continue
+                if obj_type == "tree":
+                    yield from walk_tree(sha, "", None)
+                    continue
+                if obj_type != "commit":
+                    continue
+                
+                tree = None
+                for line in data.split(b"\n"):
+                    if not line:
+                        break
+                    if line.startswith(b"tree "):
+                        tree = line[5:].decode("ascii").strip()
+                    elif line.startswith(b"parent "):
+                        queue.append(line[7:].decode("ascii").strip())
+                if tree:
+                    yield from walk_tree(tree, "", sha)
+        
+        def walk_tree(tree_sha: str, prefix: str, commit: Optional[str]):
+            stack = [(tree_sha, prefix)]
+            while stack:
+                sha, path = stack.pop()
+                if (sha, path) in seen_paths:
+                    continue
+                seen_paths.add((sha, path))
+                seen_trees.add(sha)
+                try:
+                    _obj_type, data = self.read(sha)
+                except (KeyError, ValueError, zlib.error):
+                    continue
+                for mode, name, entry_sha in self._parse_tree(data):
+                    entry_path = f"{path}{name}"
+                    if mode in ("40000", "040000"):
+                        stack.append((entry_sha, entry_path + "/"))
+                    elif mode == "160000":
+                        continue  # Submodule commit, lives in another repository
+                    elif (entry_sha, entry_path) not in seen_paths:
+                        seen_paths.add((entry_sha, entry_path))
+                        seen_blobs.add(entry_sha)
+                        yield entry_sha, entry_path, commit
+        
+        refs = self.refs()
+        # Sort so ordinary refs are walked before reflog-only stash entries
+        yield from walk_commits([refs[name] for name in sorted(refs, key=lambda r: r.startswith("stash@"))])
+        
+        if include_unreachable:
+            unreachable = [sha for sha in self.iter_object_ids()
+                           if sha not in seen_commits and sha not in seen_trees and sha not in seen_blobs]
+            # Dangling commits first, so their blobs are reported with a path
+            commits = [sha for sha in unreachable if self.object_type(sha) == "commit"]
+            yield from walk_commits(commits)
+            for sha in unreachable:
+                if sha not in seen_blobs and sha not in seen_trees and sha not in seen_commits:
+                    if self.object_type(sha) == "blob":
+                        seen_blobs.add(sha)
+                        yield sha, None, None
\ No newline at end of file
@@ -0,0 +1,85 @@
+import time
+from typing import List, Dict, Any, Optional, Iterable
+
+from secrettrack.detectors.base import SEVERITY_LEVELS
+
+
+class ScanLimits:
+    """Severity filter and stop conditions applied inside the scan loop."""
+    
+    # Share of the time budget that listing and ranking files may use
+    ENUMERATION_SHARE = 0.5
+    
+    def __init__(self, severities: Optional[Iterable[str]] = None,
+                 fail_fast: Optional[str] = None,
+                 max_findings: Optional[int] = None,
+                 time_budget: Optional[float] = None):
+        self.severities = set(severities) if severities else set(SEVERITY_LEVELS)
+        unknown = (self.severities | ({fail_fast} if fail_fast else set())) - set(SEVERITY_LEVELS)
+        if unknown:
+            raise ValueError(
+                f"Unknown severity: {', '.join(sorted(unknown))}. "
+                f"Expected one of: {', '.join(SEVERITY_LEVELS)}"
+            )
+        if max_findings is not None and max_findings < 1:
+            raise ValueError("max_findings must be at least 1")
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError("time_budget must be positive")
+        
+        self.fail_fast = fail_fast
+        self.max_findings = max_findings
+        self.time_budget = time_budget
+        self.deadline: Optional[float] = None
+        self.enumeration_deadline: Optional[float] = None
+        self.findings = 0
+        self.stop_reason: Optional[str] = None
+    
+    @property
+    def exhausted(self) -> bool:
+        """True once a stop condition has been reached."""
+        return self.stop_reason is not None
+    
+    def admit(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Keep selected results and record them against the stop conditions."""
+        admitted = []
+        
+        for result in results:
+            if self.exhausted:
+                break
+            
+            severity = result.get("severity", "low").lower()
+            if severity not in self.severities:
+                continue
+            
+            admitted.append(result)
+            self.findings += 1
+            
+            if (self.fail_fast
+                    and SEVERITY_LEVELS.index(severity) >= SEVERITY_LEVELS.index(self.fail_fast)):
+                self.stop_reason = f"fail-fast: {severity} finding in {result.get('file')}"
+            elif self.max_findings is not None and self.findings >= self.max_findings:
+                self.stop_reason = f"max-findings: reached {self.max_findings} findings"
+        
+        return admitted
+    
+    def start_clock(self):
+        """Start counting the time budget, if any."""
+        if self.time_budget is not None:
+            now = time.monotonic()
+            self.deadline = now + self.time_budget
+            self.enumeration_deadline = now + self.time_budget * self.ENUMERATION_SHARE
+    
+    def enumeration_expired(self) -> bool:
+        """True once enumeration has used its share of the time budget."""
+        return self.enumeration_deadline is not None and time.monotonic() >= self.enumeration_deadline
+    
+    def check_deadline(self) -> bool:
+        """Stop once the time budget is spent; returns True if the scan should stop."""
+        if self.deadline is not None and not self.exhausted and time.monotonic() >= self.deadline:
+            self.stop_reason = f"time-budget: {self.time_budget:g}s spent"
+        return self.exhausted
+    
+    def stop(self, reason: str):
+        """Stop the scan for an external reason (e.g. interruption)."""
+        if not self.exhausted:
+            self.stop_reason = reason
\ No newline at end of file
@@ -0,0 +1,118 @@
+import hashlib
+from collections import OrderedDict
+from typing import List, Dict, Any, Hashable, Optional, Tuple
+
+from secrettrack.detectors.base import BaseDetector
+
+
+class LineMatchCache:
+    """Bounded LRU memo of raw detector matches, keyed by a hash of the line text.
+    
+    Generated code, vendored libraries and repeated headers produce the same
+    line many times. Only the pattern matching is memoised; the path
+    dependent confidence and context scoring is still done per location.
+    """
+    
+    def __init__(self, detectors: List[BaseDetector], max_entries: int = 65536):
+        self.detectors = detectors
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Tuple[Tuple[int, list], ...]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def match(self, line: str) -> List[Tuple[BaseDetector, list]]:
+        """Return (detector, raw matches) for each detector that matches the line."""
+        if self.max_entries <= 0:
+            return self._match(line)
+        
+        key = hashlib.blake2b(line.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        entry = self._entries.get(key)
+        
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        else:
+            self.misses += 1
+            entry = tuple(
+                (i, matches) for i, detector in enumerate(self.detectors)
+                for matches in (detector.find_matches(line),) if matches
+            )
+            self._entries[key] = entry
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        
+        return [(self.detectors[i], matches) for i, matches in entry]
+    
+    def _match(self, line: str) -> List[Tuple[BaseDetector, list]]:
+        results = []
+        for detector in self.detectors:
+            matches = detector.find_matches(line)
+            if matches:
+                results.append((detector, matches))
+        return results
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit-rate and eviction counters for sizing the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "max_entries": self.max_entries,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class ContentMatchCache:
+    """Bounded LRU of the matching lines of file contents already scanned.
+    
+    Vendored copies, per-service example configs and generated clients are
+    often byte-identical. Entries are keyed by (size, content hash), or by
+    blob id for git objects, so a duplicate skips the per-line matching
+    entirely; the caller still scores every match for the duplicate's own
+    path.
+    """
+    
+    def __init__(self, max_entries: int = 65536):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def key(self, data: bytes) -> Optional[Tuple[int, bytes]]:
+        """Identify a file's content, or None when the cache is disabled."""
+        if self.max_entries <= 0:
+            return None
+        return len(data), hashlib.blake2b(data, digest_size=16).digest()
+    
+    def get(self, key: Hashable) -> Optional[tuple]:
+        """Return the (line number, line, matches, end line) entries recorded for this content."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+    
+    def put(self, key: Hashable, matched_lines: tuple):
+        self._entries[key] = matched_lines
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit-rate and eviction counters; hits are duplicate files."""
+        lookups = self.hits + self.misses
+        return {
+            "max_entries": self.max_entries,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
\ No newline at end of file
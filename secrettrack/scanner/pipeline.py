@@ -0,0 +1,241 @@
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Iterable
+
+
+# Marks the end of a stage's output
+_DONE = object()
+
+
+class StageStats:
+    """Time a pipeline stage spent working versus waiting on its neighbours."""
+    
+    def __init__(self, name: str, threads: int = 1):
+        self.name = name
+        self.threads = threads
+        self.items = 0
+        self.busy = 0.0
+        self.waiting_input = 0.0
+        self.waiting_output = 0.0
+        self._lock = threading.Lock()
+    
+    def add(self, busy: float = 0.0, waiting_input: float = 0.0,
+            waiting_output: float = 0.0, items: int = 0):
+        with self._lock:
+            self.busy += busy
+            self.waiting_input += waiting_input
+            self.waiting_output += waiting_output
+            self.items += items
+    
+    def to_dict(self, wall_time: float) -> Dict[str, Any]:
+        capacity = wall_time * self.threads
+        return {
+            "threads": self.threads,
+            "items": self.items,
+            "busy_seconds": round(self.busy, 4),
+            "waiting_input_seconds": round(self.waiting_input, 4),
+            "waiting_output_seconds": round(self.waiting_output, 4),
+            "utilization": round(self.busy / capacity, 4) if capacity else 0.0,
+        }
+
+
+class ByteBudget:
+    """Caps the amount of file content buffered between readers and the matcher."""
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.in_use = 0
+        self._cond = threading.Condition()
+    
+    def acquire(self, size: int, stop: threading.Event) -> bool:
+        """Reserve size bytes; an oversized file is admitted once the buffer is empty."""
+        with self._cond:
+            while self.in_use and self.in_use + size > self.max_bytes:
+                if stop.is_set():
+                    return False
+                self._cond.wait(0.1)
+            self.in_use += size
+            return True
+    
+    def release(self, size: int):
+        with self._cond:
+            self.in_use -= size
+            self._cond.notify_all()
+
+
+class PrefetchPipeline:
+    """Walks, reads and matches files in overlapping stages.
+    
+    One thread walks the tree, a pool of reader threads prefetches file
+    contents and the calling thread runs the detectors. Bounded queues and
+    a byte budget provide backpressure, so slow storage keeps the matcher
+    fed without buffering the whole tree in memory.
+    """
+    
+    def __init__(self, scanner, readers: int = 4, queue_depth: int = 64,
+                 max_buffered_bytes: int = 64 * 1024 * 1024):
+        self.scanner = scanner
+        self.readers = max(1, readers)
+        self.queue_depth = max(1, queue_depth)
+        self.budget = ByteBudget(max_buffered_bytes)
+        self.stats: Dict[str, StageStats] = {}
+        self.wall_time = 0.0
+        # Exceptions raised in the walker or reader threads, re-raised by run()
+        self._errors: List[Exception] = []
+    
+    def _put(self, q: queue.Queue, item, stop: threading.Event) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _walk(self, files: Iterable[Path], path_queue: queue.Queue,
+              stop: threading.Event, stats: StageStats):
+        try:
+            iterator = iter(files)
+            seq = 0
+            while not stop.is_set():
+                started = time.perf_counter()
+                filepath = next(iterator, None)
+                stats.add(busy=time.perf_counter() - started)
+                if filepath is None:
+                    break
+                
+                started = time.perf_counter()
+                if not self._put(path_queue, (seq, filepath), stop):
+                    break
+                stats.add(waiting_output=time.perf_counter() - started, items=1)
+                seq += 1
+        except Exception as e:
+            # The readers still get their end markers, so the scan winds down normally
+            self._errors.append(e)
+        finally:
+            for _ in range(self.readers):
+                self._put(path_queue, _DONE, stop)
+    
+    def _read(self, path_queue: queue.Queue, content_queue: queue.Queue,
+              stop: threading.Event, stats: StageStats):
+        try:
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    item = path_queue.get(timeout=0.1)
+                except queue.Empty:
+                    stats.add(waiting_input=time.perf_counter() - started)
+                    continue
+                stats.add(waiting_input=time.perf_counter() - started)
+                if item is _DONE:
+                    break
+                
+                seq, filepath = item
+                limits = self.scanner.limits
+                if limits and limits.check_deadline():
+                    break
+                try:
+                    size = filepath.stat().st_size
+                except OSError:
+                    size = 0
+                
+                started = time.perf_counter()
+                if not self.budget.acquire(size, stop):
+                    break
+                stats.add(waiting_output=time.perf_counter() - started)
+                
+                started = time.perf_counter()
+                lines, content_key = self.scanner._read_file_content(filepath)
+                stats.add(busy=time.perf_counter() - started, items=1)
+                
+                started = time.perf_counter()
+                if not self._put(content_queue, (seq, filepath, lines, content_key, size), stop):
+                    self.budget.release(size)
+                    break
+                stats.add(waiting_output=time.perf_counter() - started)
+        except Exception as e:
+            self._errors.append(e)
+        finally:
+            self._put(content_queue, _DONE, stop)
+    
+    def run(self, files: Iterable[Path]) -> List[Dict[str, Any]]:
+        """Scan the given (already filtered) files, returning results in walk order.
+        
+        An exception raised while listing or reading files is re-raised here,
+        rather than returning the results scanned so far as if complete.
+        """
+        self._errors = []
+        path_queue: queue.Queue = queue.Queue(maxsize=self.queue_depth)
+        content_queue: queue.Queue = queue.Queue(maxsize=self.queue_depth)
+        stop = threading.Event()
+        
+        self.stats = {
+            "walk": StageStats("walk"),
+            "read": StageStats("read", self.readers),
+            "match": StageStats("match"),
+        }
+        
+        threads = [threading.Thread(
+            target=self._walk, args=(files, path_queue, stop, self.stats["walk"]),
+            name="secrettrack-walk", daemon=True,
+        )]
+        threads.extend(
+            threading.Thread(
+                target=self._read,
+                args=(path_queue, content_queue, stop, self.stats["read"]),
+                name=f"secrettrack-read-{i}", daemon=True,
+            )
+            for i in range(self.readers)
+        )
+        
+        results_by_seq: Dict[int, List[Dict[str, Any]]] = {}
+        match_stats = self.stats["match"]
+        limits = self.scanner.limits
+        wall_started = time.perf_counter()
+        
+        for thread in threads:
+            thread.start()
+        
+        try:
+            finished_readers = 0
+            while finished_readers < self.readers:
+                started = time.perf_counter()
+                item = content_queue.get()
+                match_stats.add(waiting_input=time.perf_counter() - started)
+                if item is _DONE:
+                    finished_readers += 1
+                    continue
+                
+                seq, filepath, lines, content_key, size = item
+                started = time.perf_counter()
+                try:
+                    results_by_seq[seq] = self.scanner._scan_lines(filepath, lines, content_key)
+                finally:
+                    self.budget.release(size)
+                match_stats.add(busy=time.perf_counter() - started, items=1)
+                
+                if limits and limits.exhausted:
+                    break
+        finally:
+            # Cancel in-flight work: readers and the walker exit on the stop flag
+            stop.set()
+            for thread in threads:
+                thread.join()
+            self.wall_time = time.perf_counter() - wall_started
+        
+        if self._errors:
+            raise self._errors[0]
+        
+        results = []
+        for seq in sorted(results_by_seq):
+            results.extend(results_by_seq[seq])
+        return results
+    
+    def stats_dict(self) -> Dict[str, Any]:
+        """Per-stage utilization of the last run."""
+        return {
+            "wall_seconds": round(self.wall_time, 4),
+            "stages": {name: s.to_dict(self.wall_time) for name, s in self.stats.items()},
+        }
\ No newline at end of file
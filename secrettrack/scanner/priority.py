@@ -0,0 +1,125 @@
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Optional, Set
+
+from secrettrack.analyzer.context import ContextAnalyzer
+from secrettrack.scanner.limits import ScanLimits
+
+
+class RiskScheduler:
+    """Orders files so the ones most likely to hold live secrets are scanned first.
+    
+    The score only uses cheap path signals the analyzers already rely on:
+    config file names and suffixes, environment keywords in the path and
+    the file type. Within a score, smaller files go first since they cost
+    less of the time budget.
+    """
+    
+    # Weights added to a file's risk score
+    CONFIG_WEIGHT = 8
+    KEY_MATERIAL_WEIGHT = 8
+    CONFIG_SUFFIX_WEIGHT = 5
+    SOURCE_WEIGHT = 3
+    SCRIPT_WEIGHT = 3
+    PRODUCTION_WEIGHT = 3
+    DOCUMENTATION_WEIGHT = -3
+    
+    CONFIG_SUFFIXES = {".env", ".json", ".yml", ".yaml", ".toml", ".ini", ".cfg", ".conf",
+                       ".properties", ".xml", ".tf", ".tfvars"}
+    KEY_MATERIAL_SUFFIXES = {".pem", ".key", ".ppk", ".p8", ".asc"}
+    DOCUMENTATION_DIRS = {"doc", "docs", "documentation", "examples", "samples"}
+    
+    # Files enumerated between checks of the enumeration deadline
+    DEADLINE_CHECK_INTERVAL = 64
+    
+    def __init__(self):
+        self.context_analyzer = ContextAnalyzer()
+        self.order: List[Dict[str, Any]] = []
+        self.enumeration_complete = True
+    
+    def score(self, filepath: Path) -> int:
+        """Expected risk of a file from its (scan-root relative) path alone."""
+        analyzer = self.context_analyzer
+        name = filepath.name.lower()
+        suffix = filepath.suffix.lower()
+        score = 0
+        
+        if analyzer._is_config_file(filepath) or name.startswith(".env"):
+            score += self.CONFIG_WEIGHT
+        if suffix in self.KEY_MATERIAL_SUFFIXES:
+            score += self.KEY_MATERIAL_WEIGHT
+        elif suffix in self.CONFIG_SUFFIXES:
+            score += self.CONFIG_SUFFIX_WEIGHT
+        
+        file_type = analyzer._get_file_type(filepath)
+        if file_type == "source_code":
+            score += self.SOURCE_WEIGHT
+        elif file_type == "script":
+            score += self.SCRIPT_WEIGHT
+        
+        parts = {part.lower() for part in filepath.parts[:-1]}
+        if file_type == "documentation" or parts & self.DOCUMENTATION_DIRS:
+            score += self.DOCUMENTATION_WEIGHT
+        
+        path_text = str(filepath).lower()
+        if any(keyword in path_text for keyword in analyzer.PROD_KEYWORDS):
+            score += self.PRODUCTION_WEIGHT
+        
+        return score
+    
+    def schedule(self, files: Iterable[Path], root: Path,
+                 limits: Optional[ScanLimits] = None) -> List[Path]:
+        """Return the files ordered from highest to lowest risk.
+        
+        Listing a large tree can take a sizable part of a time budget; once
+        enumeration has used its share, only the files found so far are
+        ranked and the rest of the tree is left unscanned.
+        """
+        order = []
+        self.enumeration_complete = True
+        for count, filepath in enumerate(files):
+            if limits and count % self.DEADLINE_CHECK_INTERVAL == 0 and limits.enumeration_expired():
+                self.enumeration_complete = False
+                break
+            try:
+                size = filepath.stat().st_size
+            except OSError:
+                size = 0
+            try:
+                relative = filepath.relative_to(root)
+            except ValueError:
+                relative = filepath
+            order.append({"path": filepath, "relative": relative, "size": size,
+                          "score": self.score(relative)})
+        
+        order.sort(key=lambda f: (-f["score"], f["size"], str(f["path"])))
+        self.order = order
+        return [f["path"] for f in order]
+    
+    def coverage(self, scanned: Set[Path]) -> Dict[str, Any]:
+        """Describe which part of the scheduled tree was scanned."""
+        scanned_bytes = 0
+        unscanned_dirs: Dict[str, int] = {}
+        lowest_scanned_score: Optional[int] = None
+        
+        for entry in self.order:
+            if entry["path"] in scanned:
+                scanned_bytes += entry["size"]
+                lowest_scanned_score = entry["score"]
+                continue
+            parts = entry["relative"].parts
+            top = parts[0] if len(parts) > 1 else "."
+            unscanned_dirs[top] = unscanned_dirs.get(top, 0) + 1
+        
+        total_bytes = sum(entry["size"] for entry in self.order)
+        return {
+            "files_scanned": len(scanned),
+            "files_total": len(self.order),
+            "bytes_scanned": scanned_bytes,
+            "bytes_total": total_bytes,
+            "ratio": round(scanned_bytes / total_bytes, 4) if total_bytes else 1.0,
+            "lowest_scanned_score": lowest_scanned_score,
+            # False when the time budget ran out before the whole tree was listed
+            "enumeration_complete": self.enumeration_complete,
+            # Files left unscanned, per top-level directory of the scanned path
+            "unscanned": dict(sorted(unscanned_dirs.items(), key=lambda item: -item[1])),
+        }
\ No newline at end of file
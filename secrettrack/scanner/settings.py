@@ -0,0 +1,35 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import List, Dict, Any
+
+from secrettrack import __version__
+
+
+def settings_digest(settings: Dict[str, Any]) -> str:
+    """Digest of the options a scan ran with, to tell whether saved results still apply.
+    
+    The tool version is always included, since detectors change between
+    releases.
+    """
+    canonical = json.dumps(dict(settings, version=__version__), sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def file_digest(path: Path) -> str:
+    """Content digest of a file the findings depend on, such as a rule pack or baseline."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return "unreadable"
+
+
+def rule_pack_digests(paths: List[str]) -> Dict[str, str]:
+    """Content digest of every rule pack file under the given --rules paths."""
+    from secrettrack.detectors.rules import find_rule_files
+    
+    digests = {}
+    for path in paths:
+        for rule_file in find_rule_files(Path(path)):
+            digests[str(rule_file)] = file_digest(rule_file)
+    return digests
\ No newline at end of file
@@ -0,0 +1,65 @@
+import hashlib
+import heapq
+from pathlib import Path
+from typing import List, Iterable
+
+
+class Shard:
+    """Deterministic slice i of N of a scan, for splitting work across machines."""
+    
+    def __init__(self, index: int, count: int):
+        if count < 1 or not 1 <= index <= count:
+            raise ValueError(f"Invalid shard {index}/{count}: expected 1 <= i <= N")
+        self.index = index
+        self.count = count
+    
+    @classmethod
+    def parse(cls, value: str) -> "Shard":
+        """Parse an "i/N" shard specification (1-based)."""
+        try:
+            index, count = (int(part) for part in value.split("/"))
+        except ValueError:
+            raise ValueError(f"Invalid shard '{value}': expected the form i/N, e.g. 1/4")
+        return cls(index, count)
+    
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+    
+    @staticmethod
+    def _stable_hash(key: str) -> int:
+        return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+    
+    def owns(self, key: str) -> bool:
+        """Check if a key (commit or blob id) belongs to this shard."""
+        return self._stable_hash(key) % self.count == self.index - 1
+    
+    def select_files(self, root: Path, files: Iterable[Path]) -> List[Path]:
+        """Return this shard's files, balancing bytes across shards.
+        
+        Every shard computes the same assignment: files are sorted by size
+        (largest first, ties broken by a hash of the path relative to the
+        scan root) and each goes to the currently lightest shard.
+        """
+        sized = []
+        for filepath in files:
+            try:
+                size = filepath.stat().st_size
+            except OSError:
+                continue
+            try:
+                relative = filepath.relative_to(root).as_posix()
+            except ValueError:
+                relative = filepath.as_posix()
+            sized.append((-size, self._stable_hash(relative), relative, filepath))
+        sized.sort()
+        
+        # (assigned bytes, shard number) so ties go to the lowest shard
+        loads = [(0, shard) for shard in range(self.count)]
+        selected = []
+        for neg_size, _key, _relative, filepath in sized:
+            assigned, shard = heapq.heappop(loads)
+            if shard == self.index - 1:
+                selected.append(filepath)
+            heapq.heappush(loads, (assigned - neg_size, shard))
+        
+        return selected
\ No newline at end of file
@@ -0,0 +1,161 @@
+import threading
+import time
+from typing import List, Dict, Any, Optional
+
+
+class ScanStats:
+    """Counters and timings collected while scanning, for monitoring.
+    
+    Skip reasons are size, extension, exclude, unreadable and unchanged
+    (--state-file) for files, and size, unreadable and binary for git
+    blobs. Content that is not valid UTF-8 is still scanned, decoded as
+    Latin-1, and counted in decode_fallbacks rather than skipped.
+    """
+    
+    STAGES = ("walk", "read", "match")
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.files_walked = 0
+        self.files_scanned = 0
+        self.files_skipped: Dict[str, int] = {}
+        self.decode_fallbacks = 0
+        self.bytes_scanned = 0
+        self.lines_scanned = 0
+        self.commits_scanned = 0
+        self.blobs_scanned = 0
+        self.findings: Dict[str, int] = {}
+        self.suppressed: Dict[str, int] = {}
+        self.stage_seconds: Dict[str, float] = {stage: 0.0 for stage in self.STAGES}
+        self.started: Optional[float] = None
+        self.duration = 0.0
+        self.duplicate_files = 0
+        self.line_cache: Dict[str, Any] = {}
+        self.content_cache: Dict[str, Any] = {}
+    
+    def start(self):
+        """Mark the beginning of a scan."""
+        self.started = time.perf_counter()
+    
+    def stop(self):
+        """Mark the end of a scan."""
+        if self.started is not None:
+            self.duration += time.perf_counter() - self.started
+            self.started = None
+    
+    def add(self, **counters):
+        """Increment counters by name, e.g. add(files_walked=1, bytes_scanned=42)."""
+        with self._lock:
+            for name, value in counters.items():
+                setattr(self, name, getattr(self, name) + value)
+    
+    def skip(self, reason: str):
+        """Record a file or blob skipped for the given reason."""
+        with self._lock:
+            self.files_skipped[reason] = self.files_skipped.get(reason, 0) + 1
+    
+    def suppress(self, reason: str, count: int = 1):
+        """Record findings suppressed by the baseline or lines by an inline marker."""
+        if count:
+            with self._lock:
+                self.suppressed[reason] = self.suppressed.get(reason, 0) + count
+    
+    def add_stage_time(self, stage: str, seconds: float):
+        with self._lock:
+            self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+    
+    def record_findings(self, results: List[Dict[str, Any]]):
+        with self._lock:
+            for result in results:
+                severity = result.get("severity", "low")
+                self.findings[severity] = self.findings.get(severity, 0) + 1
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Structured stats for the JSON report metadata."""
+        throughput = {
+            stage: round(self.bytes_scanned / seconds) if seconds else None
+            for stage, seconds in self.stage_seconds.items()
+        }
+        stats = {
+            "duration_seconds": round(self.duration, 4),
+            "files_walked": self.files_walked,
+            "files_scanned": self.files_scanned,
+            "files_skipped": dict(sorted(self.files_skipped.items())),
+            "decode_fallbacks": self.decode_fallbacks,
+            "bytes_scanned": self.bytes_scanned,
+            "lines_scanned": self.lines_scanned,
+            "duplicate_files": self.duplicate_files,
+            "findings": dict(sorted(self.findings.items())),
+            "suppressed": dict(sorted(self.suppressed.items())),
+            "stage_seconds": {k: round(v, 4) for k, v in self.stage_seconds.items()},
+            "stage_throughput_bytes_per_second": throughput,
+            "throughput_bytes_per_second": (
+                round(self.bytes_scanned / self.duration) if self.duration else None
+            ),
+        }
+        if self.commits_scanned or self.blobs_scanned:
+            stats["commits_scanned"] = self.commits_scanned
+            stats["blobs_scanned"] = self.blobs_scanned
+        if self.line_cache:
+            stats["line_cache"] = self.line_cache
+        if self.content_cache:
+            stats["content_cache"] = self.content_cache
+        return stats
+    
+    def to_prometheus(self, prefix: str = "secrettrack") -> str:
+        """Render the stats in the Prometheus text exposition format."""
+        lines = []
+        
+        def metric(name: str, metric_type: str, help_text: str, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {metric_type}")
+            for labels, value in samples:
+                label_str = ""
+                if labels:
+                    label_str = "{" + ",".join(f'{k}="{v}"' for k, v in labels.items()) + "}"
+                lines.append(f"{prefix}_{name}{label_str} {value}")
+        
+        metric("scan_duration_seconds", "gauge", "Wall-clock duration of the scan.",
+               [({}, round(self.duration, 6))])
+        metric("files_walked_total", "counter", "Files considered for scanning.",
+               [({}, self.files_walked)])
+        metric("files_scanned_total", "counter", "Files read and matched.",
+               [({}, self.files_scanned)])
+        metric("files_skipped_total", "counter", "Files or blobs skipped, by reason.",
+               [({"reason": r}, n) for r, n in sorted(self.files_skipped.items())])
+        metric("decode_fallbacks_total", "counter", "Files decoded as Latin-1 after UTF-8 failed.",
+               [({}, self.decode_fallbacks)])
+        metric("bytes_scanned_total", "counter", "Bytes of content scanned.",
+               [({}, self.bytes_scanned)])
+        metric("lines_scanned_total", "counter", "Lines of content scanned.",
+               [({}, self.lines_scanned)])
+        metric("duplicate_files_total", "counter",
+               "Files whose content matched an already scanned file.",
+               [({}, self.duplicate_files)])
+        if self.commits_scanned or self.blobs_scanned:
+            metric("commits_scanned_total", "counter", "Commits scanned.",
+                   [({}, self.commits_scanned)])
+            metric("blobs_scanned_total", "counter", "Git blobs scanned.",
+                   [({}, self.blobs_scanned)])
+        metric("findings_total", "counter", "Findings reported, by severity.",
+               [({"severity": s}, self.findings.get(s, 0))
+                for s in ("critical", "high", "medium", "low")])
+        metric("suppressed_total", "counter",
+               "Findings suppressed by the baseline, or lines by an inline ignore marker.",
+               [({"reason": r}, n) for r, n in sorted(self.suppressed.items())])
+        metric("stage_seconds", "gauge", "Time spent in each scan stage.",
+               [({"stage": s}, round(v, 6)) for s, v in self.stage_seconds.items()])
+        metric("stage_throughput_bytes_per_second", "gauge", "Bytes scanned per second of stage time.",
+               [({"stage": s}, round(self.bytes_scanned / v, 2))
+                for s, v in self.stage_seconds.items() if v])
+        for cache, counters in (("line_cache", self.line_cache), ("content_cache", self.content_cache)):
+            if counters:
+                label = cache.replace("_", " ").capitalize()
+                metric(f"{cache}_hits_total", "counter", f"{label} hits.",
+                       [({}, counters.get("hits", 0))])
+                metric(f"{cache}_misses_total", "counter", f"{label} misses.",
+                       [({}, counters.get("misses", 0))])
+                metric(f"{cache}_evictions_total", "counter", f"{label} evictions.",
+                       [({}, counters.get("evictions", 0))])
+        
+        return "\n".join(lines) + "\n"
\ No newline at end of file
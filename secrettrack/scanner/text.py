@@ -0,0 +1,20 @@
+import io
+from typing import List, Tuple
+
+
+def decode_lines(data: bytes) -> Tuple[List[str], bool]:
+    """Decode file or blob content into lines, and whether Latin-1 was needed.
+    
+    Lines are split with universal newlines, as reading in text mode does:
+    only \\n, \\r\\n and \\r end a line, not the form feeds and Unicode
+    separators str.splitlines() also splits on. The filesystem and history
+    scanners both use this, so the same content gets the same line numbers.
+    """
+    try:
+        text = data.decode("utf-8")
+        fell_back = False
+    except UnicodeDecodeError:
+        # Latin-1 decodes any bytes
+        text = data.decode("latin-1")
+        fell_back = True
+    return io.StringIO(text, newline=None).readlines(), fell_back
\ No newline at end of file
@@ -0,0 +1,341 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Set, Tuple, Callable
+
+from secrettrack.scanner.filesystem import FileSystemScanner
+
+
+class PollingWatcher:
+    """Detects file changes by comparing mtime/size snapshots of the tree."""
+    
+    def __init__(self, root: Path, scanner: FileSystemScanner, interval: float = 1.0):
+        self.root = root
+        self.scanner = scanner
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+    
+    def _take_snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        """Stat every non-excluded file under the root."""
+        snapshot = {}
+        stack = [self.root]
+        
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not self.scanner._is_excluded_dir(Path(entry.path)):
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            stat = entry.stat()
+                            snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+                    except OSError:
+                        continue
+        
+        return snapshot
+    
+    def poll(self, timeout: float) -> Tuple[Set[Path], Set[Path]]:
+        """Return (changed, removed) paths since the previous call."""
+        time.sleep(min(timeout, self.interval))
+        
+        current = self._take_snapshot()
+        changed = {
+            path for path, state in current.items()
+            if self._snapshot.get(path) != state
+        }
+        removed = set(self._snapshot) - set(current)
+        self._snapshot = current
+        
+        return changed, removed
+    
+    def consume_overflow(self) -> bool:
+        """Polling never drops events."""
+        return False
+    
+    def close(self):
+        """Release watcher resources."""
+        self._snapshot = {}
+
+
+class InotifyWatcher:
+    """Detects file changes through Linux inotify events."""
+    
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0x00000800
+    IN_CLOEXEC = 0x00080000
+    
+    WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+                  | IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+    
+    EVENT_HEADER = struct.Struct("iIII")
+    
+    def __init__(self, root: Path, scanner: FileSystemScanner):
+        self.root = root
+        self.scanner = scanner
+        self._libc = self._load_libc()
+        self._fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watches: Dict[int, Path] = {}
+        self._overflowed = False
+        self._add_tree(root)
+    
+    @staticmethod
+    def is_supported() -> bool:
+        """Check if inotify is available on this platform."""
+        if not sys.platform.startswith("linux"):
+            return False
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            return False
+        return hasattr(ctypes.CDLL(libc_name), "inotify_init1")
+    
+    @staticmethod
+    def _load_libc():
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    
+    def _add_watch(self, directory: Path):
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(str(directory)), self.WATCH_MASK
+        )
+        if wd >= 0:
+            self._watches[wd] = directory
+    
+    def _add_tree(self, directory: Path) -> Set[Path]:
+        """Watch a directory and its subdirectories, returning the files found."""
+        files = set()
+        for root, dirs, filenames in os.walk(directory):
+            root_path = Path(root)
+            dirs[:] = [d for d in dirs if not self.scanner._is_excluded_dir(root_path / d)]
+            self._add_watch(root_path)
+            files.update(root_path / name for name in filenames)
+        return files
+    
+    def poll(self, timeout: float) -> Tuple[Set[Path], Set[Path]]:
+        """Return (changed, removed) paths reported before the timeout."""
+        changed: Set[Path] = set()
+        removed: Set[Path] = set()
+        
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return changed, removed
+        
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed, removed
+        
+        offset = 0
+        while offset + self.EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            
+            if mask & self.IN_Q_OVERFLOW:
+                self._overflowed = True
+                continue
+            
+            directory = self._watches.get(wd)
+            if mask & self.IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            if directory is None or not name:
+                continue
+            
+            path = directory / os.fsdecode(name)
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    if not self.scanner._is_excluded_dir(path):
+                        changed.update(self._add_tree(path))
+                elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                    removed.add(path)
+            elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                removed.add(path)
+                changed.discard(path)
+            else:
+                changed.add(path)
+                removed.discard(path)
+        
+        return changed, removed
+    
+    def consume_overflow(self) -> bool:
+        """Check (and reset) whether the kernel dropped events."""
+        overflowed = self._overflowed
+        self._overflowed = False
+        return overflowed
+    
+    def close(self):
+        """Release watcher resources."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class WatchScanner:
+    """Keeps findings up to date by re-scanning only files that change."""
+    
+    def __init__(self, scanner: FileSystemScanner, debounce: float = 0.5,
+                 max_delay: float = 5.0, use_inotify: Optional[bool] = None,
+                 poll_interval: float = 1.0):
+        self.scanner = scanner
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.use_inotify = use_inotify
+        self.poll_interval = poll_interval
+        self.findings: Dict[Path, Dict[Tuple[str, int], Dict[str, Any]]] = {}
+        self._watcher = None
+    
+    def _create_watcher(self, root: Path):
+        use_inotify = self.use_inotify
+        if use_inotify is None:
+            use_inotify = InotifyWatcher.is_supported()
+        
+        if use_inotify:
+            try:
+                return InotifyWatcher(root, self.scanner)
+            except OSError:
+                pass
+        return PollingWatcher(root, self.scanner, interval=self.poll_interval)
+    
+    def initial_scan(self, root: Path) -> List[Dict[str, Any]]:
+        """Scan the whole tree once and seed the findings table."""
+        if self._watcher is None:
+            # Start watching first, so edits made while the scan runs are not lost
+            self._watcher = self._create_watcher(root)
+        
+        self.findings = {}
+        by_file: Dict[Path, List[Dict[str, Any]]] = {}
+        results = self.scanner.scan(root)
+        for result in results:
+            by_file.setdefault(Path(result["file"]), []).append(result)
+        for path, file_results in by_file.items():
+            self.findings[path] = self._key_findings(file_results)
+        return results
+    
+    @staticmethod
+    def _key_findings(results: List[Dict[str, Any]]) -> Dict[Tuple[str, int], Dict[str, Any]]:
+        """Key a file's findings by a line-independent identity.
+        
+        The fingerprint (type, pattern, file and secret) survives lines
+        being inserted above a finding; the occurrence count tells apart
+        the same secret repeated within the file.
+        """
+        keyed = {}
+        seen: Dict[str, int] = {}
+        for result in sorted(results, key=lambda r: r["line"]):
+            occurrence = seen.get(result["fingerprint"], 0)
+            seen[result["fingerprint"]] = occurrence + 1
+            keyed[(result["fingerprint"], occurrence)] = result
+        return keyed
+    
+    def _is_under_excluded_dir(self, root: Path, path: Path) -> bool:
+        try:
+            relative = path.relative_to(root)
+        except ValueError:
+            return False
+        parent = root
+        for part in relative.parts[:-1]:
+            parent = parent / part
+            if self.scanner._is_excluded_dir(parent):
+                return True
+        return False
+    
+    def apply_changes(self, root: Path, changed: Set[Path],
+                      removed: Set[Path]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Re-scan changed files and return (new, resolved) findings."""
+        new_findings = []
+        resolved_findings = []
+        
+        # A removed directory resolves everything that was found below it
+        for path in removed:
+            for known in list(self.findings):
+                if known == path or path in known.parents:
+                    resolved_findings.extend(self.findings.pop(known).values())
+        
+        for path in changed:
+            if self._is_under_excluded_dir(root, path):
+                continue
+            
+            previous = self.findings.pop(path, {})
+            current = {}
+            if path.is_file() and self.scanner._should_scan_file(path):
+                current = self._key_findings(self.scanner._scan_file(path))
+            
+            # Findings that only moved keep their key; the stored line is updated silently
+            if current:
+                self.findings[path] = current
+            
+            new_findings.extend(r for h, r in current.items() if h not in previous)
+            resolved_findings.extend(r for h, r in previous.items() if h not in current)
+        
+        return new_findings, resolved_findings
+    
+    def _collect_burst(self, timeout: float) -> Tuple[Set[Path], Set[Path]]:
+        """Wait for events, then keep collecting until the tree goes quiet."""
+        changed, removed = self._watcher.poll(timeout)
+        if not changed and not removed:
+            return changed, removed
+        
+        started = time.monotonic()
+        while time.monotonic() - started < self.max_delay:
+            more_changed, more_removed = self._watcher.poll(self.debounce)
+            if not more_changed and not more_removed:
+                break
+            changed -= more_removed
+            removed -= more_changed
+            changed |= more_changed
+            removed |= more_removed
+        
+        return changed, removed
+    
+    def watch(self, root: Path,
+              callback: Callable[[List[Dict[str, Any]], List[Dict[str, Any]]], None],
+              stop: Optional[Callable[[], bool]] = None):
+        """Watch the tree and report new and resolved findings to the callback."""
+        if self._watcher is None:
+            self._watcher = self._create_watcher(root)
+        try:
+            while not (stop and stop()):
+                changed, removed = self._collect_burst(self.poll_interval)
+                
+                if self._watcher.consume_overflow():
+                    # Events were dropped, fall back to a full rescan
+                    previous = {(p, k): r for p, f in self.findings.items() for k, r in f.items()}
+                    self.initial_scan(root)
+                    current = {(p, k): r for p, f in self.findings.items() for k, r in f.items()}
+                    new_findings = [r for h, r in current.items() if h not in previous]
+                    resolved_findings = [r for h, r in previous.items() if h not in current]
+                elif changed or removed:
+                    new_findings, resolved_findings = self.apply_changes(root, changed, removed)
+                else:
+                    continue
+                
+                if new_findings or resolved_findings:
+                    callback(new_findings, resolved_findings)
+        finally:
+            self._watcher.close()
+            self._watcher = None
\ No newline at end of file
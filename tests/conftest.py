@@ -0,0 +1,37 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+
+def git(cwd: Path, *args: str) -> str:
+    """Run a git command in cwd and return its output."""
+    result = subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com",
+         "-c", "init.defaultBranch=main", "-c", "commit.gpgsign=false", *args],
+        cwd=cwd, check=True, capture_output=True,
+    )
+    return result.stdout.decode("utf-8")
+
+
+@pytest.fixture
+def make_repo(tmp_path):
+    """Create a git repository from {path: content} commits."""
+    if shutil.which("git") is None:
+        pytest.skip("git is not installed")
+    
+    def make(*commits, name="repo", init_args=()):
+        repo = tmp_path / name
+        repo.mkdir()
+        git(repo, "init", "-q", *init_args)
+        for number, files in enumerate(commits, 1):
+            for path, content in files.items():
+                target = repo / path
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_text(content)
+            git(repo, "add", "-A")
+            git(repo, "commit", "-q", "-m", f"commit {number}")
+        return repo
+    
+    return make
@@ -0,0 +1,78 @@
+import json
+from pathlib import Path
+
+from secrettrack.scanner.batch import BatchScanner, read_manifest
+
+from conftest import git
+
+
+SECRET = 'password = "hunter2hunter2"\n'
+
+
+def write_progress(output_dir, *records):
+    with open(output_dir / BatchScanner.PROGRESS_FILE, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def test_resume_only_reuses_records_with_the_same_options(tmp_path):
+    scanner = BatchScanner(detector_names=["aws"], workers=1)
+    other = BatchScanner(detector_names=["aws"], workers=1, include_history=True)
+    assert scanner.settings != other.settings
+    
+    write_progress(
+        tmp_path,
+        {"repository": "/r/a", "status": "done", "settings": scanner.settings},
+        {"repository": "/r/b", "status": "done", "settings": other.settings},
+        {"repository": "/r/c", "status": "done"},
+    )
+    
+    assert set(scanner.load_progress(tmp_path)) == {"/r/a"}
+
+
+def test_latest_record_wins(tmp_path):
+    scanner = BatchScanner(detector_names=["aws"], workers=1)
+    other = BatchScanner(detector_names=["stripe"], workers=1)
+    
+    # The report on disk was overwritten by a run with other options
+    write_progress(
+        tmp_path,
+        {"repository": "/r/a", "status": "done", "settings": scanner.settings},
+        {"repository": "/r/a", "status": "done", "settings": other.settings},
+    )
+    
+    assert scanner.load_progress(tmp_path) == {}
+    assert set(other.load_progress(tmp_path)) == {"/r/a"}
+
+
+def test_manifest_comments_need_leading_whitespace(tmp_path):
+    manifest = tmp_path / "repos.txt"
+    manifest.write_text(
+        "# all repositories\n"
+        "/srv/repos/c#-tools\n"
+        "/srv/repos/api  # the API\n"
+        "   # indented comment\n"
+        "/srv/repos/api\n"
+    )
+    
+    assert read_manifest(manifest) == [Path("/srv/repos/c#-tools"), Path("/srv/repos/api")]
+
+
+def test_history_covers_every_ref_and_bare_repositories(make_repo, tmp_path):
+    repo = make_repo({"README.md": "hello\n"})
+    git(repo, "checkout", "-q", "-b", "feature")
+    (repo / "app.env").write_text(SECRET)
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", "secret on a branch")
+    git(repo, "checkout", "-q", "main")
+    git(tmp_path, "clone", "-q", "--bare", str(repo), "mirror.git")
+    repos = [repo, tmp_path / "mirror.git"]
+    
+    files_only = BatchScanner(detector_names=["generic"], workers=1).scan(repos, tmp_path / "files")
+    history = BatchScanner(detector_names=["generic"], workers=1, include_history=True).scan(
+        repos, tmp_path / "history")
+    
+    assert [(r["status"], r["total_findings"]) for r in files_only["results"]] == [("done", 0), ("error", 0)]
+    assert "bare repository" in files_only["results"][1]["error"]
+    # The secret only exists on a branch that is not checked out
+    assert [(r["status"], r["total_findings"]) for r in history["results"]] == [("done", 1), ("done", 1)]
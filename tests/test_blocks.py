@@ -0,0 +1,99 @@
+from secrettrack.detectors.blocks import BlockMatcher
+from secrettrack.detectors.firebase import FirebaseDetector
+from secrettrack.detectors.generic import GenericDetector
+from secrettrack.detectors.github import GitHubDetector
+from secrettrack.scanner.git_history import GitHistoryScanner
+
+from conftest import git
+
+
+BODY = [
+    "pEbTnKsPXgK7Xh3m4F9CiDQWC8f7dGewvT2B4JpbDVo8Fb0JY3e+Ac8xFZAnmR1N",
+    "t6hRzT4Ou+tRXpcjoMMZ6WaU1tqtxbfLBBPw0vhRCncB5OpwLV4KEmKDcOHSPRmo",
+    "c9g84Tzck/fmxz6EJdbSaqQ2wX1y==",
+]
+
+
+def pem(label, body=BODY, sep="\n"):
+    return sep.join([f"-----BEGIN {label}-----", *body, f"-----END {label}-----"])
+
+
+def feed(lines, detectors=None):
+    """Feed lines through a fresh stream; (start, end, pattern name, secret) per block."""
+    stream = BlockMatcher(detectors or [GenericDetector(), FirebaseDetector()]).stream()
+    found = []
+    for line_num, line in enumerate(lines, 1):
+        for block in stream.feed(line, line_num):
+            found.append((block.start_line, block.end_line, block.pattern_info["name"], block.secret))
+    return found
+
+
+def test_multi_line_block():
+    found = feed(["header", *pem("RSA PRIVATE KEY").split("\n"), "footer"])
+    
+    assert [(start, end, name) for start, end, name, _ in found] == [(2, 6, "private_key")]
+
+
+def test_begin_and_end_on_the_same_line():
+    one_line = feed([f'KEY = "{pem("RSA PRIVATE KEY", sep="")}"'])
+    two_blocks = feed([pem("EC PRIVATE KEY", sep="") + " " + pem("RSA PRIVATE KEY", BODY[:1], sep="")])
+    
+    assert [(start, end) for start, end, _, _ in one_line] == [(1, 1)]
+    assert [secret.split("-----")[1] for _, _, _, secret in two_blocks] == [
+        "BEGIN EC PRIVATE KEY", "BEGIN RSA PRIVATE KEY",
+    ]
+
+
+def test_escaped_newlines_hash_like_real_ones():
+    multi_line = feed(pem("PRIVATE KEY").split("\n"))
+    escaped = feed(['"key": "' + pem("PRIVATE KEY", sep="\\n") + '\\n",'])
+    
+    assert len(escaped) == 1
+    assert escaped[0][3] == multi_line[0][3]
+
+
+def test_private_key_field_is_claimed_by_its_context():
+    json_line = '  "private_key": "' + pem("PRIVATE KEY", sep="\\n") + '",'
+    
+    for detectors in ([GenericDetector(), FirebaseDetector()], [FirebaseDetector(), GenericDetector()]):
+        assert [name for _, _, name, _ in feed([json_line], detectors)] == ["firebase_service_account"]
+    assert [name for _, _, name, _ in feed(pem("PRIVATE KEY").split("\n"))] == ["private_key"]
+    # Without a generic detector, a PRIVATE KEY outside the field is nobody's
+    assert feed(pem("PRIVATE KEY").split("\n"), [FirebaseDetector()]) == []
+
+
+def test_github_claims_ssh_keys_only_without_generic():
+    lines = pem("OPENSSH PRIVATE KEY").split("\n")
+    
+    assert [name for _, _, name, _ in feed(lines, [GitHubDetector()])] == ["github_ssh_private_key"]
+    for detectors in ([GitHubDetector(), GenericDetector()], [GenericDetector(), GitHubDetector()]):
+        assert [name for _, _, name, _ in feed(lines, detectors)] == ["private_key"]
+    assert feed(pem("PRIVATE KEY").split("\n"), [GitHubDetector()]) == []
+
+
+def test_placeholders_and_mismatched_labels_are_not_blocks():
+    assert feed(pem("RSA PRIVATE KEY", ["..."]).split("\n")) == []
+    assert feed(pem("RSA PRIVATE KEY").split("\n")[:-1] + ["-----END EC PRIVATE KEY-----"]) == []
+    assert feed(pem("CERTIFICATE").split("\n")) == []
+
+
+def block_findings(repo):
+    commits = git(repo, "log", "--format=%H", "--reverse").split()
+    results = GitHistoryScanner(detector_names=["generic"], backend="git").scan(repo)
+    return [(commits.index(r["commit_hash"]) + 1, r["line"], r.get("end_line"))
+            for r in results if r["subtype"] == "private_key"]
+
+
+def test_history_reports_only_blocks_added_as_a_whole(make_repo):
+    key = pem("RSA PRIVATE KEY") + "\n"
+    split = "\n".join([key.split("\n")[0], BODY[0], "middle", *key.split("\n")[2:]])
+    repo = make_repo(
+        {"deploy.key": key},
+        # A one-line change inside the block
+        {"deploy.key": key.replace(BODY[1], BODY[1][::-1])},
+        # BEGIN and END added around an existing line
+        {"deploy.key": key, "split.key": "middle\n"},
+        {"split.key": split},
+    )
+    
+    assert block_findings(repo) == [(1, 1, 5)]
\ No newline at end of file
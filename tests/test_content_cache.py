@@ -0,0 +1,48 @@
+from secrettrack.scanner.filesystem import FileSystemScanner
+
+
+SECRET_LINE = 'password = "hunter2hunter2"\n'
+
+
+def make_copies(root):
+    for name in ("prod/app.env", "dev/app.env", "vendor/lib/app.env"):
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).write_text("# settings\n" + SECRET_LINE)
+
+
+def test_identical_files_are_matched_once_and_scored_per_path(tmp_path):
+    make_copies(tmp_path)
+    scanner = FileSystemScanner()
+    
+    results = scanner.scan(tmp_path)
+    by_file = {r["file"]: r for r in results}
+    
+    assert sorted(by_file) == sorted(str(tmp_path / name) for name in
+                                     ("prod/app.env", "dev/app.env", "vendor/lib/app.env"))
+    assert by_file[str(tmp_path / "prod/app.env")]["environment"] == "production"
+    assert by_file[str(tmp_path / "dev/app.env")]["environment"] == "staging"
+    assert len({r["fingerprint"] for r in results}) == 3
+    assert all(r["line"] == 2 for r in results)
+    assert scanner.stats.duplicate_files == 2
+    assert scanner.content_cache.stats()["hits"] == 2
+
+
+def test_content_cache_zero_disables_it(tmp_path):
+    make_copies(tmp_path)
+    scanner = FileSystemScanner(content_cache_size=0)
+    
+    results = scanner.scan(tmp_path)
+    
+    assert len(results) == 3
+    assert scanner.stats.duplicate_files == 0
+    assert scanner.content_cache.stats()["entries"] == 0
+    assert scanner.content_cache.stats()["hits"] == 0
+
+
+def test_cached_results_match_an_uncached_scan(tmp_path):
+    make_copies(tmp_path)
+    
+    cached = FileSystemScanner().scan(tmp_path)
+    uncached = FileSystemScanner(content_cache_size=0).scan(tmp_path)
+    
+    assert cached == uncached
\ No newline at end of file
@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import pytest
+
+from secrettrack.detectors.engine import RE2Engine, StdlibEngine, set_regex_engine
+from secrettrack.scanner.filesystem import FileSystemScanner
+
+
+pytest.importorskip("re2")
+
+CORPUS = Path(__file__).parent / "corpus"
+
+# ASCII and Unicode whitespace, letters and digits, plus characters outside each class
+SAMPLE_CHARS = " \t\v\x1c\x85\xa0\u2003\u2028\u3000aZ_\xe9\u4e2d\xdf\u0663\u09670-\"'}:="
+
+
+def scan_corpus(engine):
+    set_regex_engine(engine)
+    try:
+        results = FileSystemScanner().scan(CORPUS)
+    finally:
+        set_regex_engine("re")
+    return {(Path(r["file"]).name, r["line"], r["type"], r["subtype"], r["secret"]) for r in results}
+
+
+def test_engines_report_the_same_corpus_findings():
+    findings = scan_corpus("re")
+    
+    assert scan_corpus("re2") == findings
+    assert {(name, line) for name, line, *_ in findings} >= {
+        ("deploy.key", 1),
+        ("service-account.json", 4),
+        ("firebase.js", 2),
+        ("settings.conf", 2),
+        ("settings.conf", 3),
+        ("settings.conf", 4),
+    }
+    assert not any(name == "firebase.js" and line == 3 for name, line, *_ in findings)
+
+
+@pytest.mark.parametrize("pattern", [
+    r"\s", r"\S", r"\w", r"\W", r"\d", r"\D", r"[\s:=]", r"[^\s\"']", r"[\w-]", r"[]\d]",
+])
+def test_character_classes_match_like_re(pattern):
+    expected = StdlibEngine().compile(pattern)
+    compiled = RE2Engine().compile(pattern)
+    
+    for char in SAMPLE_CHARS:
+        assert bool(compiled.fullmatch(char)) == bool(expected.fullmatch(char)), repr(char)
+
+
+@pytest.mark.parametrize("pattern", [r"\btoken\b", r"[\S]+"])
+def test_unconvertible_classes_are_rejected(pattern):
+    with pytest.raises(ValueError):
+        RE2Engine().compile(pattern)
\ No newline at end of file
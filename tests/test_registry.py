@@ -0,0 +1,86 @@
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from secrettrack.detectors.base import BaseDetector
+from secrettrack.detectors.registry import ENTRY_POINT_GROUP, DetectorRegistry
+
+
+class PluginDetector(BaseDetector):
+    def _get_patterns(self):
+        return []
+    
+    def get_secret_type(self):
+        return "plugin"
+    
+    def _get_risk_description(self):
+        return "Plugin risk"
+    
+    def _get_recommendation(self):
+        return "Rotate it"
+
+
+class NotADetector:
+    pass
+
+
+@pytest.fixture
+def plugins(monkeypatch):
+    """Register fake entry points and count how often they are looked up."""
+    lookups = []
+    
+    def entry_points(group=None):
+        lookups.append(group)
+        return [
+            EntryPoint("plugin", "test_registry:PluginDetector [extra]", ENTRY_POINT_GROUP),
+            EntryPoint("broken", "test_registry:NotADetector", ENTRY_POINT_GROUP),
+            EntryPoint("aws", "elsewhere:OtherAWS", ENTRY_POINT_GROUP),
+        ] if group == ENTRY_POINT_GROUP else []
+    
+    monkeypatch.setattr("importlib.metadata.entry_points", entry_points)
+    return lookups
+
+
+def test_entry_point_detectors_are_discovered(plugins):
+    registry = DetectorRegistry()
+    
+    assert {"plugin", "broken", "aws", "generic"} <= set(registry.names())
+    assert [type(d).__name__ for d in registry.load(["plugin", "aws"])] == [
+        "PluginDetector", "AWSDetector",  # Built-ins keep their in-tree class
+    ]
+
+
+def test_built_in_selection_skips_discovery(plugins):
+    registry = DetectorRegistry()
+    
+    registry.load(["aws", "stripe"])
+    
+    assert plugins == []
+
+
+def test_unknown_detector_lists_the_available_ones(plugins):
+    with pytest.raises(ValueError, match=r"Unknown detector\(s\): nope\. Available: .*plugin"):
+        DetectorRegistry().load(["aws", "nope"])
+    assert plugins == [ENTRY_POINT_GROUP]
+
+
+def test_plugin_must_be_a_detector(plugins):
+    with pytest.raises(ValueError, match="'broken' is not a BaseDetector subclass"):
+        DetectorRegistry().load(["broken"])
+
+
+def test_selected_detectors_are_imported_lazily():
+    code = (
+        "import sys\n"
+        "from secrettrack.detectors.registry import load_detectors\n"
+        "load_detectors(['aws'])\n"
+        "print([d for d in ('aws', 'github', 'stripe') if 'secrettrack.detectors.' + d in sys.modules])\n"
+        "print('importlib.metadata' in sys.modules)\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            check=True).stdout.split("\n")
+    
+    assert output[0] == "['aws']"
+    assert output[1] == "False"
\ No newline at end of file
@@ -0,0 +1,28 @@
+from secrettrack.detectors.rules import load_rule_pack
+
+
+PACK = """rules:
+  - name: acme-token
+    regex: 'acme_[a-z0-9]{24}'
+"""
+
+
+def test_cached_pack_is_renamed_with_its_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("SECRETTRACK_CACHE_DIR", str(tmp_path / "cache"))
+    (tmp_path / "acme.yml").write_text(PACK)
+    assert load_rule_pack(tmp_path / "acme.yml")["name"] == "acme"
+    
+    (tmp_path / "acme.yml").rename(tmp_path / "payments.yml")
+    pack = load_rule_pack(tmp_path / "payments.yml")
+    
+    assert pack["name"] == "payments"
+    assert pack["type"] == "payments"
+
+
+def test_unchanged_pack_is_loaded_from_the_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("SECRETTRACK_CACHE_DIR", str(tmp_path / "cache"))
+    (tmp_path / "acme.yml").write_text(PACK)
+    first = load_rule_pack(tmp_path / "acme.yml")
+    
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+    assert load_rule_pack(tmp_path / "acme.yml") == first
\ No newline at end of file
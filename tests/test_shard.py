@@ -0,0 +1,94 @@
+import json
+import random
+import subprocess
+import sys
+
+import pytest
+
+from secrettrack.report.json import JSONReport
+from secrettrack.scanner.shard import Shard
+
+
+def make_files(root, sizes):
+    files = []
+    for i, size in enumerate(sizes):
+        path = root / f"dir{i % 3}" / f"file{i}.txt"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text("x" * size)
+        files.append(path)
+    return files
+
+
+def test_select_files_is_deterministic_and_partitions(tmp_path):
+    files = make_files(tmp_path, [random.Random(i).randint(1, 5000) for i in range(40)])
+    shuffled = files[:]
+    random.Random(7).shuffle(shuffled)
+    
+    selections = [Shard(i, 3).select_files(tmp_path, files) for i in (1, 2, 3)]
+    
+    assert [Shard(i, 3).select_files(tmp_path, shuffled) for i in (1, 2, 3)] == selections
+    assert sorted(f for selection in selections for f in selection) == sorted(files)
+
+
+def test_select_files_balances_bytes(tmp_path):
+    sizes = [9000, 5000, 4000, 3000, 3000, 2000, 1000, 1000, 500, 500]
+    files = make_files(tmp_path, sizes)
+    
+    loads = [sum(f.stat().st_size for f in Shard(i, 3).select_files(tmp_path, files))
+             for i in (1, 2, 3)]
+    
+    assert sum(loads) == sum(sizes)
+    assert max(loads) - min(loads) <= max(sizes)
+
+
+def report(shard=None, findings=(), complete=True):
+    metadata = {"scan_complete": complete}
+    if shard:
+        metadata["shard"] = shard
+    return {"metadata": metadata, "findings": [{"hash": h, "severity": "low"} for h in findings]}
+
+
+def test_merge_deduplicates_and_flags_missing_shards():
+    merged = json.loads(JSONReport.merge([
+        report("1/3", ["a", "b"]), report("3/3", ["b", "c"]),
+    ]))
+    
+    assert [f["hash"] for f in merged["findings"]] == ["a", "b", "c"]
+    assert merged["metadata"]["missing_shards"] == [2]
+    assert merged["metadata"]["scan_complete"] is False
+
+
+def test_merge_of_every_shard_is_complete():
+    merged = json.loads(JSONReport.merge([report("2/2", ["a"]), report("1/2", ["a"])]))
+    
+    assert merged["metadata"]["missing_shards"] == []
+    assert merged["metadata"]["scan_complete"] is True
+
+
+@pytest.mark.parametrize("reports, message", [
+    ([report("1/3"), report("2/4")], "other reports have 3 shards"),
+    ([report("1/2"), report("two/2")], "Invalid shard 'two/2'"),
+    ([report("3/2")], "Invalid shard 3/2"),
+    ([report("1/2"), report()], "has no shard"),
+    ([report(), report("1/2")], "has no shard"),
+    ([[]], "is not a secrettrack JSON report"),
+])
+def test_merge_rejects_inconsistent_reports(reports, message):
+    with pytest.raises(ValueError, match=message):
+        JSONReport.merge(reports)
+
+
+def test_merge_command_reports_errors_cleanly(tmp_path):
+    for name, shard in (("a.json", "1/3"), ("b.json", "2/4")):
+        (tmp_path / name).write_text(json.dumps(report(shard)))
+    
+    result = subprocess.run(
+        [sys.executable, "-m", "secrettrack.cli", "merge",
+         str(tmp_path / "a.json"), str(tmp_path / "b.json")],
+        capture_output=True, text=True,
+    )
+    
+    assert result.returncode == 1
+    assert result.stdout.startswith("Error: ")
+    assert "b.json is shard 2/4" in result.stdout
+    assert "Traceback" not in result.stderr
\ No newline at end of file
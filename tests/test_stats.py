@@ -0,0 +1,121 @@
+from secrettrack.scanner.filesystem import FileSystemScanner
+from secrettrack.scanner.stats import ScanStats
+
+
+LINE_CACHE = {"max_entries": 10, "entries": 4, "hits": 6, "misses": 4, "evictions": 0, "hit_rate": 0.6}
+CONTENT_CACHE = {"max_entries": 10, "entries": 2, "hits": 1, "misses": 2, "evictions": 0, "hit_rate": 0.3333}
+
+EXPECTED_PROMETHEUS = """\
+# HELP secrettrack_scan_duration_seconds Wall-clock duration of the scan.
+# TYPE secrettrack_scan_duration_seconds gauge
+secrettrack_scan_duration_seconds 2.0
+# HELP secrettrack_files_walked_total Files considered for scanning.
+# TYPE secrettrack_files_walked_total counter
+secrettrack_files_walked_total 5
+# HELP secrettrack_files_scanned_total Files read and matched.
+# TYPE secrettrack_files_scanned_total counter
+secrettrack_files_scanned_total 3
+# HELP secrettrack_files_skipped_total Files or blobs skipped, by reason.
+# TYPE secrettrack_files_skipped_total counter
+secrettrack_files_skipped_total{reason="extension"} 1
+secrettrack_files_skipped_total{reason="size"} 1
+# HELP secrettrack_decode_fallbacks_total Files decoded as Latin-1 after UTF-8 failed.
+# TYPE secrettrack_decode_fallbacks_total counter
+secrettrack_decode_fallbacks_total 1
+# HELP secrettrack_bytes_scanned_total Bytes of content scanned.
+# TYPE secrettrack_bytes_scanned_total counter
+secrettrack_bytes_scanned_total 4000
+# HELP secrettrack_lines_scanned_total Lines of content scanned.
+# TYPE secrettrack_lines_scanned_total counter
+secrettrack_lines_scanned_total 100
+# HELP secrettrack_duplicate_files_total Files whose content matched an already scanned file.
+# TYPE secrettrack_duplicate_files_total counter
+secrettrack_duplicate_files_total 1
+# HELP secrettrack_findings_total Findings reported, by severity.
+# TYPE secrettrack_findings_total counter
+secrettrack_findings_total{severity="critical"} 0
+secrettrack_findings_total{severity="high"} 2
+secrettrack_findings_total{severity="medium"} 0
+secrettrack_findings_total{severity="low"} 1
+# HELP secrettrack_suppressed_total Findings suppressed by the baseline, or lines by an inline ignore marker.
+# TYPE secrettrack_suppressed_total counter
+secrettrack_suppressed_total{reason="baseline"} 2
+# HELP secrettrack_stage_seconds Time spent in each scan stage.
+# TYPE secrettrack_stage_seconds gauge
+secrettrack_stage_seconds{stage="walk"} 0.0
+secrettrack_stage_seconds{stage="read"} 0.5
+secrettrack_stage_seconds{stage="match"} 1.0
+# HELP secrettrack_stage_throughput_bytes_per_second Bytes scanned per second of stage time.
+# TYPE secrettrack_stage_throughput_bytes_per_second gauge
+secrettrack_stage_throughput_bytes_per_second{stage="read"} 8000.0
+secrettrack_stage_throughput_bytes_per_second{stage="match"} 4000.0
+# HELP secrettrack_line_cache_hits_total Line cache hits.
+# TYPE secrettrack_line_cache_hits_total counter
+secrettrack_line_cache_hits_total 6
+# HELP secrettrack_line_cache_misses_total Line cache misses.
+# TYPE secrettrack_line_cache_misses_total counter
+secrettrack_line_cache_misses_total 4
+# HELP secrettrack_line_cache_evictions_total Line cache evictions.
+# TYPE secrettrack_line_cache_evictions_total counter
+secrettrack_line_cache_evictions_total 0
+# HELP secrettrack_content_cache_hits_total Content cache hits.
+# TYPE secrettrack_content_cache_hits_total counter
+secrettrack_content_cache_hits_total 1
+# HELP secrettrack_content_cache_misses_total Content cache misses.
+# TYPE secrettrack_content_cache_misses_total counter
+secrettrack_content_cache_misses_total 2
+# HELP secrettrack_content_cache_evictions_total Content cache evictions.
+# TYPE secrettrack_content_cache_evictions_total counter
+secrettrack_content_cache_evictions_total 0
+"""
+
+
+def sample_stats():
+    stats = ScanStats()
+    stats.add(files_walked=5, files_scanned=3, bytes_scanned=4000, lines_scanned=100,
+              decode_fallbacks=1, duplicate_files=1)
+    stats.skip("size")
+    stats.skip("extension")
+    stats.suppress("baseline", 2)
+    stats.record_findings([{"severity": "high"}, {"severity": "low"}, {"severity": "high"}])
+    stats.duration = 2.0
+    stats.add_stage_time("read", 0.5)
+    stats.add_stage_time("match", 1.0)
+    stats.line_cache = dict(LINE_CACHE)
+    stats.content_cache = dict(CONTENT_CACHE)
+    return stats
+
+
+def test_json_stats():
+    assert sample_stats().to_dict() == {
+        "duration_seconds": 2.0,
+        "files_walked": 5,
+        "files_scanned": 3,
+        "files_skipped": {"extension": 1, "size": 1},
+        "decode_fallbacks": 1,
+        "bytes_scanned": 4000,
+        "lines_scanned": 100,
+        "duplicate_files": 1,
+        "findings": {"high": 2, "low": 1},
+        "suppressed": {"baseline": 2},
+        "stage_seconds": {"walk": 0.0, "read": 0.5, "match": 1.0},
+        "stage_throughput_bytes_per_second": {"walk": None, "read": 8000, "match": 4000},
+        "throughput_bytes_per_second": 2000,
+        "line_cache": LINE_CACHE,
+        "content_cache": CONTENT_CACHE,
+    }
+
+
+def test_prometheus_stats():
+    assert sample_stats().to_prometheus() == EXPECTED_PROMETHEUS
+
+
+def test_undecodable_files_are_scanned_as_latin1(tmp_path):
+    (tmp_path / "legacy.env").write_bytes(b'password = "caf\xe9-hunter2"\n')
+    scanner = FileSystemScanner()
+    
+    results = scanner.scan(tmp_path)
+    
+    assert [r["subtype"] for r in results] == ["password_in_code"]
+    assert scanner.stats.decode_fallbacks == 1
+    assert scanner.stats.files_skipped == {}
\ No newline at end of file
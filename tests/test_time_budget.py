@@ -0,0 +1,56 @@
+import time
+from pathlib import Path
+
+from secrettrack.scanner.filesystem import FileSystemScanner
+from secrettrack.scanner.limits import ScanLimits
+from secrettrack.scanner.priority import RiskScheduler
+
+
+def test_schedule_stops_listing_when_enumeration_share_is_spent(tmp_path):
+    for i in range(200):
+        (tmp_path / f"f{i}.py").write_text("x = 1\n")
+    limits = ScanLimits(time_budget=0.2)
+    limits.start_clock()
+    
+    def slow_listing():
+        for path in sorted(tmp_path.iterdir()):
+            time.sleep(0.005)
+            yield path
+    
+    scheduler = RiskScheduler()
+    scheduled = scheduler.schedule(slow_listing(), tmp_path, limits)
+    
+    assert not scheduler.enumeration_complete
+    assert 0 < len(scheduled) < 200
+    assert scheduler.coverage(set())["enumeration_complete"] is False
+
+
+def test_riskiest_files_come_first(tmp_path):
+    for name in ("docs/guide.md", "src/app.py", ".env"):
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text("x = 1\n")
+    
+    scheduled = RiskScheduler().schedule(sorted(tmp_path.rglob("*.*")), tmp_path)
+    
+    assert [p.relative_to(tmp_path).as_posix() for p in scheduled] == [
+        ".env", "src/app.py", "docs/guide.md",
+    ]
+
+
+def test_spent_budget_stops_before_reading_the_next_file(tmp_path, monkeypatch):
+    for i in range(3):
+        (tmp_path / f"f{i}.py").write_text("x = 1\n")
+    limits = ScanLimits(time_budget=60)
+    scanner = FileSystemScanner(limits=limits)
+    read = []
+    
+    def read_and_expire(filepath: Path):
+        read.append(filepath)
+        limits.deadline = time.monotonic() - 1
+        return ["x = 1\n"], None
+    
+    monkeypatch.setattr(scanner, "_read_file_content", read_and_expire)
+    scanner.scan(tmp_path)
+    
+    assert len(read) == 1
+    assert limits.stop_reason.startswith("time-budget")